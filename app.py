@@ -1,9 +1,13 @@
 import streamlit as st
 import pandas as pd
-import numpy as np
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import datetime
+
+from quant_core.backtest import run_backtests
+from quant_core.compact import COMPACT_MODE, compact_frame
+from quant_core.downsample import DEFAULT_WIDTH, trace_data
+from quant_core.figure_cache import FIGURES
+from quant_core.scanner import FILES, data_version, load_master, run_quant_analysis
+from quant_core.sections import deferred_tabs, render_deferred
+from quant_core.strategy import SIGNAL_ASSETS
 
 # ==========================================
 # 1. CONFIGURATION & STYLE
@@ -42,126 +46,150 @@ st.markdown("""
 # ==========================================
 # 2. DATA LOADER ENGINE
 # ==========================================
-@st.cache_data
+# Sources, merging and indicators live in quant_core.scanner; this script only
+# caches the results per data version and reports load errors
 def load_and_process_data():
-    # --- A. Define File Paths ---
-    files = {
-        'Global_Gold': 'gold_data.csv',
-        'Global_SP500': 'sp500_data.csv',
-        'Global_US10Y': 'us10y_data.csv',
-        'Domestic_Nifty_Price': 'Nifty50_Historical_Yahoo.csv',
-        'Domestic_Midcap_Price': 'NIFTY_MIDCAP_100_Historical_Yahoo.csv',
-        'Domestic_VIX': 'India_VIX_Yahoo.csv',
-        'Domestic_Bond': 'Nifty_10Y_Benchmark_GSec_Merged.csv',
-        'Val_Nifty': 'Nifty50_PE_PB_Div_Merged.csv',
-        'Val_Midcap': 'NiftyMidcap100_PE_PB_Div_Merged.csv',
-        'Val_Smallcap': 'NiftySmallcap250_PE_PB_Div_Merged.csv'
-    }
+    master, errors = load_master()
+    for key, e in errors.items():
+        st.error(f"Error loading {FILES[key]}: {e}")
+    return master
 
-    # --- B. Helper: Clean & Standardize ---
-    def load_csv(path, date_col='Date', val_col=None, rename_to=None):
-        try:
-            df = pd.read_csv(path)
-            # Handle different date formats (Investing.com vs Yahoo)
-            try:
-                df[date_col] = pd.to_datetime(df[date_col], format='%d-%m-%Y') # Try India format first
-            except:
-                df[date_col] = pd.to_datetime(df[date_col]) # Auto-detect (usually YYYY-MM-DD)
-            
-            df = df.set_index(date_col)
-            
-            if val_col and rename_to:
-                # If column name differs (e.g., 'Price' vs 'Close')
-                if val_col not in df.columns and 'Price' in df.columns: val_col = 'Price'
-                if val_col not in df.columns and 'Close' in df.columns: val_col = 'Close'
-                
-                df = df[[val_col]].rename(columns={val_col: rename_to})
-                # Clean numeric data (remove % symbols if any)
-                if df[rename_to].dtype == 'O':
-                    df[rename_to] = df[rename_to].astype(str).str.replace('%', '').str.replace(',', '').astype(float)
-            return df
-        except Exception as e:
-            st.error(f"Error loading {path}: {e}")
-            return pd.DataFrame()
+# ==========================================
+# 3. ANALYSIS ALGORITHMS
+# ==========================================
+@st.cache_resource(max_entries=2)
+def load_analysis(version):
+    """
+    Master history plus lazily computed indicators for one ``version`` of
+    the source files, built once and then shared by every session and rerun
+    without copying. Callers must treat it as read-only.
+    Returns (df, memory report or None).
+    """
+    df = run_quant_analysis(load_and_process_data())
+    if COMPACT_MODE:
+        # Opt-in: float32 numerics and categorical labels (materializes every indicator)
+        return compact_frame(df.frame())
+    return df, None
 
-    # --- C. Load All Datasets ---
-    # Global
-    gold = load_csv(files['Global_Gold'], val_col='Gold', rename_to='Gold_Price')
-    sp500 = load_csv(files['Global_SP500'], val_col='SP500', rename_to='SP500_Price')
-    us10y = load_csv(files['Global_US10Y'], val_col='US10Y_Yield', rename_to='US10Y')
-    
-    # Domestic Prices
-    nifty = load_csv(files['Domestic_Nifty_Price'], val_col='Close', rename_to='Nifty_Price')
-    midcap = load_csv(files['Domestic_Midcap_Price'], val_col='Close', rename_to='Midcap_Price')
-    vix = load_csv(files['Domestic_VIX'], val_col='VIX_Close', rename_to='VIX')
-    bond = load_csv(files['Domestic_Bond'], val_col='Price', rename_to='India_10Y')
-    
-    # Domestic Valuations (Need PE)
-    nifty_pe = load_csv(files['Val_Nifty'], val_col='PE', rename_to='Nifty_PE')
-    mid_pe = load_csv(files['Val_Midcap'], val_col='PE', rename_to='Midcap_PE')
-    small_pe = load_csv(files['Val_Smallcap'], val_col='PE', rename_to='Smallcap_PE')
+@st.cache_resource(max_entries=2)
+def load_backtest(version):
+    """
+    Strategy and Nifty buy & hold run as two columns of one batched
+    backtest (signal executes on the next day's close), once per data
+    ``version``. Returns (equity, stats); callers must treat both as read-only.
+    """
+    df, _ = load_analysis(version)
+    variants = pd.DataFrame({'Quant Strategy': df['Signal'], 'Nifty 50 Buy & Hold': "🏢 NIFTY 50"}, index=df.index)
+    equity, _, stats = run_backtests(variants, df, SIGNAL_ASSETS, lag=1)
+    return equity, stats
 
-    # --- D. Merge into Master Dataframe ---
-    dfs = [nifty, midcap, gold, sp500, us10y, vix, bond, nifty_pe, mid_pe, small_pe]
-    master = dfs[0]
-    for df in dfs[1:]:
-        master = master.join(df, how='outer')
-    
-    master = master.sort_index().ffill().dropna()
-    return master
+# ==========================================
+# 4. CHARTS
+# ==========================================
+# Long daily traces are downsampled to the chart's pixel budget before they
+# are sent to the browser (equity curves keep every bucket's high and low).
+# The UI fetches each figure through FIGURES, so it is only rebuilt when the
+# data version changes; Plotly itself is imported by the builders on first use
+HALF_WIDTH = DEFAULT_WIDTH // 2
+
+def chart_yield_gap(df):
+    import plotly.graph_objects as go
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(**trace_data(df.index, df['Yield_Gap']), fill='tozeroy', name='Earnings Yield Gap', line=dict(color='#00CC96')))
+    fig.add_hline(y=0, line_dash="dash", line_color="red")
+    fig.update_layout(title="Equity vs Bond Yield Gap (The 'Fed Model')", height=350, template="plotly_dark")
+    return fig
+
+def chart_spreads(df):
+    import plotly.graph_objects as go
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(**trace_data(df.index, df['Mid_Z']), name='Midcap Premium (Z)', line=dict(color='cyan')))
+    fig.add_trace(go.Scatter(**trace_data(df.index, df['Small_Z']), name='Smallcap Premium (Z)', line=dict(color='magenta')))
+    fig.add_hline(y=1.5, line_dash="dash", line_color="red", annotation_text="Expensive")
+    fig.add_hline(y=-1.5, line_dash="dash", line_color="#00FF00", annotation_text="Buy Zone")
+    fig.update_layout(title="Mid & Small Cap Relative Valuations (Z-Scores)", height=350, template="plotly_dark")
+    return fig
+
+def chart_us10y(df):
+    import plotly.graph_objects as go
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(**trace_data(df.index, df['US10Y'], HALF_WIDTH), name='US 10Y Yield', line=dict(color='yellow')))
+    fig.update_layout(title="Global Cost of Capital (US 10Y Yield)", height=300, template="plotly_dark")
+    return fig
+
+def chart_risk(df):
+    import plotly.graph_objects as go
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(**trace_data(df.index, df['Gold_Nifty'], HALF_WIDTH), name='Gold/Nifty Ratio', line=dict(color='gold')))
+    fig.add_trace(go.Scatter(**trace_data(df.index, df['Risk_MA'], HALF_WIDTH), name='Regime Trend', line=dict(color='white', dash='dot')))
+    fig.update_layout(title="Risk-Off Detector (Gold Outperformance)", height=300, template="plotly_dark")
+    return fig
+
+def chart_performance(equity):
+    import plotly.graph_objects as go
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(**trace_data(equity.index, equity['Quant Strategy'], method='minmax'), name='Quant Strategy', line=dict(color='#00FF00', width=2)))
+    fig.add_trace(go.Scatter(**trace_data(equity.index, equity['Nifty 50 Buy & Hold'], method='minmax'), name='Nifty 50 Buy & Hold', line=dict(color='gray', dash='dash')))
+    fig.update_layout(title="Strategy vs Benchmark", height=400, template="plotly_dark")
+    return fig
 
 # ==========================================
-# 3. ANALYSIS ALGORITHMS
+# 5. TAB SECTIONS
 # ==========================================
-def run_quant_analysis(df):
-    # 1. Yield Gap (Fed Model)
-    # Nifty Earnings Yield = 100 / PE
-    # Gap = EY - Bond Yield. Negative = Stocks Expensive.
-    df['Earnings_Yield'] = 100 / df['Nifty_PE']
-    df['Yield_Gap'] = df['Earnings_Yield'] - df['India_10Y']
+# Each tab body is a function of (df, version) so that render_deferred runs
+# only the selected one
+def valuation_radar(df, version):
+    st.subheader("Domestic Valuation Spreads")
+    
+    # Plot 1: Yield Gap
+    st.plotly_chart(FIGURES.get('scanner/yield_gap', version, lambda: chart_yield_gap(df)), use_container_width=True)
     
-    # 2. Valuation Spreads (Z-Scores)
-    # Rolling 2-Year Mean/Std to normalize "Cheapness"
-    window = 252 * 2
+    # Plot 2: Mid/Small Cap Z-Scores
+    st.plotly_chart(FIGURES.get('scanner/spreads', version, lambda: chart_spreads(df)), use_container_width=True)
+
+def global_macro(df, version):
+    st.subheader("Global Liquidity & Risk")
+    c_a, c_b = st.columns(2)
     
-    # Midcap
-    df['Mid_Nifty_Ratio'] = df['Midcap_PE'] / df['Nifty_PE']
-    df['Mid_Z'] = (df['Mid_Nifty_Ratio'] - df['Mid_Nifty_Ratio'].rolling(window).mean()) / df['Mid_Nifty_Ratio'].rolling(window).std()
+    with c_a:
+        # Plot 3: US 10Y Yield
+        st.plotly_chart(FIGURES.get('scanner/us10y', version, lambda: chart_us10y(df)), use_container_width=True)
+        
+    with c_b:
+        # Plot 4: Gold/Nifty Ratio
+        st.plotly_chart(FIGURES.get('scanner/risk', version, lambda: chart_risk(df)), use_container_width=True)
+
+def backtest_performance(df, version):
+    st.subheader("Strategy Backtest (Switching Logic)")
     
-    # Smallcap
-    df['Small_Nifty_Ratio'] = df['Smallcap_PE'] / df['Nifty_PE']
-    df['Small_Z'] = (df['Small_Nifty_Ratio'] - df['Small_Nifty_Ratio'].rolling(window).mean()) / df['Small_Nifty_Ratio'].rolling(window).std()
+    # Memoized per data version, so returning to this tab is instant
+    equity, stats = load_backtest(version)
+    strat, bench = stats.loc['Quant Strategy'], stats.loc['Nifty 50 Buy & Hold']
     
-    # 3. Global Risk Regime
-    # Gold/Nifty Ratio Trend
-    df['Gold_Nifty'] = df['Gold_Price'] / df['Nifty_Price']
-    df['Risk_MA'] = df['Gold_Nifty'].rolling(200).mean()
-    df['Regime'] = np.where(df['Gold_Nifty'] > df['Risk_MA'], "RISK OFF", "RISK ON")
+    m1, m2, m3 = st.columns(3)
+    m1.metric("CAGR", f"{strat['CAGR']:.1%}", f"{strat['CAGR'] - bench['CAGR']:+.1%} vs Nifty")
+    m2.metric("Sharpe", f"{strat['Sharpe']:.2f}", f"{strat['Sharpe'] - bench['Sharpe']:+.2f} vs Nifty")
+    m3.metric("Max Drawdown", f"{strat['Max_Drawdown']:.1%}", f"{strat['Max_Drawdown'] - bench['Max_Drawdown']:+.1%} vs Nifty")
     
-    # 4. Master Signal Logic
-    # IF Risk Off OR VIX > 22 -> GOLD/CASH
-    # IF Risk On AND Midcap Cheap (Z < -1) -> MIDCAP
-    # ELSE -> NIFTY
-    conditions = [
-        (df['Regime'] == "RISK OFF") | (df['VIX'] > 22),
-        (df['Regime'] == "RISK ON") & (df['Mid_Z'] < -1.0)
-    ]
-    choices = ["🛡️ GOLD / CASH", "🚀 MIDCAPS"]
-    df['Signal'] = np.select(conditions, choices, default="🏢 NIFTY 50")
+    # Plot Performance
+    st.plotly_chart(FIGURES.get('scanner/performance', version, lambda: chart_performance(equity)), use_container_width=True)
     
-    return df
+    st.markdown("#### Recent Signals")
+    st.dataframe(df[['Signal', 'Yield_Gap', 'Mid_Z', 'Regime']].tail(10).sort_index(ascending=False))
 
 # ==========================================
-# 4. DASHBOARD UI
+# 6. DASHBOARD UI
 # ==========================================
+
 st.title("🇮🇳 Institutional Market Scanner")
 st.markdown("Global Macro Inputs + Domestic Valuation Spreads")
 
 # Load & Analyze
 try:
-    data = load_and_process_data()
-    df = run_quant_analysis(data)
-    latest = df.iloc[-1]
+    # Keyed on the source files' sizes and mtimes, so edited CSVs are picked up
+    version = data_version()
+    df, memory_report = load_analysis(version)
+    latest = df[['Signal', 'Regime', 'VIX', 'Yield_Gap', 'Mid_Z']].iloc[-1]
     
     # --- HEADER: MASTER SIGNAL ---
     st.divider()
@@ -188,75 +216,17 @@ try:
     st.divider()
 
     # --- TABS FOR DETAILED ANALYSIS ---
-    tab1, tab2, tab3 = st.tabs(["📊 Valuation Radar", "🌍 Global Macro", "📈 Backtest Performance"])
+    # Only the selected tab is computed and sent; switching tabs reruns the script
+    # (older Streamlit releases fall back to rendering every tab)
+    tabs = deferred_tabs(st.tabs, ["📊 Valuation Radar", "🌍 Global Macro", "📈 Backtest Performance"],
+                         key="scanner_tab")
     
-    with tab1:
-        st.subheader("Domestic Valuation Spreads")
-        
-        # Plot 1: Yield Gap
-        fig_gap = go.Figure()
-        fig_gap.add_trace(go.Scatter(x=df.index, y=df['Yield_Gap'], fill='tozeroy', name='Earnings Yield Gap', line=dict(color='#00CC96')))
-        fig_gap.add_hline(y=0, line_dash="dash", line_color="red")
-        fig_gap.update_layout(title="Equity vs Bond Yield Gap (The 'Fed Model')", height=350, template="plotly_dark")
-        st.plotly_chart(fig_gap, use_container_width=True)
-        
-        # Plot 2: Mid/Small Cap Z-Scores
-        fig_z = go.Figure()
-        fig_z.add_trace(go.Scatter(x=df.index, y=df['Mid_Z'], name='Midcap Premium (Z)', line=dict(color='cyan')))
-        fig_z.add_trace(go.Scatter(x=df.index, y=df['Small_Z'], name='Smallcap Premium (Z)', line=dict(color='magenta')))
-        fig_z.add_hline(y=1.5, line_dash="dash", line_color="red", annotation_text="Expensive")
-        fig_z.add_hline(y=-1.5, line_dash="dash", line_color="#00FF00", annotation_text="Buy Zone")
-        fig_z.update_layout(title="Mid & Small Cap Relative Valuations (Z-Scores)", height=350, template="plotly_dark")
-        st.plotly_chart(fig_z, use_container_width=True)
+    render_deferred(tabs, [valuation_radar, global_macro, backtest_performance], df, version)
 
-    with tab2:
-        st.subheader("Global Liquidity & Risk")
-        c_a, c_b = st.columns(2)
-        
-        with c_a:
-            # Plot 3: US 10Y Yield
-            fig_us = go.Figure()
-            fig_us.add_trace(go.Scatter(x=df.index, y=df['US10Y'], name='US 10Y Yield', line=dict(color='yellow')))
-            fig_us.update_layout(title="Global Cost of Capital (US 10Y Yield)", height=300, template="plotly_dark")
-            st.plotly_chart(fig_us, use_container_width=True)
-            
-        with c_b:
-            # Plot 4: Gold/Nifty Ratio
-            fig_risk = go.Figure()
-            fig_risk.add_trace(go.Scatter(x=df.index, y=df['Gold_Nifty'], name='Gold/Nifty Ratio', line=dict(color='gold')))
-            fig_risk.add_trace(go.Scatter(x=df.index, y=df['Risk_MA'], name='Regime Trend', line=dict(color='white', dash='dot')))
-            fig_risk.update_layout(title="Risk-Off Detector (Gold Outperformance)", height=300, template="plotly_dark")
-            st.plotly_chart(fig_risk, use_container_width=True)
-
-    with tab3:
-        st.subheader("Strategy Backtest (Switching Logic)")
-        
-        # Simple Backtest Calculation
-        df['Nifty_Ret'] = df['Nifty_Price'].pct_change()
-        df['Midcap_Ret'] = df['Midcap_Price'].pct_change()
-        df['Gold_Ret'] = df['Gold_Price'].pct_change()
-        
-        # Shift Signal for Next Day Execution
-        df['Position'] = df['Signal'].shift(1)
-        
-        df['Strat_Ret'] = 0.0
-        df.loc[df['Position'].astype(str).str.contains('NIFTY'), 'Strat_Ret'] = df['Nifty_Ret']
-        df.loc[df['Position'].astype(str).str.contains('MIDCAP'), 'Strat_Ret'] = df['Midcap_Ret']
-        df.loc[df['Position'].astype(str).str.contains('GOLD'), 'Strat_Ret'] = df['Gold_Ret']
-        
-        # Cumulative
-        df['Equity_Curve'] = (1 + df['Strat_Ret']).cumprod()
-        df['Benchmark'] = (1 + df['Nifty_Ret']).cumprod()
-        
-        # Plot Performance
-        fig_perf = go.Figure()
-        fig_perf.add_trace(go.Scatter(x=df.index, y=df['Equity_Curve'], name='Quant Strategy', line=dict(color='#00FF00', width=2)))
-        fig_perf.add_trace(go.Scatter(x=df.index, y=df['Benchmark'], name='Nifty 50 Buy & Hold', line=dict(color='gray', dash='dash')))
-        fig_perf.update_layout(title="Strategy vs Benchmark", height=400, template="plotly_dark")
-        st.plotly_chart(fig_perf, use_container_width=True)
-        
-        st.markdown("#### Recent Signals")
-        st.dataframe(df[['Signal', 'Yield_Gap', 'Mid_Z', 'Regime']].tail(10).sort_index(ascending=False))
+    if COMPACT_MODE:
+        saved, before = memory_report['Saved_Bytes'].sum(), memory_report['Before_Bytes'].sum()
+        with st.expander(f"🗜️ Compact mode: {saved / 1e6:.1f} MB saved of {before / 1e6:.1f} MB"):
+            st.dataframe(memory_report.sort_values('Saved_Bytes', ascending=False))
 
 except Exception as e:
     st.error(f"Data Processing Error: {e}")
@@ -0,0 +1 @@
+# Lets pytest import quant_core from the repository root (tests live in tests/)
@@ -13,28 +13,25 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 from datetime import datetime
 import warnings
 warnings.filterwarnings('ignore')
 
-# ══════════════════════════════════════════════════════════════════════════════
-# PAGE CONFIG
-# ══════════════════════════════════════════════════════════════════════════════
-
-st.set_page_config(
-    page_title="Pro Quant Dashboard",
-    page_icon="📈",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
+from quant_core.dashboard import create_dashboard_data, load_market_data
+from quant_core.downsample import trace_data
+from quant_core.figure_cache import FIGURES
+from quant_core.sections import deferred_tabs, render_deferred
+from quant_core.refresher import SnapshotRefresher
+from quant_core.signals import (signal_columns, get_erp_signal, get_vix_signal, get_pe_signal,
+                                get_composite_signal, get_market_regime)
 
 # ══════════════════════════════════════════════════════════════════════════════
 # CUSTOM CSS - DARK FUTURISTIC THEME
 # ══════════════════════════════════════════════════════════════════════════════
 
-st.markdown("""
+# Applied by setup_page() at the start of main(), so importing this module
+# renders nothing
+CUSTOM_CSS = """
 <style>
 @import url('https://fonts.googleapis.com/css2?family=Orbitron:wght@400;500;600;700;800;900&family=Rajdhani:wght@300;400;500;600;700&family=JetBrains+Mono:wght@400;500;600;700&display=swap');
 
@@ -327,257 +324,50 @@ st.markdown("""
 .dataframe { font-family: 'JetBrains Mono', monospace !important; }
 
 </style>
-""", unsafe_allow_html=True)
+"""
 
 
 # ══════════════════════════════════════════════════════════════════════════════
-# DATA LOADING & PROCESSING
+# PAGE CONFIG
 # ══════════════════════════════════════════════════════════════════════════════
 
-@st.cache_data(ttl=3600)
-def load_market_data():
-    """Load all market data from CSV files"""
-    
-    data = {}
-    
-    # File configurations
-    file_configs = {
-        'vix': {'file': 'India_VIX_Yahoo.csv', 'date_col': 'Date'},
-        'nifty50': {'file': 'Nifty50_Historical_Yahoo.csv', 'date_col': 'Date'},
-        'midcap': {'file': 'NIFTY_MIDCAP_100_Historical_Yahoo.csv', 'date_col': 'Date'},
-        'pe_data': {'file': 'Nifty_Index_Valuation_History.csv', 'date_col': 'Date'},
-        'gsec': {'file': 'Nifty_10Y_Benchmark_GSec_Merged.csv', 'date_col': 'Date'},
-    }
-    
-    for key, config in file_configs.items():
-        try:
-            df = pd.read_csv(config['file'])
-            df[config['date_col']] = pd.to_datetime(df[config['date_col']])
-            data[key] = df
-        except FileNotFoundError:
-            data[key] = None
-        except Exception as e:
-            data[key] = None
-    
-    return data
-
-
-def create_dashboard_data(raw_data):
-    """Process raw data into dashboard-ready format"""
-    
-    # Check if we have minimum required data
-    if raw_data.get('nifty50') is None:
-        return None, None, None
-    
-    # ═══ DAILY DATA ═══
-    nifty = raw_data['nifty50'].copy()
-    daily = nifty[['Date', 'Close']].copy()
-    daily.columns = ['Date', 'Nifty50']
-    
-    # Add VIX
-    if raw_data.get('vix') is not None:
-        vix = raw_data['vix'][['Date', 'VIX_Close']].copy()
-        vix.columns = ['Date', 'VIX']
-        daily = pd.merge(daily, vix, on='Date', how='left')
-    else:
-        daily['VIX'] = 15  # Default
-    
-    # Add Midcap
-    if raw_data.get('midcap') is not None:
-        midcap = raw_data['midcap'][['Date', 'Close']].copy()
-        midcap.columns = ['Date', 'Midcap100']
-        daily = pd.merge(daily, midcap, on='Date', how='left')
-    
-    # Add G-Sec Yield
-    if raw_data.get('gsec') is not None:
-        gsec = raw_data['gsec'][['Date', 'Close']].copy()
-        gsec['GSec_Yield'] = 17 - (gsec['Close'] / 100)
-        gsec = gsec[['Date', 'GSec_Yield']]
-        daily = pd.merge(daily, gsec, on='Date', how='left')
-    else:
-        daily['GSec_Yield'] = 7.5
-    
-    # Sort and fill
-    daily = daily.sort_values('Date').reset_index(drop=True)
-    daily = daily.ffill()
-    
-    # Technical Indicators
-    daily['SMA_50'] = daily['Nifty50'].rolling(50).mean()
-    daily['SMA_200'] = daily['Nifty50'].rolling(200).mean()
-    daily['ATH'] = daily['Nifty50'].expanding().max()
-    daily['Drawdown'] = ((daily['Nifty50'] / daily['ATH']) - 1) * 100
-    
-    # RSI
-    delta = daily['Nifty50'].diff()
-    gain = delta.where(delta > 0, 0).rolling(14).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(14).mean()
-    rs = gain / loss
-    daily['RSI'] = 100 - (100 / (1 + rs))
-    
-    # ═══ MONTHLY DATA ═══
-    monthly = daily.groupby(daily['Date'].dt.to_period('M')).agg({
-        'Nifty50': 'last',
-        'VIX': 'mean',
-        'GSec_Yield': 'last',
-        'RSI': 'last',
-        'Drawdown': 'last'
-    }).reset_index()
-    monthly['Date'] = monthly['Date'].dt.to_timestamp() + pd.offsets.MonthEnd(0)
-    
-    # Add PE Data
-    if raw_data.get('pe_data') is not None:
-        pe_df = raw_data['pe_data']
-        
-        # Nifty 50 PE
-        n50_pe = pe_df[pe_df['Index'] == 'Nifty 50'][['Date', 'PE_Ratio', 'PB_Ratio', 'Div_Yield']].copy()
-        n50_pe['Date'] = pd.to_datetime(n50_pe['Date']) + pd.offsets.MonthEnd(0)
-        n50_pe.columns = ['Date', 'Nifty50_PE', 'Nifty50_PB', 'Nifty50_DivYield']
-        monthly = pd.merge(monthly, n50_pe, on='Date', how='left')
-        
-        # Midcap PE
-        mid_pe = pe_df[pe_df['Index'] == 'Nifty Midcap 100'][['Date', 'PE_Ratio']].copy()
-        mid_pe['Date'] = pd.to_datetime(mid_pe['Date']) + pd.offsets.MonthEnd(0)
-        mid_pe.columns = ['Date', 'Midcap_PE']
-        monthly = pd.merge(monthly, mid_pe, on='Date', how='left')
-        
-        # Smallcap PE
-        sm_pe = pe_df[pe_df['Index'] == 'Nifty Smallcap 100'][['Date', 'PE_Ratio']].copy()
-        sm_pe['Date'] = pd.to_datetime(sm_pe['Date']) + pd.offsets.MonthEnd(0)
-        sm_pe.columns = ['Date', 'Smallcap_PE']
-        monthly = pd.merge(monthly, sm_pe, on='Date', how='left')
-    
-    # Fill missing PE with defaults
-    monthly['Nifty50_PE'] = monthly.get('Nifty50_PE', pd.Series([22]*len(monthly))).fillna(22)
-    monthly['Midcap_PE'] = monthly.get('Midcap_PE', pd.Series([28]*len(monthly))).fillna(28)
-    monthly['Smallcap_PE'] = monthly.get('Smallcap_PE', pd.Series([25]*len(monthly))).fillna(25)
-    
-    # Calculate ERP
-    monthly['Earnings_Yield'] = (1 / monthly['Nifty50_PE']) * 100
-    monthly['ERP'] = monthly['Earnings_Yield'] - monthly['GSec_Yield']
-    
-    # PE Percentiles
-    monthly['Nifty50_PE_Pct'] = monthly['Nifty50_PE'].rank(pct=True) * 100
-    monthly['Midcap_PE_Pct'] = monthly['Midcap_PE'].rank(pct=True) * 100
-    monthly['Smallcap_PE_Pct'] = monthly['Smallcap_PE'].rank(pct=True) * 100
-    
-    # ═══ SECTOR DATA ═══
-    sector_data = None
-    if raw_data.get('pe_data') is not None:
-        pe_df = raw_data['pe_data']
-        latest_date = pe_df['Date'].max()
-        sector_data = pe_df[pe_df['Date'] == latest_date][['Index', 'PE_Ratio', 'PB_Ratio', 'Div_Yield']].copy()
-        
-        # Calculate percentiles for each sector
-        sector_pcts = []
-        for idx in sector_data['Index'].unique():
-            idx_hist = pe_df[pe_df['Index'] == idx]['PE_Ratio']
-            if len(idx_hist) > 5:
-                current_pe = sector_data[sector_data['Index'] == idx]['PE_Ratio'].values[0]
-                pct = (idx_hist < current_pe).mean() * 100
-                sector_pcts.append({'Index': idx, 'PE_Percentile': pct})
-        
-        if sector_pcts:
-            sector_pct_df = pd.DataFrame(sector_pcts)
-            sector_data = pd.merge(sector_data, sector_pct_df, on='Index', how='left')
-            sector_data = sector_data.sort_values('PE_Percentile')
-    
-    return daily, monthly, sector_data
+def setup_page():
+    """Page config and theme; the first Streamlit calls of every run"""
+    st.set_page_config(
+        page_title="Pro Quant Dashboard",
+        page_icon="📈",
+        layout="wide",
+        initial_sidebar_state="expanded"
+    )
+    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
 
 
 # ══════════════════════════════════════════════════════════════════════════════
-# SIGNAL CALCULATIONS
+# DATA LOADING & PROCESSING
 # ══════════════════════════════════════════════════════════════════════════════
 
-def get_erp_signal(erp):
-    """Calculate ERP signal"""
-    if pd.isna(erp):
-        return 'NO DATA', 0, '#64748b'
-    if erp > 3:
-        return 'VERY CHEAP', 2, '#10b981'
-    if erp > 1.5:
-        return 'CHEAP', 1, '#34d399'
-    if erp > 0:
-        return 'FAIR', 0, '#f59e0b'
-    if erp > -1.5:
-        return 'EXPENSIVE', -1, '#f97316'
-    return 'VERY EXPENSIVE', -2, '#ef4444'
-
-
-def get_vix_signal(vix):
-    """Calculate VIX signal"""
-    if pd.isna(vix):
-        return 'NO DATA', 0, '#64748b'
-    if vix > 30:
-        return 'EXTREME FEAR', 2, '#10b981'
-    if vix > 25:
-        return 'HIGH FEAR', 1.5, '#34d399'
-    if vix > 20:
-        return 'FEAR', 1, '#84cc16'
-    if vix > 15:
-        return 'ELEVATED', 0.5, '#f59e0b'
-    if vix > 12:
-        return 'NORMAL', 0, '#64748b'
-    return 'COMPLACENCY', -1, '#ef4444'
-
-
-def get_pe_signal(pe_pct):
-    """Calculate PE percentile signal"""
-    if pd.isna(pe_pct):
-        return 'NO DATA', 0
-    if pe_pct < 20:
-        return 'VERY CHEAP', 2
-    if pe_pct < 40:
-        return 'CHEAP', 1
-    if pe_pct < 60:
-        return 'FAIR', 0
-    if pe_pct < 80:
-        return 'EXPENSIVE', -1
-    return 'VERY EXPENSIVE', -2
-
-
-def get_composite_signal(erp_score, vix_score, pe_score):
-    """Calculate composite signal"""
-    composite = erp_score * 0.35 + vix_score * 0.35 + pe_score * 0.30
-    
-    if composite >= 1.5:
-        return 'AGGRESSIVE BUY', composite, 'signal-buy'
-    if composite >= 0.75:
-        return 'BUY', composite, 'signal-buy'
-    if composite >= 0.25:
-        return 'ACCUMULATE', composite, 'signal-hold'
-    if composite >= -0.25:
-        return 'HOLD', composite, 'signal-hold'
-    if composite >= -0.75:
-        return 'TRIM', composite, 'signal-trim'
-    if composite >= -1.25:
-        return 'REDUCE', composite, 'signal-sell'
-    return 'SELL', composite, 'signal-sell'
-
-
-def get_market_regime(vix, erp_score, drawdown):
-    """Determine market regime"""
-    vix = vix if not pd.isna(vix) else 15
-    drawdown = drawdown if not pd.isna(drawdown) else 0
-    
-    if erp_score >= 1 and vix > 25 and drawdown < -15:
-        return '🎯 IDEAL BOTTOM', 'regime-bull'
-    if vix > 30 and drawdown < -20:
-        return '📉 CRASH MODE', 'regime-bear'
-    if vix < 15 and drawdown > -5:
-        return '🚀 BULL RUN', 'regime-bull'
-    if vix < 12 and erp_score <= -1:
-        return '⚠️ MARKET TOP', 'regime-bear'
-    if -20 < drawdown < -10:
-        return '📈 RECOVERY', 'regime-neutral'
-    return '↔️ TRANSITIONAL', 'regime-neutral'
+# Seconds between background rebuilds of the dashboard frames
+REFRESH_INTERVAL = 3600
+
+
+@st.cache_resource
+def dashboard_refresher():
+    """One refresher per server process; every session reads its snapshots"""
+    return SnapshotRefresher(lambda: create_dashboard_data(load_market_data()),
+                             interval=REFRESH_INTERVAL, name='dashboard-refresh')
 
 
 # ══════════════════════════════════════════════════════════════════════════════
 # CHART FUNCTIONS
 # ══════════════════════════════════════════════════════════════════════════════
 
+# Plotly is imported inside each builder: importing this module stays cheap and
+# cached figures (FIGURES) never need it
+
 def create_gauge_chart(value, title, min_val, max_val, thresholds, colors):
     """Create a gauge chart"""
+    import plotly.graph_objects as go
+    
     fig = go.Figure(go.Indicator(
         mode="gauge+number",
         value=value,
@@ -608,6 +398,8 @@ def create_gauge_chart(value, title, min_val, max_val, thresholds, colors):
 
 def create_time_series_chart(df, x_col, y_cols, title, colors=None, show_legend=True):
     """Create time series line chart"""
+    import plotly.graph_objects as go
+    
     fig = go.Figure()
     
     default_colors = ['#3b82f6', '#10b981', '#f59e0b', '#ef4444', '#8b5cf6']
@@ -616,8 +408,7 @@ def create_time_series_chart(df, x_col, y_cols, title, colors=None, show_legend=
     for i, col in enumerate(y_cols):
         if col in df.columns:
             fig.add_trace(go.Scatter(
-                x=df[x_col],
-                y=df[col],
+                **trace_data(df[x_col], df[col]),
                 name=col.replace('_', ' '),
                 line=dict(color=colors[i % len(colors)], width=2.5),
                 mode='lines'
@@ -650,6 +441,8 @@ def create_time_series_chart(df, x_col, y_cols, title, colors=None, show_legend=
 
 def create_vix_chart(df):
     """Create VIX chart with fear zones"""
+    import plotly.graph_objects as go
+    
     fig = go.Figure()
     
     # Fear zones
@@ -661,7 +454,7 @@ def create_vix_chart(df):
     
     # VIX line
     fig.add_trace(go.Scatter(
-        x=df['Date'], y=df['VIX'],
+        **trace_data(df['Date'], df['VIX'], method='minmax'),  # keep every spike
         name='India VIX',
         line=dict(color='#8b5cf6', width=2.5),
         fill='tozeroy',
@@ -690,6 +483,8 @@ def create_vix_chart(df):
 
 def create_erp_chart(df):
     """Create ERP chart with zones"""
+    import plotly.graph_objects as go
+    
     fig = go.Figure()
     
     # Zones
@@ -698,7 +493,7 @@ def create_erp_chart(df):
     
     # ERP line
     fig.add_trace(go.Scatter(
-        x=df['Date'], y=df['ERP'],
+        **trace_data(df['Date'], df['ERP']),
         name='ERP',
         line=dict(color='#06b6d4', width=2.5),
         fill='tozeroy',
@@ -729,6 +524,8 @@ def create_erp_chart(df):
 
 def create_multicap_chart(latest):
     """Create multi-cap comparison bar chart"""
+    import plotly.graph_objects as go
+    
     caps = ['Large Cap', 'Mid Cap', 'Small Cap']
     percentiles = [
         latest.get('Nifty50_PE_Pct', 50),
@@ -773,19 +570,57 @@ def create_multicap_chart(latest):
     return fig
 
 
+def create_signal_pie(erp_signal):
+    """Create ERP signal distribution donut chart"""
+    import plotly.graph_objects as go
+    
+    signal_counts = erp_signal.value_counts()
+    
+    fig = go.Figure(data=[go.Pie(
+        labels=signal_counts.index,
+        values=signal_counts.values,
+        hole=0.5,
+        marker_colors=['#10b981', '#34d399', '#f59e0b', '#f97316', '#ef4444']
+    )])
+    
+    fig.update_layout(
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#e2e8f0', family='Rajdhani'),
+        showlegend=True,
+        legend=dict(
+            orientation='h',
+            yanchor='bottom',
+            y=-0.2,
+            xanchor='center',
+            x=0.5,
+            font=dict(size=10)
+        ),
+        height=300,
+        margin=dict(l=20, r=20, t=20, b=60)
+    )
+    return fig
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 # MAIN APPLICATION
 # ══════════════════════════════════════════════════════════════════════════════
 
 def main():
+    setup_page()
+    
     # ═══ HEADER ═══
     st.markdown('<h1 class="main-title">PRO QUANT DASHBOARD</h1>', unsafe_allow_html=True)
     st.markdown('<p class="subtitle">Real-Time Market Timing & Valuation Intelligence</p>', unsafe_allow_html=True)
     
     # ═══ LOAD DATA ═══
     with st.spinner('🔄 Loading market data...'):
-        raw_data = load_market_data()
-        daily, monthly, sector_data = create_dashboard_data(raw_data)
+        snapshot = dashboard_refresher().snapshot()
+        daily, monthly, sector_data = snapshot.data
+    
+    # Charts are cached per snapshot (built_at tells apart refreshers that
+    # restart their numbering); demo data below is never cached
+    version = (snapshot.version, snapshot.built_at)
     
     # Check data availability
     if monthly is None or len(monthly) == 0:
@@ -799,6 +634,7 @@ def main():
         """)
         
         # Use sample data for demo
+        version = None
         st.warning("📊 Showing demo with sample data...")
         np.random.seed(42)
         dates = pd.date_range('2018-01-01', '2026-01-31', freq='M')
@@ -818,6 +654,8 @@ def main():
         monthly['Nifty50_PE_Pct'] = monthly['Nifty50_PE'].rank(pct=True) * 100
         monthly['Midcap_PE_Pct'] = monthly['Midcap_PE'].rank(pct=True) * 100
         monthly['Smallcap_PE_Pct'] = monthly['Smallcap_PE'].rank(pct=True) * 100
+        monthly = monthly.assign(**signal_columns(
+            monthly['ERP'], monthly['VIX'], monthly['Nifty50_PE_Pct'], monthly['Drawdown']))
     
     # Get latest data with valid PE
     monthly_valid = monthly.dropna(subset=['Nifty50_PE']) if 'Nifty50_PE' in monthly.columns else monthly
@@ -872,6 +710,7 @@ def main():
         st.markdown("### ℹ️ Data Info")
         st.caption(f"**Last Updated:** {latest['Date'].strftime('%Y-%m-%d')}")
         st.caption(f"**Data Points:** {len(monthly_valid)} months")
+        st.caption(f"**Refreshed:** {datetime.fromtimestamp(snapshot.built_at).strftime('%Y-%m-%d %H:%M')}")
     
     # ═══════════════════════════════════════════════════════════════════════════
     # MAIN CONTENT
@@ -965,54 +804,50 @@ def main():
         g1, g2, g3 = st.columns(3)
         
         with g1:
-            fig = create_gauge_chart(
+            fig = FIGURES.get('dashboard/gauge_pe', version, lambda: create_gauge_chart(
                 latest.get('Nifty50_PE', 22), "PE RATIO", 15, 40,
                 [15, 20, 25, 30, 35, 40],
                 ['#059669', '#10b981', '#f59e0b', '#f97316', '#ef4444']
-            )
+            ))
             st.plotly_chart(fig, use_container_width=True)
         
         with g2:
-            fig = create_gauge_chart(
+            fig = FIGURES.get('dashboard/gauge_vix', version, lambda: create_gauge_chart(
                 latest.get('VIX', 15), "VIX LEVEL", 8, 40,
                 [8, 12, 18, 25, 32, 40],
                 ['#ef4444', '#f97316', '#f59e0b', '#10b981', '#059669']
-            )
+            ))
             st.plotly_chart(fig, use_container_width=True)
         
         with g3:
-            fig = create_gauge_chart(
+            fig = FIGURES.get('dashboard/gauge_erp', version, lambda: create_gauge_chart(
                 latest.get('ERP', -2), "ERP %", -6, 4,
                 [-6, -3, 0, 1.5, 3, 4],
                 ['#ef4444', '#f97316', '#f59e0b', '#10b981', '#059669']
-            )
+            ))
             st.plotly_chart(fig, use_container_width=True)
     
     # ═══ ROW 3: CHARTS ═══
     st.markdown('<div class="section-header">📈 Historical Analysis</div>', unsafe_allow_html=True)
     
-    tab1, tab2, tab3, tab4 = st.tabs(["💰 Valuations", "😱 VIX Sentiment", "📊 ERP Analysis", "🏛️ Multi-Cap"])
+    # Only the selected tab builds and sends its chart; switching tabs reruns main()
+    tabs = deferred_tabs(st.tabs, ["💰 Valuations", "😱 VIX Sentiment", "📊 ERP Analysis", "🏛️ Multi-Cap"],
+                         key="history_tab")
     
-    with tab1:
-        fig = create_time_series_chart(
+    def chart_section(chart_id, build):
+        return lambda: st.plotly_chart(FIGURES.get(chart_id, version, build), use_container_width=True)
+    
+    render_deferred(tabs, [
+        chart_section('dashboard/pe_trends', lambda: create_time_series_chart(
             monthly_valid, 'Date',
             ['Nifty50_PE', 'Midcap_PE', 'Smallcap_PE'],
             '📊 PE Ratio Trends Across Market Caps',
             ['#3b82f6', '#10b981', '#f59e0b']
-        )
-        st.plotly_chart(fig, use_container_width=True)
-    
-    with tab2:
-        fig = create_vix_chart(monthly_valid)
-        st.plotly_chart(fig, use_container_width=True)
-    
-    with tab3:
-        fig = create_erp_chart(monthly_valid)
-        st.plotly_chart(fig, use_container_width=True)
-    
-    with tab4:
-        fig = create_multicap_chart(latest)
-        st.plotly_chart(fig, use_container_width=True)
+        )),
+        chart_section('dashboard/vix', lambda: create_vix_chart(monthly_valid)),
+        chart_section('dashboard/erp', lambda: create_erp_chart(monthly_valid)),
+        chart_section('dashboard/multicap', lambda: create_multicap_chart(latest)),
+    ])
     
     # ═══ ROW 4: SIGNAL HISTORY ═══
     st.markdown('<div class="section-header">📋 Recent Signal History</div>', unsafe_allow_html=True)
@@ -1023,9 +858,7 @@ def main():
         # Prepare display data
         display_df = monthly_valid.tail(12).copy()
         display_df['Month'] = display_df['Date'].dt.strftime('%Y-%m')
-        display_df['ERP_Signal'] = display_df['ERP'].apply(lambda x: get_erp_signal(x)[0])
-        display_df['VIX_Signal'] = display_df['VIX'].apply(lambda x: get_vix_signal(x)[0])
-        
+        # ERP_Signal / VIX_Signal are precomputed for every month by create_dashboard_data
         display_cols = ['Month', 'Nifty50', 'Nifty50_PE', 'VIX', 'ERP', 'ERP_Signal', 'VIX_Signal']
         display_df = display_df[[c for c in display_cols if c in display_df.columns]]
         
@@ -1046,31 +879,7 @@ def main():
         st.markdown("#### 📊 Signal Distribution")
         
         if 'ERP_Signal' in display_df.columns:
-            signal_counts = monthly_valid['ERP'].apply(lambda x: get_erp_signal(x)[0]).value_counts()
-            
-            fig = go.Figure(data=[go.Pie(
-                labels=signal_counts.index,
-                values=signal_counts.values,
-                hole=0.5,
-                marker_colors=['#10b981', '#34d399', '#f59e0b', '#f97316', '#ef4444']
-            )])
-            
-            fig.update_layout(
-                paper_bgcolor='rgba(0,0,0,0)',
-                plot_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='#e2e8f0', family='Rajdhani'),
-                showlegend=True,
-                legend=dict(
-                    orientation='h',
-                    yanchor='bottom',
-                    y=-0.2,
-                    xanchor='center',
-                    x=0.5,
-                    font=dict(size=10)
-                ),
-                height=300,
-                margin=dict(l=20, r=20, t=20, b=60)
-            )
+            fig = FIGURES.get('dashboard/signal_pie', version, lambda: create_signal_pie(monthly_valid['ERP_Signal']))
             st.plotly_chart(fig, use_container_width=True)
     
     # ═══ FOOTER ═══
@@ -0,0 +1,20 @@
+"""
+Compute core shared by app.py, market_timing_fetcher.py and batch scripts.
+
+Sources are parsed once into a shared cache (sources). The two dashboards'
+pipelines (scanner, dashboard) and every analytics module below them run
+without Streamlit, so the apps are thin views over this package:
+
+    schemas, sources, csv_cache, ingest, master_store    loading and caching
+    scanner, dashboard                                    per-app pipelines
+    signals, strategy, indicators, features,
+    rolling_stats, valuation                              analytics
+    backtest, sweep, walkforward                          research
+    refresher, compact, downsample,
+    figure_cache, sections                                serving helpers
+    publish                                               headless signal CLI
+    importtime                                            cold import benchmark
+
+Nothing here imports Streamlit or Plotly; the apps import Plotly lazily
+inside their chart builders.
+"""
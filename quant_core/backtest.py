@@ -0,0 +1,152 @@
+"""
+Vectorized switching-strategy backtest.
+
+Signals are mapped to integer asset codes once, and each bar's strategy
+return is picked from an asset-returns matrix with a single fancy-indexing
+gather. No string matching is done per bar. Supports an execution lag and
+proportional transaction costs, and runs without Streamlit.
+"""
+
+import numpy as np
+import pandas as pd
+
+TRADING_DAYS = 252
+
+FLAT = -1   # asset code for "no position" (earns zero return)
+
+
+def encode_signals(signals, labels):
+    """
+    Map signal labels to integer codes (their position in ``labels``).
+
+    Works on a Series or a (dates x strategies) frame in one pass. Missing
+    signals become FLAT. Unknown labels raise ValueError rather than
+    silently falling through to the wrong asset.
+    """
+    values = np.asarray(signals, dtype=object)
+    flat = pd.Series(values.ravel())
+    codes = pd.Categorical(flat, categories=list(labels)).codes.astype('int64')
+    unknown = (codes == -1) & flat.notna().to_numpy()
+    if unknown.any():
+        raise ValueError(f"Unknown signal labels: {sorted(set(flat[unknown]))}")
+    return codes.reshape(values.shape)
+
+
+def asset_returns(prices):
+    """Simple per-bar returns for a (dates x assets) price frame; first bar is 0"""
+    return np.nan_to_num(prices.pct_change().to_numpy(dtype='float64'), nan=0.0)
+
+
+def backtest_codes(codes, returns, lag=1, cost=0.0):
+    """
+    Core backtest on arrays.
+
+    ``codes`` are asset codes per bar (column index into ``returns``, or
+    FLAT), decided at the close of that bar and held from ``lag`` bars later.
+    A 2-D (dates x strategies) code matrix backtests every strategy in the
+    same pass. ``cost`` is charged per unit of turnover: switching between
+    two assets trades two units (sell + buy), entering or leaving FLAT
+    trades one.
+
+    Returns (held codes, net strategy returns), shaped like ``codes``.
+    """
+    codes = np.asarray(codes, dtype='int64')
+    returns = np.asarray(returns, dtype='float64')
+    shape = codes.shape
+    codes = codes.reshape(len(codes), -1)
+    n = len(codes)
+
+    held = np.full(codes.shape, FLAT, dtype='int64')
+    if lag < n:
+        held[lag:] = codes[:n - lag]
+
+    invested = held != FLAT
+    rows = np.arange(n)[:, None]
+    gross = np.where(invested, returns[rows, np.where(invested, held, 0)], 0.0)
+
+    previous = np.vstack([np.full((1, held.shape[1]), FLAT), held[:-1]])
+    turnover = (held != previous) * (invested.astype(int) + (previous != FLAT).astype(int))
+    return held.reshape(shape), (gross - cost * turnover).reshape(shape)
+
+
+def matrix_stats(strat_ret, periods_per_year=TRADING_DAYS):
+    """
+    Summary stats for each column of a (dates x strategies) return matrix.
+
+    Returns (stats, equity, drawdown): a dict of per-column arrays plus the
+    equity and drawdown matrices.
+    """
+    n = len(strat_ret)
+    equity = np.cumprod(1 + strat_ret, axis=0)
+    years = n / periods_per_year
+    vol = strat_ret.std(axis=0, ddof=1) * np.sqrt(periods_per_year) if n > 1 else np.full(strat_ret.shape[1], np.nan)
+    mean = strat_ret.mean(axis=0) * periods_per_year
+    drawdown = equity / np.maximum.accumulate(equity, axis=0) - 1
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return {
+            'Total_Return': equity[-1] - 1,
+            'CAGR': equity[-1] ** (1 / years) - 1,
+            'Volatility': vol,
+            'Sharpe': np.where(vol > 0, mean / vol, np.nan),
+            'Max_Drawdown': drawdown.min(axis=0),
+        }, equity, drawdown
+
+
+def summary_stats(strat_ret, periods_per_year=TRADING_DAYS):
+    """Total return, CAGR, volatility, Sharpe and max drawdown of a return series"""
+    strat_ret = np.asarray(strat_ret, dtype='float64').reshape(-1, 1)
+    if len(strat_ret) == 0:
+        return dict.fromkeys(['Total_Return', 'CAGR', 'Volatility', 'Sharpe', 'Max_Drawdown'], np.nan)
+    stats, _, _ = matrix_stats(strat_ret, periods_per_year)
+    return {k: v[0] for k, v in stats.items()}
+
+
+def run_backtest(signals, prices, assets, lag=1, cost=0.0):
+    """
+    Backtest a signal series that switches between assets.
+
+    ``assets`` maps each signal label to the price column it holds. Returns
+    (frame, stats): a frame indexed like ``signals`` with the held asset,
+    strategy return, equity curve and drawdown, plus a summary stats dict
+    that also counts the number of switches.
+    """
+    labels = list(assets)
+    codes = encode_signals(signals, labels)
+    returns = asset_returns(prices[[assets[label] for label in labels]])
+    held, strat_ret = backtest_codes(codes, returns, lag=lag, cost=cost)
+
+    equity = np.cumprod(1 + strat_ret)
+    position = np.array(labels + [None], dtype=object)[held]
+    frame = pd.DataFrame({
+        'Position': position,
+        'Strat_Ret': strat_ret,
+        'Equity_Curve': equity,
+        'Drawdown': equity / np.maximum.accumulate(equity) - 1,
+    }, index=signals.index)
+
+    stats = summary_stats(strat_ret)
+    stats['Switches'] = int((held[1:] != held[:-1]).sum())
+    return frame, stats
+
+
+def run_backtests(signals, prices, assets, lag=1, cost=0.0):
+    """
+    Backtest many strategies at once.
+
+    ``signals`` is a (dates x strategies) frame of signal labels; every
+    column shares ``assets`` and ``prices``. Equity curves, drawdowns and
+    stats for all columns come out of one vectorized pass. Returns
+    (equity, drawdown, stats) where the first two are frames shaped like
+    ``signals`` and ``stats`` has one row per strategy.
+    """
+    labels = list(assets)
+    codes = encode_signals(signals, labels)
+    returns = asset_returns(prices[[assets[label] for label in labels]])
+    held, strat_ret = backtest_codes(codes, returns, lag=lag, cost=cost)
+
+    stats, equity, drawdown = matrix_stats(strat_ret)
+    stats = pd.DataFrame(stats, index=signals.columns)
+    stats['Switches'] = (held[1:] != held[:-1]).sum(axis=0)
+    equity = pd.DataFrame(equity, index=signals.index, columns=signals.columns)
+    drawdown = pd.DataFrame(drawdown, index=signals.index, columns=signals.columns)
+    return equity, drawdown, stats
@@ -0,0 +1,52 @@
+"""
+Opt-in memory-compact storage for dashboard frames.
+
+app.py keeps its analysed master frame in memory for as long as the
+server runs (one shared copy per data version). With compact mode on,
+float64 columns are stored as float32 and repetitive text labels (Signal,
+Regime) as categoricals, which keeps one small-int code per row plus a
+handful of distinct strings. float32 keeps about 7 significant digits,
+plenty for prices, PE ratios, yields and VIX, but results near a threshold
+can differ from full-precision runs, so the mode is off by default.
+
+Enable it by setting DASHBOARD_COMPACT=1 in the environment.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+COMPACT_MODE = os.environ.get('DASHBOARD_COMPACT', '').lower() in ('1', 'true', 'yes')
+
+# Text columns become categoricals when at most this share of rows is distinct
+MAX_DISTINCT_SHARE = 0.5
+
+
+def compact_frame(df):
+    """
+    Float32/categorical copy of ``df`` plus a bytes-saved report.
+
+    The report has one row per column (Dtype, Before_Bytes, After_Bytes,
+    Saved_Bytes), counting string payloads as well as the arrays.
+    """
+    out = {}
+    for col in df.columns:
+        s = df[col]
+        if s.dtype == np.float64:
+            s = s.astype(np.float32)
+        elif (pd.api.types.is_object_dtype(s) or pd.api.types.is_string_dtype(s)) \
+                and s.nunique(dropna=False) <= MAX_DISTINCT_SHARE * len(s):
+            s = s.astype('category')
+        out[col] = s
+    compact = pd.DataFrame(out, index=df.index)
+
+    before = df.memory_usage(index=False, deep=True)
+    after = compact.memory_usage(index=False, deep=True)
+    report = pd.DataFrame({
+        'Dtype': compact.dtypes.astype(str),
+        'Before_Bytes': before,
+        'After_Bytes': after,
+        'Saved_Bytes': before - after,
+    })
+    return compact, report
@@ -0,0 +1,132 @@
+"""
+Persistent on-disk cache for parsed CSV inputs.
+
+Each parsed frame is stored as a memory-mapped NumPy block (one float64
+matrix plus the date index) under CACHE_DIR. Entries are keyed on the source
+file's path, size and mtime, so an unchanged CSV is served straight from the
+mapped arrays and only modified files are re-parsed. Unlike st.cache_data the
+cache survives process restarts and is shared by every replica that mounts
+the same cache directory.
+
+CACHE_DIR is an absolute path fixed at import: $QUANT_CACHE_DIR if set,
+otherwise .csv_cache in the repository root. The working directory of the
+process (e.g. publish.py --data-dir) never moves it.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+CACHE_DIR = os.path.abspath(os.environ.get('QUANT_CACHE_DIR') or os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.csv_cache'))
+
+# Bump when the on-disk layout changes so old entries are ignored
+CACHE_VERSION = 1
+
+
+def digest(*parts):
+    return hashlib.sha1('|'.join(str(p) for p in parts).encode()).hexdigest()[:16]
+
+
+def source_version(paths):
+    """
+    Version tag for a set of source files that changes whenever any of them
+    is modified, created or removed (size and mtime only; nothing is read)
+    """
+    parts = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            parts.append((os.path.abspath(path), stat.st_size, stat.st_mtime_ns))
+        except FileNotFoundError:
+            parts.append((os.path.abspath(path), None))
+    return digest(CACHE_VERSION, *parts)
+
+
+def _entry_dirs(path, key):
+    """Return (source_dir, entry_dir) for the current state of ``path``"""
+    stat = os.stat(path)
+    source_dir = os.path.join(CACHE_DIR, digest(CACHE_VERSION, os.path.abspath(path), key))
+    entry_dir = os.path.join(source_dir, digest(stat.st_size, stat.st_mtime_ns))
+    return source_dir, entry_dir
+
+
+def read_frame(entry_dir):
+    """Map a cached frame back into memory without copying; returns (df, meta)"""
+    with open(os.path.join(entry_dir, 'meta.json')) as f:
+        meta = json.load(f)
+    index = pd.DatetimeIndex(np.load(os.path.join(entry_dir, 'index.npy')), name=meta['index_name'])
+    values = np.load(os.path.join(entry_dir, 'values.npy'), mmap_mode='r')
+    return pd.DataFrame(values, index=index, columns=meta['columns'], copy=False), meta
+
+
+def write_frame(parent_dir, entry_dir, df, **meta):
+    """
+    Write ``df`` (plus any extra ``meta``) to a temp dir under ``parent_dir``
+    and atomically rename it to ``entry_dir``. Older sibling entries are
+    removed. Returns False if the entry could not be written.
+    """
+    os.makedirs(parent_dir, exist_ok=True)
+    tmp_dir = tempfile.mkdtemp(dir=parent_dir, prefix='.tmp-')
+    try:
+        np.save(os.path.join(tmp_dir, 'index.npy'), df.index.values)
+        np.save(os.path.join(tmp_dir, 'values.npy'), np.ascontiguousarray(df.to_numpy(dtype='float64')))
+        with open(os.path.join(tmp_dir, 'meta.json'), 'w') as f:
+            json.dump(dict(meta, columns=list(df.columns), index_name=df.index.name), f)
+        os.rename(tmp_dir, entry_dir)
+    except OSError:
+        # Another process got there first, or the cache dir is read-only
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        return False
+
+    # Drop entries for older versions of the same data
+    for name in os.listdir(parent_dir):
+        stale = os.path.join(parent_dir, name)
+        if stale != entry_dir and not name.startswith('.tmp-') and os.path.isdir(stale):
+            shutil.rmtree(stale, ignore_errors=True)
+    return True
+
+
+def _is_cacheable(df):
+    return (
+        isinstance(df.index, pd.DatetimeIndex)
+        and len(df.columns) > 0
+        and all(pd.api.types.is_numeric_dtype(dtype) for dtype in df.dtypes)
+    )
+
+
+def load_cached(path, parse, key=''):
+    """
+    Return the frame produced by ``parse()`` for ``path``, using the disk cache.
+
+    ``parse`` is only called when ``path`` has no entry for its current size
+    and mtime. ``key`` identifies the parse options (columns, renames) so
+    different views of the same file are cached separately. Only date-indexed
+    numeric frames are cached; their columns come back as float64 whether
+    they were just parsed or read from the cache. Anything else is returned
+    as parsed.
+    """
+    source_dir, entry_dir = _entry_dirs(path, key)
+    if os.path.isdir(entry_dir):
+        try:
+            return read_frame(entry_dir)[0]
+        except (OSError, ValueError, KeyError):
+            # Corrupt or partially deleted entry, fall through and rebuild
+            shutil.rmtree(entry_dir, ignore_errors=True)
+
+    df = parse()
+    if _is_cacheable(df):
+        # Same dtypes as a later warm read of the stored float64 block
+        df = df.astype('float64')
+        write_frame(source_dir, entry_dir, df)
+    return df
+
+
+def clear_cache():
+    """Remove every cached entry"""
+    shutil.rmtree(CACHE_DIR, ignore_errors=True)
@@ -0,0 +1,164 @@
+"""
+Data pipeline behind market_timing_fetcher.py.
+
+load_market_data reads the dashboard's sources through the shared source
+cache. create_dashboard_data turns them into the daily, monthly and sector
+frames the dashboard draws. Neither needs Streamlit, so batch jobs can
+produce the same frames.
+"""
+
+import os
+from functools import partial
+
+import pandas as pd
+
+from .indicators import TECHNICAL
+from .ingest import load_all
+from .signals import signal_columns
+from .sources import load_source
+from .valuation import ValuationStore, pe_percentiles
+
+
+def _read(path, columns):
+    """Date column plus ``columns`` (default: all declared) from the shared source cache"""
+    df = load_source(path)
+    return (df if columns is None else df[columns]).reset_index()
+
+
+def load_market_data(data_dir='.'):
+    """Load all market data from the CSV files in ``data_dir``"""
+    
+    # Files and the columns read from each (dtypes and date formats live in schemas.py)
+    file_configs = {
+        'vix': {'file': 'India_VIX_Yahoo.csv', 'columns': ['VIX_Close']},
+        'nifty50': {'file': 'Nifty50_Historical_Yahoo.csv', 'columns': ['Close']},
+        'midcap': {'file': 'NIFTY_MIDCAP_100_Historical_Yahoo.csv', 'columns': ['Close']},
+        'pe_data': {'file': 'Nifty_Index_Valuation_History.csv', 'columns': None},
+        'gsec': {'file': 'Nifty_10Y_Benchmark_GSec_Merged.csv', 'columns': ['Close']},
+    }
+    
+    # Files are read concurrently through the shared source cache; any that
+    # fail to load come back as None
+    data, _ = load_all({key: partial(_read, os.path.join(data_dir, config['file']), config['columns'])
+                        for key, config in file_configs.items()})
+    
+    # Pivot the long valuation history once so index lookups need no scans
+    if data.get('pe_data') is not None:
+        data['valuation'] = ValuationStore(data['pe_data'])
+    
+    return data
+
+
+# Technical indicators materialized into the daily frame (part of the
+# create_dashboard_data contract, even where the charts do not read them)
+DAILY_INDICATORS = ['SMA_50', 'SMA_200', 'ATH', 'Drawdown', 'RSI']
+
+
+def create_dashboard_data(raw_data):
+    """Process raw data into dashboard-ready format"""
+    
+    # Check if we have minimum required data
+    if raw_data.get('nifty50') is None:
+        return None, None, None
+    
+    # ═══ DAILY DATA ═══
+    nifty = raw_data['nifty50'].copy()
+    daily = nifty[['Date', 'Close']].copy()
+    daily.columns = ['Date', 'Nifty50']
+    
+    # Add VIX
+    if raw_data.get('vix') is not None:
+        vix = raw_data['vix'][['Date', 'VIX_Close']].copy()
+        vix.columns = ['Date', 'VIX']
+        daily = pd.merge(daily, vix, on='Date', how='left')
+    else:
+        daily['VIX'] = 15  # Default
+    
+    # Add Midcap
+    if raw_data.get('midcap') is not None:
+        midcap = raw_data['midcap'][['Date', 'Close']].copy()
+        midcap.columns = ['Date', 'Midcap100']
+        daily = pd.merge(daily, midcap, on='Date', how='left')
+    
+    # Add G-Sec Yield
+    if raw_data.get('gsec') is not None:
+        gsec = raw_data['gsec'][['Date', 'Close']].copy()
+        gsec['GSec_Yield'] = 17 - (gsec['Close'] / 100)
+        gsec = gsec[['Date', 'GSec_Yield']]
+        daily = pd.merge(daily, gsec, on='Date', how='left')
+    else:
+        daily['GSec_Yield'] = 7.5
+    
+    # Sort and fill
+    daily = daily.sort_values('Date').reset_index(drop=True)
+    daily = daily.ffill()
+    
+    # Technical Indicators (declared in indicators.py; unchanged history is
+    # served from memo)
+    daily = TECHNICAL.view(daily).frame(DAILY_INDICATORS)
+    
+    # ═══ MONTHLY DATA ═══
+    monthly = daily.groupby(daily['Date'].dt.to_period('M')).agg({
+        'Nifty50': 'last',
+        'VIX': 'mean',
+        'GSec_Yield': 'last',
+        'RSI': 'last',
+        'Drawdown': 'last'
+    }).reset_index()
+    monthly['Date'] = monthly['Date'].dt.to_timestamp() + pd.offsets.MonthEnd(0)
+    
+    # Add PE Data (direct column lookups in the wide valuation store, one merge)
+    if raw_data.get('pe_data') is not None:
+        store = raw_data.get('valuation') or ValuationStore(raw_data['pe_data'])
+        pe_cols = store.frame({
+            'Nifty50_PE': ('Nifty 50', 'PE_Ratio'),
+            'Nifty50_PB': ('Nifty 50', 'PB_Ratio'),
+            'Nifty50_DivYield': ('Nifty 50', 'Div_Yield'),
+            'Midcap_PE': ('Nifty Midcap 100', 'PE_Ratio'),
+            'Smallcap_PE': ('Nifty Smallcap 100', 'PE_Ratio'),
+        }, month_end=True)
+        monthly = pd.merge(monthly, pe_cols, on='Date', how='left')
+    
+    # Fill missing PE with defaults
+    monthly['Nifty50_PE'] = monthly.get('Nifty50_PE', pd.Series([22]*len(monthly))).fillna(22)
+    monthly['Midcap_PE'] = monthly.get('Midcap_PE', pd.Series([28]*len(monthly))).fillna(28)
+    monthly['Smallcap_PE'] = monthly.get('Smallcap_PE', pd.Series([25]*len(monthly))).fillna(25)
+    
+    # Calculate ERP
+    monthly['Earnings_Yield'] = (1 / monthly['Nifty50_PE']) * 100
+    monthly['ERP'] = monthly['Earnings_Yield'] - monthly['GSec_Yield']
+    
+    # PE Percentiles
+    monthly['Nifty50_PE_Pct'] = monthly['Nifty50_PE'].rank(pct=True) * 100
+    monthly['Midcap_PE_Pct'] = monthly['Midcap_PE'].rank(pct=True) * 100
+    monthly['Smallcap_PE_Pct'] = monthly['Smallcap_PE'].rank(pct=True) * 100
+    
+    # ═══ SIGNAL HISTORY ═══
+    # Composite signal and regime for every month and every trading day
+    monthly = monthly.assign(**signal_columns(
+        monthly['ERP'], monthly['VIX'], monthly['Nifty50_PE_Pct'], monthly['Drawdown']))
+    
+    # Daily ERP uses the month's earnings yield against each day's G-Sec yield
+    month_pe = monthly.set_index(monthly['Date'].dt.to_period('M'))[['Earnings_Yield', 'Nifty50_PE_Pct']]
+    day_pe = month_pe.reindex(daily['Date'].dt.to_period('M')).to_numpy()
+    daily['ERP'] = day_pe[:, 0] - daily['GSec_Yield'].to_numpy()
+    daily['Nifty50_PE_Pct'] = day_pe[:, 1]
+    daily = daily.assign(**signal_columns(
+        daily['ERP'], daily['VIX'], daily['Nifty50_PE_Pct'], daily['Drawdown']))
+    
+    # ═══ SECTOR DATA ═══
+    sector_data = None
+    if raw_data.get('pe_data') is not None:
+        pe_df = raw_data['pe_data']
+        latest_date = pe_df['Date'].max()
+        latest = pe_df['Date'] == latest_date
+        sector_data = pe_df[latest][['Index', 'PE_Ratio', 'PB_Ratio', 'Div_Yield']].copy()
+        
+        # Percentile of each sector's current PE vs its own history, all indices in one pass
+        sector_data['PE_Percentile'] = pe_percentiles(pe_df)[latest]
+        if sector_data['PE_Percentile'].notna().any():
+            sector_data = sector_data.reset_index(drop=True).sort_values('PE_Percentile')
+        else:
+            sector_data = sector_data.drop(columns='PE_Percentile')
+    
+    return daily, monthly, sector_data
@@ -0,0 +1,118 @@
+"""
+Server-side downsampling for long chart traces.
+
+A daily series has thousands of points but a chart is only so many pixels
+wide, so sending every point just inflates the JSON payload and the
+browser's render time. These helpers pick a point budget from the chart
+width and the visible x-range, then reduce the trace to it:
+
+    lttb    Largest-Triangle-Three-Buckets. Keeps the visual shape of a line
+            with one point per bucket (the default).
+    minmax  The lowest and highest point of every bucket. Guarantees that
+            spikes and troughs (VIX spikes, drawdown lows) survive exactly.
+
+Only the valid points are reduced. Each gap inside the trace keeps its
+first NaN and the valid points on either side, so a reduced line breaks
+exactly where the full one does. Traces already within budget are
+returned unchanged.
+
+Streamlit does not report a chart's rendered width or zoom back to the
+script, so the dashboards budget for DEFAULT_WIDTH (or a fraction of it
+for side-by-side charts) over the full series. ``x_range`` is for callers
+that do know the visible window, such as a date-range picker. No plotting
+library is imported here.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Plot width in pixels assumed for full-width charts, and points kept per pixel
+DEFAULT_WIDTH = 1200
+POINTS_PER_PIXEL = 1
+
+
+def lttb_indices(y, n_out):
+    """Positions of the ``n_out`` points LTTB keeps from ``y`` (evenly spaced x)"""
+    y = np.asarray(y, dtype='float64')
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # n_out - 2 buckets between the fixed first and last points
+    edges = np.linspace(1, n - 1, n_out - 1).astype('int64')
+    out = np.empty(n_out, dtype='int64')
+    out[0], out[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        # Triangle against the average point of the next bucket
+        avg_x = (end + next_end - 1) / 2
+        avg_y = y[end:next_end].mean()
+        xs = np.arange(start, end)
+        area = np.abs((a - avg_x) * (y[start:end] - y[a]) - (a - xs) * (avg_y - y[a]))
+        a = start + int(area.argmax())
+        out[i + 1] = a
+    return out
+
+
+def minmax_indices(y, n_out):
+    """Positions of each bucket's minimum and maximum, about ``n_out`` in total"""
+    y = np.asarray(y, dtype='float64')
+    n = len(y)
+    buckets = n_out // 2
+    if n <= n_out or buckets < 1:
+        return np.arange(n)
+
+    edges = np.linspace(0, n, buckets + 1).astype('int64')
+    groups = pd.Series(y).groupby(np.repeat(np.arange(buckets), np.diff(edges)))
+    keep = np.concatenate([[0, n - 1], groups.idxmin().to_numpy(), groups.idxmax().to_numpy()])
+    return np.unique(keep)
+
+
+def point_budget(width=DEFAULT_WIDTH):
+    """Points to keep for a chart ``width`` pixels wide"""
+    return max(3, int(width * POINTS_PER_PIXEL))
+
+
+def downsample(x, y, width=DEFAULT_WIDTH, method='lttb', x_range=None):
+    """
+    Reduce a trace to the point budget of a ``width``-pixel chart.
+
+    ``x_range`` (lo, hi) limits the trace to the visible window first, so
+    a zoomed-in view spends the whole budget on the bars it shows.
+    Returns (x, y) arrays ready to hand to a plotting call.
+    """
+    x = x.to_numpy() if hasattr(x, 'to_numpy') else np.asarray(x)
+    y = np.asarray(y, dtype='float64')
+    if x_range is not None:
+        lo, hi = x_range
+        window = (x >= lo) & (x <= hi)
+        x, y = x[window], y[window]
+
+    missing = np.isnan(y)
+    valid = np.flatnonzero(~missing)
+    budget = point_budget(width)
+    if len(valid) <= budget:
+        return x, y
+    pick = {'lttb': lttb_indices, 'minmax': minmax_indices}[method]
+    keep = valid[pick(y[valid], budget)]
+    if len(valid) < len(y):
+        keep = np.union1d(keep, _gap_edges(missing))
+    return x[keep], y[keep]
+
+
+def _gap_edges(missing):
+    """First NaN of every interior gap plus the valid points either side of it"""
+    starts = np.flatnonzero(missing & ~np.r_[False, missing[:-1]])
+    ends = np.flatnonzero(missing & ~np.r_[missing[1:], False])
+    # Leading and trailing NaN runs draw nothing either way
+    interior = (starts > 0) & (ends < len(missing) - 1)
+    starts, ends = starts[interior], ends[interior]
+    return np.concatenate([starts - 1, starts, ends + 1])
+
+
+def trace_data(x, y, width=DEFAULT_WIDTH, method='lttb', x_range=None):
+    """``downsample`` as x/y keyword arguments for a Scatter trace"""
+    x, y = downsample(x, y, width, method, x_range)
+    return {'x': x, 'y': y}
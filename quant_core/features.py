@@ -0,0 +1,139 @@
+"""
+Lazy, memoized feature graph.
+
+Indicators are registered on a FeatureGraph with the columns or features
+they depend on. graph.view(base) wraps a base frame. A feature is computed
+the first time it is read through the view, together with whatever it
+depends on and nothing else.
+
+Results are memoized on the graph, keyed on a fingerprint of their inputs.
+The fingerprint is a content hash of the base columns they read, plus the
+fingerprints of their dependencies. A new data version therefore only
+recomputes features whose inputs actually changed. Everything else is
+served from the memo.
+
+Graphs that should keep their memo across Streamlit reruns must live in an
+imported module (see indicators.py), not in a script.
+"""
+
+import hashlib
+import threading
+
+import pandas as pd
+
+
+class FeatureGraph:
+    """Registry of named features and their dependencies"""
+
+    def __init__(self, name):
+        self.name = name
+        self._features = {}
+        self._memo = {}     # feature -> (input fingerprint, value)
+        self._hidden = set()  # shared nodes behind features(); not columns
+        self._lock = threading.RLock()
+
+    def feature(self, name, deps):
+        """
+        Decorator registering ``fn(*deps)`` as feature ``name``.
+
+        ``deps`` are base columns or other features, passed to ``fn`` as
+        Series in order. ``fn`` returns a Series or array aligned with the
+        base frame.
+        """
+        def register(fn):
+            self._register(name, fn, deps)
+            return fn
+        return register
+
+    def features(self, names, deps):
+        """
+        Decorator registering ``fn(*deps)`` as every feature in ``names`` at
+        once, for indicators that share one computation. ``fn`` returns
+        {name: Series or array}. It runs once per input version, and each
+        feature reads its own entry.
+        """
+        def register(fn):
+            node = '<' + ','.join(names) + '>'
+            self._register(node, fn, deps)
+            self._hidden.add(node)
+            for name in names:
+                self._register(name, lambda columns, name=name: columns[name], [node])
+            return fn
+        return register
+
+    def _register(self, name, fn, deps):
+        if name in self._features:
+            raise ValueError(f"Feature {name!r} is already registered on {self.name}")
+        self._features[name] = (fn, tuple(deps))
+
+    def __contains__(self, name):
+        return name in self._features
+
+    @property
+    def names(self):
+        return [name for name in self._features if name not in self._hidden]
+
+    def view(self, base):
+        return FeatureView(self, base)
+
+
+class FeatureView:
+    """
+    Read-only, column-style access to a base frame plus the graph's features.
+
+    ``view[name]`` returns a Series, ``view[[names]]`` a DataFrame. Base
+    columns are returned as-is, and features are computed on first access.
+    """
+
+    def __init__(self, graph, base):
+        self.graph = graph
+        self.base = base
+        self.index = base.index
+        self._values = {}
+        self._fingerprints = {}
+
+    def __contains__(self, name):
+        return name in self.base.columns or name in self.graph
+
+    def __getitem__(self, key):
+        if isinstance(key, (list, tuple)):
+            return pd.DataFrame({name: self[name] for name in key}, index=self.index)
+        if key in self.base.columns:
+            return self.base[key]
+        return self._compute(key)
+
+    def fingerprint(self, name):
+        """Hash of everything ``name`` is computed from"""
+        if name not in self._fingerprints:
+            if name in self.base.columns:
+                hashed = pd.util.hash_pandas_object(self.base[name], index=True).to_numpy()
+                parts = [hashed.tobytes()]
+            elif name in self.graph:
+                parts = [name.encode()] + [self.fingerprint(dep).encode() for dep in self.graph._features[name][1]]
+            else:
+                raise KeyError(f"{name!r} is neither a base column nor a feature of {self.graph.name}")
+            self._fingerprints[name] = hashlib.sha1(b'|'.join(parts)).hexdigest()
+        return self._fingerprints[name]
+
+    def _compute(self, name):
+        if name in self._values:
+            return self._values[name]
+        key = self.fingerprint(name)
+        graph = self.graph
+        with graph._lock:
+            memo = graph._memo.get(name)
+            if memo is not None and memo[0] == key:
+                value = memo[1]
+            else:
+                fn, deps = graph._features[name]
+                value = fn(*(self[dep] for dep in deps))
+                if name not in graph._hidden:
+                    value = pd.Series(value, index=self.index, name=name)
+                graph._memo[name] = (key, value)
+        self._values[name] = value
+        return value
+
+    def frame(self, names=None):
+        """Materialize base columns plus ``names`` (default: every feature)"""
+        names = self.graph.names if names is None else list(names)
+        return pd.concat([self.base, self[names]], axis=1)
@@ -0,0 +1,79 @@
+"""
+LRU cache of built chart figures.
+
+Building a Plotly figure (traces, shaded zones, annotated reference lines)
+costs far more than handing it to the browser. Widget interactions rerun the
+whole script, but the data behind most charts has not changed. FigureCache
+keys each chart on (chart id, data version, parameters) and keeps the built
+figure object. A rerun against the same data hands that object straight to
+st.plotly_chart, which only serializes it. The figure is kept rather than
+its to_dict(): st.plotly_chart validates a dict by building a new Figure
+from it, which costs most of a rebuild.
+
+Entries are shared by every session in the process, so callers must treat
+returned figures as read-only. The least recently used entries are evicted once
+``maxsize`` is reached. No plotting library is imported here.
+"""
+
+import threading
+from collections import OrderedDict
+
+
+def _freeze(value):
+    """Hashable stand-in for lists, dicts and arrays in chart parameters"""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if hasattr(value, 'tolist'):
+        return _freeze(value.tolist())
+    return value
+
+
+class FigureCache:
+    """Figures keyed on (chart id, data version, params), least recently used evicted first"""
+
+    def __init__(self, maxsize=64):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, chart_id, version, build, **params):
+        """
+        Figure of chart ``chart_id`` for data ``version``; ``build(**params)``
+        is only called on a miss. A ``version`` of None (data that has no
+        stable version, such as demo data) always builds and is not cached.
+        """
+        if version is None:
+            return build(**params)
+
+        key = (chart_id, version, _freeze(params))
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+
+        # Built outside the lock; two sessions racing on one key both build,
+        # and the later result simply replaces the earlier one
+        figure = build(**params)
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = figure
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return figure
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# Process-wide cache shared by both dashboards (chart ids are namespaced per app)
+FIGURES = FigureCache()
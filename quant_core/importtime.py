@@ -0,0 +1,71 @@
+"""
+Cold import benchmark.
+
+Each target is imported in a fresh interpreter ``repeat`` times, as an
+autoscaled worker would on spin-up. The report gives the median and best
+wall time of the import and which UI libraries (Plotly, Streamlit) it
+dragged in:
+
+    python -m quant_core.importtime
+    python -m quant_core.importtime quant_core.signals market_timing_fetcher --repeat 9
+
+Run from the repository root so the apps' modules are importable. pandas
+is listed first as the floor every compute module pays anyway.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+import pandas as pd
+
+TARGETS = [
+    'pandas',
+    'quant_core.signals',
+    'quant_core.dashboard',
+    'quant_core.scanner',
+    'quant_core.publish',
+    'market_timing_fetcher',
+]
+UI_MODULES = ('plotly', 'streamlit')
+
+_PROBE = """
+import sys, time
+started = time.perf_counter()
+import {target}
+elapsed = time.perf_counter() - started
+print(elapsed, ','.join(m for m in {ui!r} if m in sys.modules) or '-')
+"""
+
+
+def import_time(target, repeat=5):
+    """(seconds of each cold import of ``target``, UI modules it loaded)"""
+    probe = _PROBE.format(target=target, ui=UI_MODULES)
+    times = []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, '-c', probe], capture_output=True, text=True, check=True)
+        elapsed, loaded = out.stdout.strip().splitlines()[-1].split()
+        times.append(float(elapsed))
+    return times, loaded
+
+
+def benchmark(targets=TARGETS, repeat=5):
+    """One row per target: Median_ms, Best_ms and the UI_Modules it loaded"""
+    rows = {}
+    for target in targets:
+        times, loaded = import_time(target, repeat)
+        rows[target] = {'Median_ms': statistics.median(times) * 1000, 'Best_ms': min(times) * 1000, 'UI_Modules': loaded}
+    return pd.DataFrame.from_dict(rows, orient='index')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m quant_core.importtime', description=__doc__.strip().splitlines()[0])
+    parser.add_argument('targets', nargs='*', default=TARGETS, help='modules to import (default: %(default)s)')
+    parser.add_argument('--repeat', type=int, default=5, help='fresh interpreters per target (default: %(default)s)')
+    args = parser.parse_args(argv)
+    print(benchmark(args.targets, args.repeat).round(1).to_string())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+"""
+Indicator definitions for both dashboards, as lazy feature graphs.
+
+QUANT holds the app.py indicators, computed over the merged master frame.
+TECHNICAL holds market_timing_fetcher's Nifty indicators, computed over the
+daily frame. Each indicator lists the columns it reads. Adding one is a
+single decorated function, and it costs nothing until something reads it.
+"""
+
+import numpy as np
+
+from .features import FeatureGraph
+from .rolling_stats import Technicals, rolling_zscore, tail_technicals
+from .strategy import DEFAULT_PARAMS, master_codes, master_labels
+
+# ══════════════════════════════════════════════════════════════════════════════
+# QUANT SCANNER (app.py)
+# ══════════════════════════════════════════════════════════════════════════════
+
+QUANT = FeatureGraph('quant')
+
+
+# 1. Yield Gap (Fed Model)
+# Nifty Earnings Yield = 100 / PE
+# Gap = EY - Bond Yield. Negative = Stocks Expensive.
+@QUANT.feature('Earnings_Yield', ['Nifty_PE'])
+def _earnings_yield(nifty_pe):
+    return 100 / nifty_pe
+
+
+@QUANT.feature('Yield_Gap', ['Earnings_Yield', 'India_10Y'])
+def _yield_gap(earnings_yield, bond):
+    return earnings_yield - bond
+
+
+# 2. Valuation Spreads (Z-Scores)
+# Rolling 2-Year Mean/Std to normalize "Cheapness"
+# (one pass for both moments; reruns only push bars added since the last call)
+@QUANT.feature('Mid_Nifty_Ratio', ['Midcap_PE', 'Nifty_PE'])
+def _mid_nifty_ratio(midcap_pe, nifty_pe):
+    return midcap_pe / nifty_pe
+
+
+@QUANT.feature('Mid_Z', ['Mid_Nifty_Ratio'])
+def _mid_z(ratio):
+    return rolling_zscore(ratio, DEFAULT_PARAMS['z_window'], key='Mid_Z')
+
+
+@QUANT.feature('Small_Nifty_Ratio', ['Smallcap_PE', 'Nifty_PE'])
+def _small_nifty_ratio(smallcap_pe, nifty_pe):
+    return smallcap_pe / nifty_pe
+
+
+@QUANT.feature('Small_Z', ['Small_Nifty_Ratio'])
+def _small_z(ratio):
+    return rolling_zscore(ratio, DEFAULT_PARAMS['z_window'], key='Small_Z')
+
+
+# 3. Global Risk Regime
+# Gold/Nifty Ratio Trend
+@QUANT.feature('Gold_Nifty', ['Gold_Price', 'Nifty_Price'])
+def _gold_nifty(gold, nifty):
+    return gold / nifty
+
+
+@QUANT.feature('Risk_MA', ['Gold_Nifty'])
+def _risk_ma(gold_nifty):
+    return gold_nifty.rolling(DEFAULT_PARAMS['risk_ma']).mean()
+
+
+@QUANT.feature('Regime', ['Gold_Nifty', 'Risk_MA'])
+def _regime(gold_nifty, risk_ma):
+    return np.where(gold_nifty > risk_ma, "RISK OFF", "RISK ON")
+
+
+# 4. Master Signal Logic (thresholds and rule live in strategy.py)
+# IF Risk Off OR VIX > 22 -> GOLD/CASH
+# IF Risk On AND Midcap Cheap (Z < -1) -> MIDCAP
+# ELSE -> NIFTY
+@QUANT.feature('Signal', ['Regime', 'VIX', 'Mid_Z'])
+def _signal(regime, vix, mid_z):
+    return master_labels(master_codes(regime.eq("RISK OFF").to_numpy(), vix.to_numpy(), mid_z.to_numpy()))
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# TECHNICALS (market_timing_fetcher.py)
+# ══════════════════════════════════════════════════════════════════════════════
+
+TECHNICAL = FeatureGraph('technical')
+
+
+# All five come from one stateful calculator (rolling_stats.Technicals) that
+# reproduces the pandas formulas exactly. Once the full history has been run,
+# a refresh only pushes the bars appended since the last one. The five
+# features share a single run per data version.
+@TECHNICAL.features(Technicals.COLUMNS, ['Nifty50'])
+def _technicals(nifty):
+    return tail_technicals(nifty, key='Nifty50')
@@ -0,0 +1,53 @@
+"""
+Concurrent CSV ingestion.
+
+Both dashboards read several independent files at startup. Reading them one
+after another adds up every file's latency, which is slow on network-mounted
+storage. load_all runs the per-file loaders on a thread pool instead. File
+I/O and pandas' C parser release the GIL, and threads keep the parsed frames
+(including memory-mapped cache hits) in this process without pickling them.
+
+How long each file took on its last load is kept in TIMINGS.
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# I/O-bound work, so allow more threads than cores
+MAX_WORKERS = min(16, (os.cpu_count() or 1) * 4)
+
+# Seconds taken by each loader key on its most recent load, across calls
+TIMINGS = {}
+_timings_lock = threading.Lock()
+
+
+def _timed(load):
+    start = time.perf_counter()
+    try:
+        return load(), None, time.perf_counter() - start
+    except Exception as e:
+        return None, e, time.perf_counter() - start
+
+
+def load_all(loaders, max_workers=MAX_WORKERS):
+    """
+    Run every loader concurrently.
+
+    ``loaders`` maps keys to zero-argument callables, usually one per file.
+    Returns (results, errors), two dicts keyed like ``loaders``. A loader
+    that raised gets None in ``results`` and its exception in ``errors``,
+    so callers keep their own error handling. Timings go into TIMINGS.
+    """
+    if not loaders:
+        return {}, {}
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(loaders)))) as pool:
+        futures = {key: pool.submit(_timed, load) for key, load in loaders.items()}
+        outcomes = {key: future.result() for key, future in futures.items()}
+
+    with _timings_lock:
+        TIMINGS.update((key, seconds) for key, (_, _, seconds) in outcomes.items())
+    results = {key: result for key, (result, _, _) in outcomes.items()}
+    errors = {key: error for key, (_, error, _) in outcomes.items() if error is not None}
+    return results, errors
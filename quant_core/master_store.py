@@ -0,0 +1,203 @@
+"""
+Persisted master frame with an incremental append path.
+
+The master is the outer join of every source frame on date, forward-filled
+with leading gaps dropped. It is saved next to the CSV cache together with
+the size, mtime, date range and a digest of the rows of each source. On
+the next load, sources that only grew at the tail (the previous rows hash
+to the same digest, extra rows are dated after them) are detected and just
+the affected date range is rejoined and forward-filled, seeded from the
+last persisted row before it. Any other kind of change (edited history,
+new columns, missing state) falls back to a full rebuild.
+"""
+
+import hashlib
+import os
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from .csv_cache import CACHE_DIR, digest, read_frame, write_frame
+
+MASTER_DIR = os.path.join(CACHE_DIR, 'master')
+
+
+def merge_sources(frames, stats=None):
+    """
+    Outer-join source frames on date in a single pass.
+
+    The date indexes are unioned once into a shared calendar and every
+    frame's values are scattered into one preallocated float64 block, so the
+    cost grows linearly with the number of sources instead of re-aligning an
+    ever wider intermediate frame per join. Sources are expected to have
+    unique dates. If a ``stats`` dict is passed it is filled with the wall
+    time and peak traced memory of the merge.
+    """
+    if stats is not None:
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.reset_peak()
+        else:
+            tracemalloc.start()
+        started = time.perf_counter()
+
+    calendar = pd.DatetimeIndex(
+        np.unique(np.concatenate([df.index.values for df in frames])),
+        name=frames[0].index.name,
+    )
+    columns = [c for df in frames for c in df.columns]
+    block = np.full((len(calendar), len(columns)), np.nan)
+    col = 0
+    for df in frames:
+        width = len(df.columns)
+        block[calendar.get_indexer(df.index), col:col + width] = df.to_numpy(dtype='float64')
+        col += width
+    merged = pd.DataFrame(block, index=calendar, columns=columns, copy=False)
+
+    if stats is not None:
+        stats['wall_time_s'] = time.perf_counter() - started
+        stats['peak_bytes'] = tracemalloc.get_traced_memory()[1]
+        stats['rows'], stats['columns'] = block.shape
+        if not tracing:
+            tracemalloc.stop()
+    return merged
+
+
+def build_master(frames, stats=None):
+    """Outer-join source frames on date, forward-fill and drop leading gaps"""
+    return merge_sources(frames, stats).ffill().dropna()
+
+
+def _source_state(path, df):
+    stat = os.stat(path)
+    return {
+        'path': os.path.abspath(path),
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'rows': len(df),
+        'first': df.index[0].isoformat(),
+        'last': df.index[-1].isoformat(),
+        'history': _rows_digest(df),
+    }
+
+
+def _rows_digest(df):
+    """Digest of the dates and values of every row of ``df``"""
+    hashed = pd.util.hash_pandas_object(df, index=True).to_numpy()
+    return hashlib.sha1(hashed.tobytes()).hexdigest()
+
+
+def _append_start(old, new, df):
+    """
+    Return the first appended date of ``df`` given its previous state, None if
+    nothing was appended, or raise ValueError if the source changed in any
+    way other than growing at the tail.
+    """
+    if old['path'] != new['path']:
+        raise ValueError('source path changed')
+    if (old['size'], old['mtime_ns']) == (new['size'], new['mtime_ns']):
+        return None
+
+    rows = old['rows']
+    if (len(df) < rows
+            or df.index[0] != pd.Timestamp(old['first'])
+            or df.index[rows - 1] != pd.Timestamp(old['last'])
+            or _rows_digest(df.iloc[:rows]) != old['history']):
+        raise ValueError('source history changed')
+    if len(df) == rows:
+        # The file was rewritten without growing
+        raise ValueError('source rewritten in place')
+
+    appended = df.index[rows:]
+    if not (appended > pd.Timestamp(old['last'])).all():
+        raise ValueError('rows inserted before the previous tail')
+    return appended.min()
+
+
+def _previous_entry(store_dir, entry_dir):
+    """Most recent persisted master other than ``entry_dir``, if any"""
+    if not os.path.isdir(store_dir):
+        return None
+    candidates = [
+        os.path.join(store_dir, name) for name in os.listdir(store_dir)
+        if not name.startswith('.tmp-')
+    ]
+    candidates = [c for c in candidates if c != entry_dir and os.path.isdir(c)]
+    return max(candidates, key=os.path.getmtime) if candidates else None
+
+
+def _extend_master(master, frames, start, stats=None):
+    """Recompute ``master`` from ``start`` onward using the source frames"""
+    pos = master.index.searchsorted(start)
+    if pos == 0:
+        raise ValueError('append starts before the persisted history')
+
+    # Seeding the forward-fill with the last settled row makes the tail
+    # identical to what a full rebuild would produce
+    tail = merge_sources([df[df.index >= start] for df in frames], stats)
+    tail = pd.concat([master.iloc[pos - 1:pos], tail]).ffill().iloc[1:].dropna()
+    return pd.concat([master.iloc[:pos], tail])
+
+
+def update_master(sources, store_dir=None, rebuild=False, stats=None):
+    """
+    Return the master frame for ``sources``, a list of (csv_path, frame) pairs
+    in column order, reusing the persisted master where possible.
+
+    Cost is proportional to the rows appended since the last call rather than
+    to the full history. Pass ``rebuild=True`` to force a full rebuild.
+    ``store_dir`` defaults to a folder under MASTER_DIR per set of source
+    paths, so masters built from different data folders never evict each other.
+
+    A ``stats`` dict gets the path taken under 'mode' ('stored', 'append' or
+    'rebuild') plus merge_sources' wall time, peak memory and shape for the
+    merge that ran (only the appended range on the append path).
+    """
+    stats = {} if stats is None else stats
+    frames = [df for _, df in sources]
+    if any(df.empty for df in frames):
+        # A source failed to load; don't persist a degraded master
+        stats['mode'] = 'rebuild'
+        return build_master(frames, stats)
+    if store_dir is None:
+        store_dir = os.path.join(MASTER_DIR, digest(*[os.path.abspath(path) for path, _ in sources]))
+
+    states = [_source_state(path, df) for path, df in sources]
+    columns = [c for df in frames for c in df.columns]
+    entry_dir = os.path.join(store_dir, digest(
+        *[(s['path'], s['size'], s['mtime_ns']) for s in states], columns))
+
+    if not rebuild and os.path.isdir(entry_dir):
+        try:
+            master = read_frame(entry_dir)[0]
+            stats['mode'] = 'stored'
+            return master
+        except (OSError, ValueError, KeyError):
+            pass
+
+    master = None
+    previous = None if rebuild else _previous_entry(store_dir, entry_dir)
+    if previous is not None:
+        try:
+            old_master, meta = read_frame(previous)
+            if meta['columns'] != columns or len(meta['sources']) != len(sources):
+                raise ValueError('source layout changed')
+            starts = [
+                _append_start(old, new, df)
+                for old, new, df in zip(meta['sources'], states, frames)
+            ]
+            starts = [s for s in starts if s is not None]
+            master = _extend_master(old_master, frames, min(starts), stats) if starts else old_master
+            stats['mode'] = 'append' if starts else 'stored'
+        except (OSError, ValueError, KeyError, IndexError):
+            master = None
+
+    if master is None:
+        stats['mode'] = 'rebuild'
+        master = build_master(frames, stats)
+
+    write_frame(store_dir, entry_dir, master, sources=states)
+    return master
+
@@ -0,0 +1,138 @@
+"""
+Headless signal publisher for cron jobs and batch runs.
+
+Computes the latest signals of both dashboards without Streamlit or Plotly:
+
+    scanner    app.py's master strategy signal (quant_core.scanner)
+    dashboard  market_timing_fetcher.py's composite signal and market
+               regime for the latest month (quant_core.dashboard)
+
+and writes them as a JSON document and/or a one-row Parquet table (nested
+keys flattened to "scanner.Signal", "dashboard.Regime", ...):
+
+    python -m quant_core.publish --json signals.json --parquet signals.parquet
+    python -m quant_core.publish --data-dir /data/config_a --json -
+
+Source files are resolved against ``--data-dir`` (default: the current
+directory), so jobs for separate configs can run side by side. Parsed
+sources are cached in the shared csv_cache directory, keyed on each file's
+absolute path. Parquet output needs pyarrow or fastparquet.
+"""
+
+import argparse
+import json
+import math
+import sys
+import time
+
+import pandas as pd
+
+from .dashboard import create_dashboard_data, load_market_data
+from .scanner import FILES, data_version, load_master, run_quant_analysis
+
+# Latest-row columns published for each dashboard
+SCANNER_COLUMNS = ['Signal', 'Regime', 'VIX', 'Yield_Gap', 'Mid_Z', 'Small_Z']
+DASHBOARD_COLUMNS = [
+    'Composite_Signal', 'Composite_Score', 'Regime',
+    'ERP', 'ERP_Signal', 'VIX', 'VIX_Signal',
+    'Nifty50_PE', 'Nifty50_PE_Pct', 'PE_Signal', 'Drawdown',
+]
+
+
+def _scalar(value):
+    """JSON-ready Python value for one frame cell"""
+    if isinstance(value, pd.Timestamp):
+        return value.strftime('%Y-%m-%d')
+    if hasattr(value, 'item'):
+        value = value.item()
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    return value
+
+
+def _record(date, row, columns):
+    return {'Date': _scalar(date), **{col: _scalar(row[col]) for col in columns if col in row}}
+
+
+def scanner_signals(master):
+    """Latest master strategy signal for a ``load_master`` frame, as on app.py's header"""
+    df = run_quant_analysis(master)
+    columns = [col for col in SCANNER_COLUMNS if col in df]
+    latest = df[columns].iloc[-1]
+    return _record(latest.name, latest, columns)
+
+
+def dashboard_signals(data_dir='.'):
+    """Latest month's composite signal and market regime, as on market_timing_fetcher.py's header"""
+    _, monthly, _ = create_dashboard_data(load_market_data(data_dir))
+    if monthly is None or len(monthly) == 0:
+        raise ValueError("no Nifty 50 price history to build the dashboard from")
+    valid = monthly.dropna(subset=['Nifty50_PE'])
+    latest = (valid if len(valid) else monthly).iloc[-1]
+    return _record(latest['Date'], latest, DASHBOARD_COLUMNS)
+
+
+def latest_signals(data_dir='.'):
+    """
+    Both dashboards' latest signals, from the sources in ``data_dir``, as
+    one nested record. A side that cannot be computed is published as null
+    and its error is listed under "errors" rather than aborting the run.
+    How the scanner's master was merged (update_master's stats) is
+    reported under "merge".
+    """
+    started = time.perf_counter()
+    record = {'generated_at': pd.Timestamp.now().isoformat(timespec='seconds'),
+              'data_version': data_version(data_dir), 'scanner': None, 'dashboard': None, 'errors': {},
+              'merge': {}}
+    try:
+        master, load_errors = load_master(stats=record['merge'], data_dir=data_dir)
+        record['errors'].update({FILES[key]: str(e) for key, e in load_errors.items()})
+        record['scanner'] = scanner_signals(master)
+    except Exception as e:
+        record['errors']['scanner'] = str(e)
+    try:
+        record['dashboard'] = dashboard_signals(data_dir)
+    except Exception as e:
+        record['errors']['dashboard'] = str(e)
+    record['build_seconds'] = round(time.perf_counter() - started, 3)
+    return record
+
+
+def write_json(record, path):
+    text = json.dumps(record, indent=2, ensure_ascii=False)
+    if path == '-':
+        print(text)
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text + '\n')
+
+
+def write_parquet(record, path):
+    flat = pd.json_normalize({k: v for k, v in record.items() if k != 'errors'})
+    flat['errors'] = json.dumps(record['errors'], ensure_ascii=False)
+    flat.to_parquet(path, index=False)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m quant_core.publish', description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--data-dir', default='.', help='folder holding the source CSVs (default: current directory)')
+    parser.add_argument('--json', metavar='PATH', help="write the signals as JSON ('-' for stdout)")
+    parser.add_argument('--parquet', metavar='PATH', help='write the signals as a one-row Parquet table')
+    args = parser.parse_args(argv)
+    if not args.json and not args.parquet:
+        args.json = '-'
+
+    record = latest_signals(args.data_dir)
+    if args.json:
+        write_json(record, args.json)
+    if args.parquet:
+        write_parquet(record, args.parquet)
+
+    for source, error in record['errors'].items():
+        print(f"warning: {source}: {error}", file=sys.stderr)
+    # Non-zero exit when either dashboard's signal is missing
+    return 0 if record['scanner'] and record['dashboard'] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,88 @@
+"""
+Background data refresh with atomic snapshot swaps.
+
+A SnapshotRefresher rebuilds an expensive result (the dashboard frames) on a
+daemon thread every ``interval`` seconds. Readers always get the last
+complete snapshot straight away, so no page request waits for a reload. Only
+the very first build, before any snapshot exists, is done on the caller's
+thread.
+
+A new snapshot is built completely before it is published with a single
+reference assignment, which is atomic. Readers never see a half-built
+result, and snapshots are shared between sessions, so callers must treat
+them as read-only. If a rebuild fails, the previous snapshot stays in
+service and the error is kept in ``last_error``.
+"""
+
+import threading
+import time
+
+
+class Snapshot:
+    """One published result with its build metadata"""
+
+    __slots__ = ('data', 'version', 'built_at', 'build_seconds')
+
+    def __init__(self, data, version, built_at, build_seconds):
+        self.data = data
+        self.version = version
+        self.built_at = built_at
+        self.build_seconds = build_seconds
+
+
+class SnapshotRefresher:
+    """Serve the latest ``build()`` result while a daemon thread refreshes it"""
+
+    def __init__(self, build, interval=3600, name='snapshot-refresher'):
+        self.build = build
+        self.interval = interval
+        self.last_error = None
+        self._snapshot = None
+        self._first_build = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._loop, name=name, daemon=True)
+
+    def _rebuild(self):
+        start = time.perf_counter()
+        data = self.build()
+        previous = self._snapshot
+        version = previous.version + 1 if previous else 1
+        # Publish in one assignment so readers see the old or new snapshot, never a mix
+        self._snapshot = Snapshot(data, version, time.time(), time.perf_counter() - start)
+        self.last_error = None
+
+    def _loop(self):
+        while not self._stop.is_set():
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            try:
+                self._rebuild()
+            except Exception as e:
+                self.last_error = e
+
+    def snapshot(self):
+        """
+        The current Snapshot. The first call builds it synchronously and
+        starts the background thread; later calls never block.
+        """
+        if self._snapshot is None:
+            with self._first_build:
+                if self._snapshot is None:
+                    self._rebuild()
+                    self._thread.start()
+        return self._snapshot
+
+    def get(self):
+        """Data of the current snapshot"""
+        return self.snapshot().data
+
+    def refresh_now(self):
+        """Ask the background thread to rebuild without waiting for the interval"""
+        self._wake.set()
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
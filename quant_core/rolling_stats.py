@@ -0,0 +1,354 @@
+"""
+Incremental rolling mean/std engine.
+
+RollingMoments keeps a ring buffer of the last ``window`` values together
+with Welford running moments, so mean and sample std come out of one pass
+and a new bar is absorbed in O(1). ``run`` processes a whole history in a
+single vectorized pass and leaves the engine positioned at its last bar;
+``push`` then advances it one bar at a time. Results match pandas'
+``rolling(window).mean()`` / ``.std()`` (min_periods=window, ddof=1).
+
+rolling_zscore wraps the engine with process-level checkpoints so reruns
+over a series that only gained new bars resume from the previous state
+instead of recomputing every window. tail_technicals does the same for
+the Nifty SMA / all-time-high / drawdown / RSI indicators. Those are
+produced by the Technicals calculator, which replays pandas' own rolling
+arithmetic so its results are bit-for-bit identical to pandas.
+"""
+
+import math
+import threading
+from copy import deepcopy
+
+import numpy as np
+import pandas as pd
+
+
+class RollingMoments:
+    """Rolling mean and sample std over a fixed window with O(1) updates"""
+
+    def __init__(self, window):
+        if window < 2:
+            raise ValueError('window must be at least 2')
+        self.window = window
+        self.buffer = np.full(window, np.nan)
+        self.pos = 0          # next slot to overwrite
+        self.seen = 0         # bars pushed so far
+        self.count = 0        # non-NaN values in the window
+        self.mean = 0.0
+        self.m2 = 0.0
+        self._since_resync = 0
+
+    # ═══ ONE BAR AT A TIME ═══
+
+    def _add(self, x):
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+
+    def _remove(self, x):
+        self.count -= 1
+        if self.count == 0:
+            self.mean, self.m2 = 0.0, 0.0
+            return
+        delta = x - self.mean
+        self.mean -= delta / self.count
+        self.m2 -= delta * (x - self.mean)
+
+    def _resync(self):
+        """Recompute the moments exactly from the buffer to cancel drift"""
+        valid = self.buffer[~np.isnan(self.buffer)]
+        self.count = len(valid)
+        self.mean = valid.mean() if self.count else 0.0
+        self.m2 = ((valid - self.mean) ** 2).sum() if self.count else 0.0
+        self._since_resync = 0
+
+    def push(self, x):
+        """Advance one bar; returns (mean, std) of the window ending at ``x``"""
+        x = float(x)
+        if self.seen >= self.window:
+            old = self.buffer[self.pos]
+            if not np.isnan(old):
+                self._remove(old)
+        self.buffer[self.pos] = x
+        self.pos = (self.pos + 1) % self.window
+        self.seen += 1
+        if not np.isnan(x):
+            self._add(x)
+
+        self._since_resync += 1
+        if self._since_resync >= self.window:
+            self._resync()
+        return self.current()
+
+    def current(self):
+        """(mean, std) of the current window, NaN until it is full of values"""
+        if self.count < self.window:
+            return np.nan, np.nan
+        return self.mean, np.sqrt(max(self.m2, 0.0) / (self.window - 1))
+
+    # ═══ WHOLE HISTORY ═══
+
+    def run(self, values):
+        """
+        Push every value in ``values`` in one vectorized pass.
+
+        Returns (mean, std) arrays aligned with ``values``. The engine state
+        afterwards is the same as if each value had been pushed in turn.
+        """
+        values = np.asarray(values, dtype='float64')
+        n, w = len(values), self.window
+        if n == 0:
+            return np.array([]), np.array([])
+
+        # Include the tail of the current window so results continue seamlessly
+        carried = min(self.seen, w - 1)
+        history = np.concatenate([self._window_values()[w - carried:], values])
+
+        valid = ~np.isnan(history)
+        # Center before summing to keep the squared sums well conditioned
+        ref = history[valid].mean() if valid.any() else 0.0
+        centered = np.where(valid, history - ref, 0.0)
+        cs = np.concatenate([[0.0], np.cumsum(centered)])
+        cs2 = np.concatenate([[0.0], np.cumsum(centered * centered)])
+        cnt = np.concatenate([[0], np.cumsum(valid)])
+
+        end = np.arange(carried + 1, carried + n + 1)
+        start = end - w
+        full = start >= 0
+        start = np.maximum(start, 0)
+        s, s2 = cs[end] - cs[start], cs2[end] - cs2[start]
+        full &= (cnt[end] - cnt[start]) == w
+
+        mean = np.where(full, ref + s / w, np.nan)
+        var = np.maximum((s2 - s * s / w) / (w - 1), 0.0)
+        std = np.where(full, np.sqrt(var), np.nan)
+
+        # Leave the engine positioned at the last bar
+        tail = history[-w:]
+        self.buffer = np.full(w, np.nan)
+        self.buffer[w - len(tail):] = tail
+        self.pos = 0
+        self.seen += n
+        self._resync()
+        return mean, std
+
+    def _window_values(self):
+        """Current window in chronological order (oldest first)"""
+        return np.roll(self.buffer, -self.pos)
+
+    # ═══ CHECKPOINTS ═══
+
+    def state(self):
+        """JSON-serialisable snapshot of the engine"""
+        return {
+            'window': self.window,
+            'values': [None if np.isnan(v) else float(v) for v in self._window_values()],
+            'seen': self.seen,
+        }
+
+    @classmethod
+    def from_state(cls, state):
+        engine = cls(state['window'])
+        engine.buffer = np.array([np.nan if v is None else v for v in state['values']], dtype='float64')
+        engine.seen = state['seen']
+        engine._resync()
+        return engine
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# CHECKPOINTED Z-SCORES
+# ══════════════════════════════════════════════════════════════════════════════
+
+_checkpoints = {}
+_checkpoints_lock = threading.Lock()
+
+
+def rolling_zscore(series, window, key=None):
+    """
+    (series - rolling mean) / rolling std, computed in one pass.
+
+    With a ``key`` the engine state is checkpointed per process. When the
+    next call's series starts with exactly the values seen last time, only
+    the new bars are pushed through the engine.
+    """
+    values = series.to_numpy(dtype='float64', copy=True)
+    checkpoint = None
+    if key is not None:
+        with _checkpoints_lock:
+            checkpoint = _checkpoints.get((key, window))
+
+    if (checkpoint is not None
+            and len(values) >= len(checkpoint['values'])
+            and np.array_equal(values[:len(checkpoint['values'])], checkpoint['values'], equal_nan=True)):
+        done = len(checkpoint['values'])
+        engine = deepcopy(checkpoint['engine'])
+        new = values[done:]
+        if len(new) < window:
+            # A few new bars: step the ring buffer rather than re-slicing the window
+            moments = np.array([engine.push(v) for v in new]).reshape(-1, 2)
+            mean, std = moments[:, 0], moments[:, 1]
+        else:
+            mean, std = engine.run(new)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            z = np.concatenate([checkpoint['z'], (new - mean) / std])
+    else:
+        engine = RollingMoments(window)
+        mean, std = engine.run(values)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            z = (values - mean) / std
+
+    if key is not None:
+        with _checkpoints_lock:
+            _checkpoints[(key, window)] = {'values': values, 'engine': engine, 'z': z}
+    # Hand out a copy so callers can't corrupt the checkpoint
+    return pd.Series(z.copy(), index=series.index, name=series.name)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# PANDAS-EXACT TECHNICALS
+# ══════════════════════════════════════════════════════════════════════════════
+
+class RollingMean:
+    """
+    Rolling mean with O(1) updates, bit-for-bit equal to pandas'
+    ``rolling(window).mean()``.
+
+    pandas slides one Kahan-compensated running sum through the series,
+    with separate compensation terms for values entering and leaving the
+    window. It also snaps runs of identical values and sign-consistent
+    windows to exact results. This class replays that arithmetic step by
+    step, so it can continue a series from saved state.
+    """
+
+    def __init__(self, window):
+        self.window = window
+        self.buffer = [math.nan] * window
+        self.pos = 0
+        self.seen = 0
+        self.nobs = 0
+        self.sum = 0.0
+        self.neg_ct = 0
+        self.comp_add = 0.0
+        self.comp_remove = 0.0
+        self.same_run = 0
+        self.prev = math.nan
+
+    def push(self, x):
+        """Advance one bar; returns the mean of the window ending at ``x``"""
+        if self.seen == 0:
+            self.prev = x
+        elif self.seen >= self.window:
+            old = self.buffer[self.pos]
+            if old == old:
+                self.nobs -= 1
+                y = -old - self.comp_remove
+                t = self.sum + y
+                self.comp_remove = t - self.sum - y
+                self.sum = t
+                if math.copysign(1.0, old) < 0:
+                    self.neg_ct -= 1
+        self.buffer[self.pos] = x
+        self.pos = (self.pos + 1) % self.window
+        self.seen += 1
+
+        if x == x:
+            self.nobs += 1
+            y = x - self.comp_add
+            t = self.sum + y
+            self.comp_add = t - self.sum - y
+            self.sum = t
+            if math.copysign(1.0, x) < 0:
+                self.neg_ct += 1
+            self.same_run = self.same_run + 1 if x == self.prev else 1
+            self.prev = x
+
+        if self.nobs < self.window:
+            return math.nan
+        if self.same_run >= self.nobs:
+            return self.prev
+        mean = self.sum / self.nobs
+        if (self.neg_ct == 0 and mean < 0) or (self.neg_ct == self.nobs and mean > 0):
+            return 0.0
+        return mean
+
+
+class Technicals:
+    """
+    Stateful SMA / all-time-high / drawdown / RSI calculator for one price
+    series. Each new bar is absorbed in O(1), and the outputs equal these
+    pandas formulas exactly (gain/loss are the positive/negative daily moves):
+
+        SMA_n    = close.rolling(n).mean()
+        ATH      = close.expanding().max()
+        Drawdown = (close / ATH - 1) * 100
+        RSI      = 100 - 100 / (1 + gain.rolling(14).mean() / loss.rolling(14).mean())
+    """
+
+    COLUMNS = ('SMA_50', 'SMA_200', 'ATH', 'Drawdown', 'RSI')
+
+    def __init__(self, sma_windows=(50, 200), rsi_window=14):
+        self.smas = {f'SMA_{w}': RollingMean(w) for w in sma_windows}
+        self.gain = RollingMean(rsi_window)
+        self.loss = RollingMean(rsi_window)
+        self.ath = math.nan
+        self.last = math.nan
+        self.seen = 0
+
+    def run(self, values):
+        """Push every value in ``values``; returns {column: array} for those bars"""
+        values = np.asarray(values, dtype='float64')
+        out = {name: np.empty(len(values)) for name in self.smas}
+        ath, gain, loss = np.empty(len(values)), np.empty(len(values)), np.empty(len(values))
+        for i, x in enumerate(values.tolist()):
+            for name, sma in self.smas.items():
+                out[name][i] = sma.push(x)
+            if x == x and not x <= self.ath:
+                self.ath = x
+            ath[i] = self.ath
+            delta = x - self.last if self.seen else math.nan
+            # delta.where(delta > 0, 0) and -(delta.where(delta < 0, 0)), sign of zero included
+            gain[i] = self.gain.push(delta if delta > 0 else 0.0)
+            loss[i] = self.loss.push(-delta if delta < 0 else -0.0)
+            self.last = x
+            self.seen += 1
+
+        out['ATH'] = ath
+        with np.errstate(divide='ignore', invalid='ignore'):
+            out['Drawdown'] = ((values / ath) - 1) * 100
+            out['RSI'] = 100 - (100 / (1 + gain / loss))
+        return out
+
+
+_technicals = {}
+
+
+def tail_technicals(series, key=None):
+    """
+    Technicals columns for ``series`` as {column: Series}.
+
+    With a ``key`` the calculator state is checkpointed per process, as in
+    rolling_zscore. When the series starts with exactly the values seen last
+    time, only the new bars are pushed through it.
+    """
+    values = series.to_numpy(dtype='float64', copy=True)
+    checkpoint = None
+    if key is not None:
+        with _checkpoints_lock:
+            checkpoint = _technicals.get(key)
+
+    if (checkpoint is not None
+            and len(values) >= len(checkpoint['values'])
+            and np.array_equal(values[:len(checkpoint['values'])], checkpoint['values'], equal_nan=True)):
+        calc = deepcopy(checkpoint['calc'])
+        new = calc.run(values[len(checkpoint['values']):])
+        columns = {name: np.concatenate([checkpoint['columns'][name], new[name]]) for name in new}
+    else:
+        calc = Technicals()
+        columns = calc.run(values)
+
+    if key is not None:
+        with _checkpoints_lock:
+            _technicals[key] = {'values': values, 'calc': calc, 'columns': columns}
+    return {name: pd.Series(col.copy(), index=series.index, name=name) for name, col in columns.items()}
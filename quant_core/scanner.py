@@ -0,0 +1,85 @@
+"""
+Data pipeline behind app.py (the institutional market scanner).
+
+load_master merges the scanner's ten sources into one daily master frame.
+run_quant_analysis layers the QUANT indicators over it as a lazy view.
+Neither needs Streamlit, so batch jobs can build the same frames.
+"""
+
+import os
+from functools import partial
+
+import pandas as pd
+
+from .csv_cache import source_version
+from .indicators import QUANT
+from .ingest import load_all
+from .master_store import update_master
+from .sources import source_column
+
+# --- A. Define File Paths ---
+FILES = {
+    'Global_Gold': 'gold_data.csv',
+    'Global_SP500': 'sp500_data.csv',
+    'Global_US10Y': 'us10y_data.csv',
+    'Domestic_Nifty_Price': 'Nifty50_Historical_Yahoo.csv',
+    'Domestic_Midcap_Price': 'NIFTY_MIDCAP_100_Historical_Yahoo.csv',
+    'Domestic_VIX': 'India_VIX_Yahoo.csv',
+    'Domestic_Bond': 'Nifty_10Y_Benchmark_GSec_Merged.csv',
+    'Val_Nifty': 'Nifty50_PE_PB_Div_Merged.csv',
+    'Val_Midcap': 'NiftyMidcap100_PE_PB_Div_Merged.csv',
+    'Val_Smallcap': 'NiftySmallcap250_PE_PB_Div_Merged.csv'
+}
+
+# Master column each file's value column (declared in schemas.py) becomes
+MASTER_COLUMNS = {
+    # Domestic Prices
+    'Domestic_Nifty_Price': 'Nifty_Price',
+    'Domestic_Midcap_Price': 'Midcap_Price',
+    # Global
+    'Global_Gold': 'Gold_Price',
+    'Global_SP500': 'SP500_Price',
+    'Global_US10Y': 'US10Y',
+    # Domestic Risk & Rates
+    'Domestic_VIX': 'VIX',
+    'Domestic_Bond': 'India_10Y',
+    # Domestic Valuations (Need PE)
+    'Val_Nifty': 'Nifty_PE',
+    'Val_Midcap': 'Midcap_PE',
+    'Val_Smallcap': 'Smallcap_PE',
+}
+
+
+def data_version(data_dir='.'):
+    """Tag that changes whenever any of the scanner's source files in ``data_dir`` does"""
+    return source_version(os.path.join(data_dir, name) for name in FILES.values())
+
+
+def load_master(stats=None, data_dir='.'):
+    """
+    Merge every source in ``data_dir`` into the master frame.
+
+    Returns (master, errors). ``errors`` maps the key of each file that
+    failed to load to its exception; such files contribute an empty frame.
+    A ``stats`` dict is filled with the merge report of update_master.
+    """
+    paths = {key: os.path.join(data_dir, FILES[key]) for key in MASTER_COLUMNS}
+    # Files come from the shared source cache, loaded concurrently
+    frames, errors = load_all({key: partial(source_column, paths[key], rename_to)
+                               for key, rename_to in MASTER_COLUMNS.items()})
+    for key in errors:
+        frames[key] = pd.DataFrame()
+
+    # Rows appended since the last run are joined onto the persisted master;
+    # any other change to a source triggers a full rebuild
+    sources = [(paths[key], frames[key]) for key in MASTER_COLUMNS]
+    return update_master(sources, stats=stats), errors
+
+
+def run_quant_analysis(master):
+    """
+    Master columns plus the QUANT indicators (indicators.py) as a read-only
+    view; indicators are computed on first access and memoized until their
+    inputs change, and ``master`` itself is never modified
+    """
+    return QUANT.view(master)
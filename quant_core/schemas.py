@@ -0,0 +1,72 @@
+"""
+Declared schema of every input CSV.
+
+Each file is registered with its date column and exact date format, the
+columns the dashboards read with their dtypes, and its main value column.
+load_frame parses only those columns with fixed dtypes and a fixed date
+format. Nothing is inferred and there is no parse-and-retry fallback, so a
+file that no longer matches its schema fails loudly instead of being
+silently misread.
+"""
+
+import os
+
+import pandas as pd
+
+ISO_DATE = '%Y-%m-%d'
+
+
+def _schema(dtypes, value_col, date_col='Date', date_format=ISO_DATE):
+    return {'date_col': date_col, 'date_format': date_format, 'dtypes': dtypes, 'value_col': value_col}
+
+
+_OHLC = {'Open': 'float64', 'High': 'float64', 'Low': 'float64', 'Close': 'float64'}
+_VALUATION = {'PE': 'float64', 'PB': 'float64', 'DivYield': 'float64'}
+
+# Keyed by file name
+SCHEMAS = {
+    # Yahoo Finance price history
+    'Nifty50_Historical_Yahoo.csv': _schema(_OHLC, 'Close'),
+    'NIFTY_MIDCAP_100_Historical_Yahoo.csv': _schema(_OHLC, 'Close'),
+    'India_VIX_Yahoo.csv': _schema(
+        {'VIX_Open': 'float64', 'VIX_High': 'float64', 'VIX_Low': 'float64', 'VIX_Close': 'float64'},
+        'VIX_Close'),
+    # Open/High/Low use '-' for missing quotes and are not read
+    'Nifty_10Y_Benchmark_GSec_Merged.csv': _schema({'Close': 'float64'}, 'Close'),
+
+    # Global series
+    'gold_data.csv': _schema({'Gold': 'float64'}, 'Gold'),
+    'sp500_data.csv': _schema({'SP500': 'float64'}, 'SP500'),
+    'us10y_data.csv': _schema({'US10Y_Yield': 'float64'}, 'US10Y_Yield'),
+
+    # Index valuations
+    'Nifty50_PE_PB_Div_Merged.csv': _schema(_VALUATION, 'PE'),
+    'NiftyMidcap100_PE_PB_Div_Merged.csv': _schema(_VALUATION, 'PE'),
+    'NiftySmallcap250_PE_PB_Div_Merged.csv': _schema(_VALUATION, 'PE'),
+    'Nifty_Index_Valuation_History.csv': _schema(
+        {'Index': 'str', 'PE_Ratio': 'float64', 'PB_Ratio': 'float64', 'Div_Yield': 'float64'},
+        'PE_Ratio'),
+}
+
+
+def schema_for(path):
+    name = os.path.basename(path)
+    if name not in SCHEMAS:
+        raise KeyError(f"No schema registered for {name}")
+    return SCHEMAS[name]
+
+
+def load_frame(path, columns=None):
+    """
+    Parse ``path`` using its registered schema.
+
+    Reads the date column plus ``columns`` (default: every declared column)
+    in file order, with declared dtypes. Dates are parsed with the schema's
+    fixed format.
+    """
+    schema = schema_for(path)
+    date_col = schema['date_col']
+    dtypes = schema['dtypes'] if columns is None else {c: schema['dtypes'][c] for c in columns}
+    df = pd.read_csv(path, usecols=[date_col, *dtypes], dtype=dtypes)
+    df[date_col] = pd.to_datetime(df[date_col], format=schema['date_format'])
+    return df
@@ -0,0 +1,38 @@
+"""
+Deferred dashboard sections: only the selected tab does any work.
+
+Plain st.tabs runs the body of every tab on each script run, so the
+first paint waits for charts and backtests the user has not opened.
+Tabs created with a ``key`` and ``on_change='rerun'`` know which one is
+selected (``tab.open``), and selecting another tab reruns the script.
+deferred_tabs creates them, and render_deferred pairs them with one
+callable per section and runs only the open one:
+
+    tabs = deferred_tabs(st.tabs, labels, key='main_tab')
+    render_deferred(tabs, [valuations, sentiment, backtest], df)
+
+Hidden tabs stay empty until they are selected, so anything expensive
+behind them should be cached (st.cache_resource, FIGURES) to make
+switching back instant. Streamlit releases whose st.tabs predates ``key``
+and ``on_change`` get plain tabs instead, and every tab without an
+``open`` state (or with ``open`` None) renders eagerly, exactly like plain
+st.tabs. Nothing here imports Streamlit; st.tabs and the tab containers
+are passed in.
+"""
+
+
+def deferred_tabs(make_tabs, labels, key):
+    """``make_tabs(labels)`` tracking the selected tab where the Streamlit version supports it"""
+    try:
+        return make_tabs(labels, key=key, on_change='rerun')
+    except TypeError:
+        return make_tabs(labels)
+
+
+def render_deferred(tabs, sections, *args):
+    """Run ``section(*args)`` inside its tab, skipping tabs that are not selected"""
+    for tab, section in zip(tabs, sections):
+        if getattr(tab, 'open', None) is False:
+            continue
+        with tab:
+            section(*args)
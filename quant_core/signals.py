@@ -0,0 +1,190 @@
+"""
+Vectorized signal classifiers.
+
+Each function takes a whole column (array, Series or scalar) and returns
+label / score / style arrays in one np.digitize or np.select pass. The
+scalar get_* helpers at the bottom classify a single value with the same
+thresholds; market_timing_fetcher.py uses them for its header.
+"""
+
+import numpy as np
+
+NO_DATA = ('NO DATA', 0, '#64748b')
+
+# Bin edges and the (label, score, color) for each bin, lowest bin first
+
+ERP_BINS = [-1.5, 0, 1.5, 3]                    # erp > edge moves up a bin
+ERP_LEVELS = [
+    ('VERY EXPENSIVE', -2, '#ef4444'),
+    ('EXPENSIVE', -1, '#f97316'),
+    ('FAIR', 0, '#f59e0b'),
+    ('CHEAP', 1, '#34d399'),
+    ('VERY CHEAP', 2, '#10b981'),
+]
+
+VIX_BINS = [12, 15, 20, 25, 30]                 # vix > edge moves up a bin
+VIX_LEVELS = [
+    ('COMPLACENCY', -1, '#ef4444'),
+    ('NORMAL', 0, '#64748b'),
+    ('ELEVATED', 0.5, '#f59e0b'),
+    ('FEAR', 1, '#84cc16'),
+    ('HIGH FEAR', 1.5, '#34d399'),
+    ('EXTREME FEAR', 2, '#10b981'),
+]
+
+PE_BINS = [20, 40, 60, 80]                      # pe_pct >= edge moves up a bin
+PE_LEVELS = [
+    ('VERY CHEAP', 2),
+    ('CHEAP', 1),
+    ('FAIR', 0),
+    ('EXPENSIVE', -1),
+    ('VERY EXPENSIVE', -2),
+]
+
+COMPOSITE_WEIGHTS = (0.35, 0.35, 0.30)          # erp, vix, pe
+COMPOSITE_BINS = [-1.25, -0.75, -0.25, 0.25, 0.75, 1.5]   # composite >= edge moves up a bin
+COMPOSITE_LEVELS = [
+    ('SELL', 'signal-sell'),
+    ('REDUCE', 'signal-sell'),
+    ('TRIM', 'signal-trim'),
+    ('HOLD', 'signal-hold'),
+    ('ACCUMULATE', 'signal-hold'),
+    ('BUY', 'signal-buy'),
+    ('AGGRESSIVE BUY', 'signal-buy'),
+]
+
+REGIMES = [
+    ('🎯 IDEAL BOTTOM', 'regime-bull'),
+    ('📉 CRASH MODE', 'regime-bear'),
+    ('🚀 BULL RUN', 'regime-bull'),
+    ('⚠️ MARKET TOP', 'regime-bear'),
+    ('📈 RECOVERY', 'regime-neutral'),
+]
+DEFAULT_REGIME = ('↔️ TRANSITIONAL', 'regime-neutral')
+
+
+def _lookup(levels, idx, missing=None, fallback=None):
+    """Turn bin indexes into one array per field of ``levels``; rows in ``missing`` get ``fallback``"""
+    fields = []
+    for i, values in enumerate(zip(*levels)):
+        out = np.array(values, dtype=object if isinstance(values[0], str) else 'float64')[idx]
+        if missing is not None:
+            out[missing] = fallback[i]
+        fields.append(out)
+    return tuple(fields)
+
+
+def _as_float(values):
+    return np.atleast_1d(np.asarray(values, dtype='float64'))
+
+
+def erp_signals(erp):
+    """(labels, scores, colors) for an array of ERP values"""
+    erp = _as_float(erp)
+    idx = np.digitize(erp, ERP_BINS, right=True)
+    return _lookup(ERP_LEVELS, idx, np.isnan(erp), NO_DATA)
+
+
+def vix_signals(vix):
+    """(labels, scores, colors) for an array of VIX levels"""
+    vix = _as_float(vix)
+    idx = np.digitize(vix, VIX_BINS, right=True)
+    return _lookup(VIX_LEVELS, idx, np.isnan(vix), NO_DATA)
+
+
+def pe_signals(pe_pct):
+    """(labels, scores) for an array of PE percentiles"""
+    pe_pct = _as_float(pe_pct)
+    idx = np.digitize(pe_pct, PE_BINS)
+    return _lookup(PE_LEVELS, idx, np.isnan(pe_pct), NO_DATA)
+
+
+def composite_scores(erp_score, vix_score, pe_score, weights=COMPOSITE_WEIGHTS):
+    """Weighted composite of the three component scores"""
+    w_erp, w_vix, w_pe = weights
+    return _as_float(erp_score) * w_erp + _as_float(vix_score) * w_vix + _as_float(pe_score) * w_pe
+
+
+def composite_signals(erp_score, vix_score, pe_score, weights=COMPOSITE_WEIGHTS):
+    """(labels, composite scores, css classes) for arrays of component scores"""
+    composite = composite_scores(erp_score, vix_score, pe_score, weights)
+    # NaN fails every >= test in the scalar chain and lands in the bottom bin
+    idx = np.where(np.isnan(composite), 0, np.digitize(composite, COMPOSITE_BINS))
+    labels, classes = _lookup(COMPOSITE_LEVELS, idx)
+    return labels, composite, classes
+
+
+def market_regimes(vix, erp_score, drawdown):
+    """(labels, css classes) for arrays of VIX, ERP score and drawdown"""
+    vix = _as_float(vix)
+    drawdown = _as_float(drawdown)
+    erp_score = _as_float(erp_score)
+    vix = np.where(np.isnan(vix), 15, vix)
+    drawdown = np.where(np.isnan(drawdown), 0, drawdown)
+
+    conditions = [
+        (erp_score >= 1) & (vix > 25) & (drawdown < -15),
+        (vix > 30) & (drawdown < -20),
+        (vix < 15) & (drawdown > -5),
+        (vix < 12) & (erp_score <= -1),
+        (drawdown > -20) & (drawdown < -10),
+    ]
+    idx = np.select(conditions, list(range(len(REGIMES))), default=len(REGIMES))
+    return _lookup(REGIMES + [DEFAULT_REGIME], idx)
+
+
+def signal_columns(erp, vix, pe_pct, drawdown, weights=COMPOSITE_WEIGHTS):
+    """
+    Every component signal plus the composite and regime for aligned columns.
+
+    Returns a dict of arrays ready for ``DataFrame.assign``, computed in one
+    vectorized pass over the whole history.
+    """
+    erp_label, erp_score, _ = erp_signals(erp)
+    vix_label, vix_score, _ = vix_signals(vix)
+    pe_label, pe_score = pe_signals(pe_pct)
+    composite_label, composite, _ = composite_signals(erp_score, vix_score, pe_score, weights)
+    regime, _ = market_regimes(vix, erp_score, drawdown)
+    return {
+        'ERP_Signal': erp_label,
+        'ERP_Score': erp_score,
+        'VIX_Signal': vix_label,
+        'VIX_Score': vix_score,
+        'PE_Signal': pe_label,
+        'PE_Score': pe_score,
+        'Composite_Score': composite,
+        'Composite_Signal': composite_label,
+        'Regime': regime,
+    }
+
+
+# Scalar helpers: one value in, one (label, score, ...) tuple out
+
+def _first(arrays):
+    """Unwrap the single row of a vectorized classifier result"""
+    return tuple(a[0].item() if hasattr(a[0], 'item') else a[0] for a in arrays)
+
+
+def get_erp_signal(erp):
+    """Calculate ERP signal"""
+    return _first(erp_signals(erp))
+
+
+def get_vix_signal(vix):
+    """Calculate VIX signal"""
+    return _first(vix_signals(vix))
+
+
+def get_pe_signal(pe_pct):
+    """Calculate PE percentile signal"""
+    return _first(pe_signals(pe_pct))
+
+
+def get_composite_signal(erp_score, vix_score, pe_score):
+    """Calculate composite signal"""
+    return _first(composite_signals(erp_score, vix_score, pe_score))
+
+
+def get_market_regime(vix, erp_score, drawdown):
+    """Determine market regime"""
+    return _first(market_regimes(vix, erp_score, drawdown))
@@ -0,0 +1,59 @@
+"""
+Shared source cache: every input CSV is loaded once and shared by all callers.
+
+load_source(path) returns the file's declared columns (schemas.py) as a
+date-indexed frame. Frames are memoized per process, keyed on the file's
+size and mtime. app.py, market_timing_fetcher.py and batch scripts running
+in one process therefore parse and hold each file once. Numeric sources
+also go through the on-disk csv_cache under a key that depends only on the
+schema. Separate processes then map the same cached arrays and share them
+through the OS page cache instead of each keeping a parsed copy.
+
+Frames are shared, so treat them as read-only; select or copy columns
+before modifying anything.
+"""
+
+import os
+import threading
+
+from .csv_cache import load_cached
+from .schemas import load_frame, schema_for
+
+_frames = {}        # absolute path -> ((size, mtime_ns), frame)
+_locks = {}         # absolute path -> lock, so each file is parsed by one thread
+_registry_lock = threading.Lock()
+
+
+def _path_lock(path):
+    with _registry_lock:
+        return _locks.setdefault(path, threading.Lock())
+
+
+def load_source(path):
+    """Date-indexed frame of every column declared for ``path``, loaded at most once per file version"""
+    key = os.path.abspath(path)
+    stat = os.stat(path)
+    state = (stat.st_size, stat.st_mtime_ns)
+
+    with _path_lock(key):
+        cached = _frames.get(key)
+        if cached is not None and cached[0] == state:
+            return cached[1]
+
+        schema = schema_for(path)
+        df = load_cached(path, lambda: load_frame(path).set_index(schema['date_col']), key=schema)
+        _frames[key] = (state, df)
+        return df
+
+
+def source_column(path, rename_to=None):
+    """One-column frame with the file's declared value column, optionally renamed"""
+    value_col = schema_for(path)['value_col']
+    df = load_source(path)[[value_col]]
+    return df.rename(columns={value_col: rename_to}) if rename_to else df
+
+
+def clear_sources():
+    """Drop every in-process frame (the disk cache is left alone)"""
+    with _registry_lock:
+        _frames.clear()
@@ -0,0 +1,59 @@
+"""
+Master switching strategy from app.py as pure array functions.
+
+Keeping the rule here (rather than inline in the Streamlit script) lets the
+backtest, parameter sweeps and batch jobs evaluate it with different
+thresholds without importing any UI code.
+"""
+
+import numpy as np
+
+# Asset codes double as indexes into SIGNAL_LABELS and the returns matrix
+NIFTY, MIDCAP, GOLD = range(3)
+
+SIGNAL_LABELS = ["🏢 NIFTY 50", "🚀 MIDCAPS", "🛡️ GOLD / CASH"]
+
+# Master signal labels and the price series each one holds in the backtest
+SIGNAL_ASSETS = dict(zip(SIGNAL_LABELS, ['Nifty_Price', 'Midcap_Price', 'Gold_Price']))
+
+DEFAULT_PARAMS = {
+    'vix_cut': 22,          # VIX above this -> gold / cash
+    'mid_z_cut': -1.0,      # Midcap/Nifty PE z-score below this -> midcaps
+    'risk_ma': 200,         # Gold/Nifty trend window for the risk regime
+    'z_window': 252 * 2,    # rolling window for the valuation z-scores
+}
+
+
+def master_codes(risk_off, vix, mid_z, vix_cut=DEFAULT_PARAMS['vix_cut'],
+                 mid_z_cut=DEFAULT_PARAMS['mid_z_cut']):
+    """
+    Asset code per bar for the master signal.
+
+    IF Risk Off OR VIX > vix_cut -> GOLD/CASH
+    IF Risk On AND Midcap Cheap (Z < mid_z_cut) -> MIDCAP
+    ELSE -> NIFTY
+    """
+    risk_off = np.asarray(risk_off, dtype=bool)
+    conditions = [
+        risk_off | (np.asarray(vix) > vix_cut),
+        ~risk_off & (np.asarray(mid_z) < mid_z_cut),
+    ]
+    return np.select(conditions, [GOLD, MIDCAP], default=NIFTY)
+
+
+def master_labels(codes):
+    """Signal labels for an array of asset codes"""
+    return np.array(SIGNAL_LABELS, dtype=object)[codes]
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# COMPOSITE TIMING
+# ══════════════════════════════════════════════════════════════════════════════
+
+# Composite score below this (TRIM or worse on the dashboard scale) -> gold / cash
+COMPOSITE_CUT = -0.25
+
+
+def composite_codes(composite, cut=COMPOSITE_CUT):
+    """Asset code per bar when timing Nifty with the dashboard composite score"""
+    return np.where(np.asarray(composite) < cut, GOLD, NIFTY)
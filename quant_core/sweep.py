@@ -0,0 +1,193 @@
+"""
+Parallel parameter sweeps for the master and composite strategies.
+
+The master frame's input columns are copied once into a shared-memory block
+that every worker process maps read-only, so only small parameter dicts
+travel through the pool. Within a worker, rolling statistics are memoized
+per window, and the grid is ordered so that each chunk mostly reuses them.
+
+Example::
+
+    grid = param_grid(vix_cut=[18, 20, 22, 25], mid_z_cut=[-1.5, -1.0, -0.5],
+                      risk_ma=[100, 150, 200], z_window=[252, 504])
+    results = run_sweep(master, grid)           # ranked by Sharpe
+"""
+
+import itertools
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from .backtest import backtest_codes, summary_stats
+from .rolling_stats import RollingMoments
+from .signals import COMPOSITE_WEIGHTS, composite_scores, erp_signals, pe_signals, vix_signals
+from .strategy import COMPOSITE_CUT, DEFAULT_PARAMS, composite_codes, master_codes
+
+# Master frame columns the strategies read
+SHARED_COLUMNS = ['Nifty_Price', 'Midcap_Price', 'Gold_Price', 'VIX', 'Nifty_PE', 'Midcap_PE', 'India_10Y']
+
+COMPOSITE_DEFAULTS = {'weights': COMPOSITE_WEIGHTS, 'composite_cut': COMPOSITE_CUT}
+
+# Per-process state: the mapped data columns plus memoized rolling series
+_worker = {}
+
+
+def param_grid(**axes):
+    """Cartesian product of parameter axes as a list of dicts"""
+    names = list(axes)
+    return [dict(zip(names, values)) for values in itertools.product(*axes.values())]
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# WORKER SIDE
+# ══════════════════════════════════════════════════════════════════════════════
+
+def _bind(block, columns, shm=None):
+    _worker.clear()
+    _worker['shm'] = shm
+    _worker['data'] = {c: block[:, i] for i, c in enumerate(columns)}
+    _worker['memo'] = {}
+    prices = block[:, [columns.index(c) for c in ('Nifty_Price', 'Midcap_Price', 'Gold_Price')]]
+    # Prices are in strategy asset-code order (NIFTY, MIDCAP, GOLD)
+    returns = np.zeros_like(prices)
+    returns[1:] = prices[1:] / prices[:-1] - 1
+    _worker['returns'] = np.nan_to_num(returns, nan=0.0)
+
+
+def _attach(name, shape, columns):
+    """Pool initializer: map the shared block instead of unpickling a copy"""
+    shm = shared_memory.SharedMemory(name=name)
+    _bind(np.ndarray(shape, dtype='float64', buffer=shm.buf), columns, shm)
+
+
+def bound_returns():
+    """Asset returns matrix (NIFTY, MIDCAP, GOLD columns) for the bound data"""
+    return _worker['returns']
+
+
+def _memo(key, compute):
+    memo = _worker['memo']
+    if key not in memo:
+        memo[key] = compute()
+    return memo[key]
+
+
+def _mid_z(window):
+    def compute():
+        data = _worker['data']
+        ratio = data['Midcap_PE'] / data['Nifty_PE']
+        mean, std = RollingMoments(window).run(ratio)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return (ratio - mean) / std
+    return _memo(('mid_z', window), compute)
+
+
+def _risk_off(window):
+    def compute():
+        data = _worker['data']
+        gold_nifty = data['Gold_Price'] / data['Nifty_Price']
+        ma = RollingMoments(window).run(gold_nifty)[0]
+        return gold_nifty > ma
+    return _memo(('risk_off', window), compute)
+
+
+def _component_scores():
+    def compute():
+        data = _worker['data']
+        # Same conversions as the dashboard: G-Sec clean price -> yield, full-history PE rank
+        erp = 100 / data['Nifty_PE'] - (17 - data['India_10Y'] / 100)
+        pe_pct = pd.Series(data['Nifty_PE']).rank(pct=True).to_numpy() * 100
+        return erp_signals(erp)[1], vix_signals(data['VIX'])[1], pe_signals(pe_pct)[1]
+    return _memo('components', compute)
+
+
+def strategy_codes(params, strategy='master'):
+    """Full-history asset codes for one parameter set against the bound data"""
+    if strategy == 'master':
+        p = dict(DEFAULT_PARAMS, **params)
+        return master_codes(_risk_off(p['risk_ma']), _worker['data']['VIX'], _mid_z(p['z_window']),
+                            p['vix_cut'], p['mid_z_cut'])
+    if strategy == 'composite':
+        p = dict(COMPOSITE_DEFAULTS, **params)
+        composite = composite_scores(*_component_scores(), weights=p['weights'])
+        return composite_codes(composite, p['composite_cut'])
+    raise ValueError(f"Unknown strategy: {strategy}")
+
+
+def evaluate(params, strategy='master', lag=1, cost=0.0):
+    """Backtest one parameter set against the bound data; returns params + stats"""
+    held, strat_ret = backtest_codes(strategy_codes(params, strategy), _worker['returns'], lag=lag, cost=cost)
+    stats = summary_stats(strat_ret)
+    stats['Switches'] = int((held[1:] != held[:-1]).sum())
+    return dict(params, **stats)
+
+
+def _evaluate_chunk(chunk, strategy, lag, cost):
+    return [evaluate(params, strategy, lag, cost) for params in chunk]
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# DRIVER
+# ══════════════════════════════════════════════════════════════════════════════
+
+def _chunks(grid, workers):
+    # Group parameter sets that share rolling windows so worker memos get reused
+    order = sorted(grid, key=lambda p: (p.get('z_window', 0), p.get('risk_ma', 0)))
+    size = max(1, math.ceil(len(order) / (workers * 4)))
+    return [order[i:i + size] for i in range(0, len(order), size)]
+
+
+@contextmanager
+def shared_pool(master, max_workers=None):
+    """
+    Bind ``master``'s strategy columns for evaluation and yield a process
+    pool whose workers map them from shared memory. Yields None when
+    ``max_workers`` is 0; the data is then bound in this process only.
+    """
+    block = np.ascontiguousarray(master[SHARED_COLUMNS].to_numpy(dtype='float64'))
+    # The driver always gets a local binding too, for any follow-up evaluation
+    _bind(block, SHARED_COLUMNS)
+    workers = os.cpu_count() if max_workers is None else max_workers
+    if workers == 0:
+        yield None
+        return
+
+    shm = shared_memory.SharedMemory(create=True, size=block.nbytes)
+    try:
+        np.ndarray(block.shape, dtype='float64', buffer=shm.buf)[:] = block
+        with ProcessPoolExecutor(max_workers=workers, initializer=_attach,
+                                 initargs=(shm.name, block.shape, SHARED_COLUMNS)) as pool:
+            yield pool
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def run_sweep(master, grid, strategy='master', metric='Sharpe', lag=1, cost=0.0, max_workers=None):
+    """
+    Evaluate every parameter dict in ``grid`` and return a ranked table.
+
+    ``master`` is the merged frame from load_and_process_data. ``strategy``
+    is 'master' (vix_cut, mid_z_cut, risk_ma, z_window) or 'composite'
+    (weights, composite_cut); unspecified parameters take their defaults.
+    ``max_workers=0`` evaluates in-process, which is handy for debugging.
+    """
+    workers = os.cpu_count() if max_workers is None else max_workers
+    if len(grid) == 1:
+        workers = 0
+    with shared_pool(master, workers) as pool:
+        if pool is None:
+            rows = _evaluate_chunk(grid, strategy, lag, cost)
+        else:
+            futures = [pool.submit(_evaluate_chunk, chunk, strategy, lag, cost)
+                       for chunk in _chunks(grid, workers)]
+            rows = [row for future in futures for row in future.result()]
+
+    results = pd.DataFrame(rows).sort_values(metric, ascending=False, ignore_index=True)
+    results.insert(0, 'Rank', np.arange(1, len(results) + 1))
+    return results
@@ -0,0 +1,115 @@
+"""
+Index valuation history helpers (Nifty_Index_Valuation_History.csv).
+
+Percentiles for every index are computed together from one groupby/sort
+of the long-format frame instead of re-filtering it once per index.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Indices with this many rows or fewer get no percentile
+MIN_HISTORY = 5
+
+
+def pe_percentiles(pe_df):
+    """
+    PE percentile of every row against its index's full history.
+
+    The percentile is the share of the index's rows (NaN rows included in
+    the count) with a strictly lower PE, in percent. Returns a Series aligned
+    with ``pe_df``; indices with MIN_HISTORY rows or fewer get NaN.
+    """
+    groups = pe_df.groupby('Index')['PE_Ratio']
+    # min-rank - 1 is the number of strictly lower PEs within the same index
+    lower = groups.rank(method='min').sub(1).fillna(0)
+    size = groups.transform('size')
+    return (lower / size * 100).where(size > MIN_HISTORY).rename('PE_Percentile')
+
+
+def pe_percentile_history(pe_df, window=None):
+    """
+    Point-in-time PE percentile of every row, using only data up to its date.
+
+    Each row is ranked against the rows of the same index dated on or before
+    it, or against the last ``window`` of them, with the same definition as
+    pe_percentiles. Returns a Series aligned with ``pe_df``; rows with
+    MIN_HISTORY or fewer observations get NaN.
+    """
+    df = pe_df.sort_values(['Index', 'Date'], kind='stable')
+    groups = df.groupby('Index', sort=False)['PE_Ratio']
+    ranks = groups.expanding() if window is None else groups.rolling(window, min_periods=1)
+    # min-rank - 1 is the number of strictly lower PEs up to and including the row
+    lower = ranks.rank(method='min').droplevel(0).sub(1).fillna(0)
+    span = groups.cumcount() + 1
+    if window is not None:
+        span = span.clip(upper=window)
+    pct = (lower / span * 100).where(span > MIN_HISTORY)
+    return pct.rename('PE_Percentile').reindex(pe_df.index)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# WIDE STORE
+# ══════════════════════════════════════════════════════════════════════════════
+
+METRICS = ('PE_Ratio', 'PB_Ratio', 'Div_Yield')
+
+
+class ValuationStore:
+    """
+    Valuation history pivoted once into a wide, date-indexed float64 block.
+
+    Columns are (metric, index) pairs laid out metric-major, with index
+    names held as categorical codes, so any index's series is one dict
+    lookup plus a column view. No scans or merges are needed.
+    """
+
+    def __init__(self, pe_df, metrics=METRICS):
+        index_names = pd.Categorical(pe_df['Index'])
+        self.indices = list(index_names.categories)
+        self.metrics = tuple(metrics)
+        self.dates = pd.DatetimeIndex(np.unique(pe_df['Date'].to_numpy()), name='Date')
+
+        rows = self.dates.get_indexer(pe_df['Date'])
+        codes = index_names.codes.astype('int64')
+        width = len(self.indices)
+        self.values = np.full((len(self.dates), width * len(self.metrics)), np.nan)
+        for m, metric in enumerate(self.metrics):
+            self.values[rows, m * width + codes] = pe_df[metric].to_numpy(dtype='float64')
+
+        self._columns = {
+            (name, metric): m * width + i
+            for m, metric in enumerate(self.metrics)
+            for i, name in enumerate(self.indices)
+        }
+
+    def __contains__(self, index_name):
+        return (index_name, self.metrics[0]) in self._columns
+
+    def column(self, index_name, metric='PE_Ratio'):
+        """Values of ``metric`` for ``index_name`` as a view into the block"""
+        return self.values[:, self._columns[(index_name, metric)]]
+
+    def series(self, index_name, metric='PE_Ratio'):
+        return pd.Series(self.column(index_name, metric), index=self.dates, name=f'{index_name} {metric}')
+
+    def frame(self, columns, month_end=False):
+        """
+        Frame with a Date column plus ``columns``, a {name: (index, metric)}
+        mapping. Indices missing from the store come back as NaN columns.
+        Only dates where at least one requested column has a value are kept.
+
+        ``month_end`` shifts dates to month end to line up with monthly data.
+        Indices that close a month on different days then share one row per
+        month, holding each column's last value in that month.
+        """
+        out = {'Date': self.dates + pd.offsets.MonthEnd(0) if month_end else self.dates}
+        for name, key in columns.items():
+            out[name] = self.values[:, self._columns[key]] if key in self._columns else np.nan
+        df = pd.DataFrame(out)
+
+        present = df.drop(columns='Date').notna().any(axis=1)
+        df = df[present].reset_index(drop=True)
+        if month_end:
+            df = df.groupby('Date', as_index=False, sort=True).last()
+        return df
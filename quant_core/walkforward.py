@@ -0,0 +1,113 @@
+"""
+Walk-forward optimization with out-of-sample evaluation.
+
+The history is cut into folds: each fold picks the best parameter set from a
+grid on its in-sample window and then trades it on the following test
+window. The test windows tile the history after the first training window,
+and their returns are stitched into one out-of-sample equity curve.
+
+Folds are fitted in parallel on the shared-memory pool from sweep.py. The
+rolling statistics (valuation z-scores, risk-regime trend) are causal, so
+each worker computes them once per window over the full history and reuses
+them for every fold it fits instead of recomputing them per fold.
+
+Note: the 'composite' strategy ranks PE over the full history, as the
+dashboard does, which leaks future information into the in-sample fits.
+Use the 'master' strategy for capital-sizing validation.
+"""
+
+import os
+from itertools import repeat
+
+import numpy as np
+import pandas as pd
+
+from .backtest import FLAT, TRADING_DAYS, asset_returns, backtest_codes, matrix_stats, summary_stats
+from .strategy import SIGNAL_ASSETS
+from .sweep import bound_returns, shared_pool, strategy_codes
+
+# Parameter sets scored together per in-sample backtest, to bound memory
+_BATCH = 512
+
+
+def make_folds(n, train=3 * TRADING_DAYS, test=TRADING_DAYS, anchored=False):
+    """
+    (train_start, train_end, test_start, test_end) bar positions.
+
+    With ``anchored`` the training window always starts at bar 0 and grows;
+    otherwise it rolls forward with a fixed length of ``train`` bars.
+    """
+    folds = []
+    start = train
+    while start < n:
+        end = min(start + test, n)
+        folds.append((0 if anchored else start - train, start, start, end))
+        start = end
+    return folds
+
+
+def _fit_fold(fold, grid, strategy, metric, lag, cost):
+    """Index and in-sample score of the best parameter set for one fold"""
+    train_start, train_end = fold[:2]
+    returns = bound_returns()[train_start:train_end]
+    best, best_score = 0, -np.inf
+    for offset in range(0, len(grid), _BATCH):
+        batch = grid[offset:offset + _BATCH]
+        codes = np.column_stack([strategy_codes(p, strategy)[train_start:train_end] for p in batch])
+        _, strat_ret = backtest_codes(codes, returns, lag=lag, cost=cost)
+        scores = np.nan_to_num(matrix_stats(strat_ret)[0][metric], nan=-np.inf)
+        i = int(np.argmax(scores))
+        if scores[i] > best_score:
+            best, best_score = offset + i, scores[i]
+    return best, best_score
+
+
+def walk_forward(master, grid, train=3 * TRADING_DAYS, test=TRADING_DAYS, anchored=False,
+                 strategy='master', metric='Sharpe', lag=1, cost=0.0, max_workers=None):
+    """
+    Fit on rolling in-sample windows, trade out-of-sample, stitch the results.
+
+    ``grid`` is a list of parameter dicts as for sweep.run_sweep and
+    ``metric`` is any summary stat where higher is better. Returns
+    (equity, folds, stats): the stitched out-of-sample equity curve, a
+    table with each fold's dates, chosen parameters, in-sample score and
+    out-of-sample stats, and the stats of the whole out-of-sample run.
+    """
+    n = len(master)
+    folds = make_folds(n, train, test, anchored)
+    if not folds:
+        raise ValueError(f"Need more than {train} bars for a {train}-bar training window")
+
+    workers = os.cpu_count() if max_workers is None else max_workers
+    with shared_pool(master, min(workers, len(folds))) as pool:
+        args = (repeat(grid), repeat(strategy), repeat(metric), repeat(lag), repeat(cost))
+        fits = list(pool.map(_fit_fold, folds, *args) if pool else map(_fit_fold, folds, *args))
+
+        # Held position on each test bar is the chosen parameters' signal from
+        # ``lag`` bars earlier, so fold boundaries trade (and pay costs) correctly
+        held = np.full(n, FLAT, dtype='int64')
+        for (_, _, test_start, test_end), (best, _) in zip(folds, fits):
+            codes = strategy_codes(grid[best], strategy)
+            held[test_start:test_end] = codes[test_start - lag:test_end - lag]
+
+    returns = asset_returns(master[list(SIGNAL_ASSETS.values())])
+    _, strat_ret = backtest_codes(held, returns, lag=0, cost=cost)
+
+    oos_start = folds[0][2]
+    oos_ret = strat_ret[oos_start:]
+    equity = pd.Series(np.cumprod(1 + oos_ret), index=master.index[oos_start:], name='Equity_Curve')
+
+    rows = []
+    for (train_start, train_end, test_start, test_end), (best, score) in zip(folds, fits):
+        fold_stats = summary_stats(strat_ret[test_start:test_end])
+        rows.append(dict(
+            {'Train_Start': master.index[train_start], 'Test_Start': master.index[test_start],
+             'Test_End': master.index[test_end - 1]},
+            **grid[best],
+            **{f'IS_{metric}': score},
+            **{f'OOS_{k}': v for k, v in fold_stats.items()},
+        ))
+
+    stats = summary_stats(oos_ret)
+    stats['Switches'] = int((held[oos_start + 1:] != held[oos_start:-1]).sum())
+    return equity, pd.DataFrame(rows), stats
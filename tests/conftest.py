@@ -0,0 +1,39 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from quant_core import csv_cache, master_store
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Empty csv_cache directory (with the persisted masters under it) for one test"""
+    path = tmp_path / 'cache'
+    monkeypatch.setattr(csv_cache, 'CACHE_DIR', str(path))
+    monkeypatch.setattr(master_store, 'MASTER_DIR', str(path / 'master'))
+    return path
+
+
+@pytest.fixture
+def synthetic_market():
+    """
+    Factory for a random-walk master frame with the scanner's price, VIX,
+    PE and G-Sec columns: ``synthetic_market(n, seed, gaps={column: (start, stop)})``
+    """
+    def make(n=1200, seed=0, start='2014-01-01', gaps=None):
+        rng = np.random.default_rng(seed)
+        walk = lambda drift, vol: 100 * np.exp(rng.normal(drift, vol, n).cumsum())
+        df = pd.DataFrame({
+            'Nifty_Price': walk(0.0004, 0.01),
+            'Midcap_Price': walk(0.0005, 0.013),
+            'Gold_Price': walk(0.0003, 0.008),
+            'VIX': 18 + 6 * np.sin(np.arange(n) / 40) + rng.normal(0, 1, n),
+            'Nifty_PE': 20 + rng.normal(0, 1, n).cumsum() / 10,
+            'Midcap_PE': 25 + rng.normal(0, 1, n).cumsum() / 10,
+            'Smallcap_PE': 28 + rng.normal(0, 1, n).cumsum() / 10,
+            'India_10Y': 950 + rng.normal(0, 0.5, n).cumsum(),
+        }, index=pd.bdate_range(start, periods=n))
+        for column, (lo, hi) in (gaps or {}).items():
+            df.iloc[lo:hi, df.columns.get_loc(column)] = np.nan
+        return df
+    return make
@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from quant_core.backtest import run_backtest, run_backtests
+from quant_core.strategy import SIGNAL_ASSETS, SIGNAL_LABELS
+
+
+@pytest.fixture
+def market():
+    rng = np.random.default_rng(7)
+    n = 600
+    index = pd.bdate_range('2018-01-01', periods=n)
+    prices = pd.DataFrame(
+        100 * np.exp(rng.normal(0.0003, 0.01, (n, 3)).cumsum(axis=0)),
+        index=index, columns=['Nifty_Price', 'Midcap_Price', 'Gold_Price'])
+    # Regimes lasting a few weeks, with a stretch of missing signals
+    labels = np.array(SIGNAL_LABELS, dtype=object)[rng.integers(0, 3, n // 20).repeat(20)]
+    labels[100:110] = None
+    return prices, pd.Series(labels, index=index, name='Signal')
+
+
+def _reference_equity(prices, signals):
+    """The string-matching loop app.py used before the vectorized engine"""
+    df = prices.copy()
+    for asset in ['Nifty', 'Midcap', 'Gold']:
+        df[f'{asset}_Ret'] = df[f'{asset}_Price'].pct_change()
+    df['Position'] = signals.shift(1)
+    df['Strat_Ret'] = 0.0
+    df.loc[df['Position'].astype(str).str.contains('NIFTY'), 'Strat_Ret'] = df['Nifty_Ret']
+    df.loc[df['Position'].astype(str).str.contains('MIDCAP'), 'Strat_Ret'] = df['Midcap_Ret']
+    df.loc[df['Position'].astype(str).str.contains('GOLD'), 'Strat_Ret'] = df['Gold_Ret']
+    return (1 + df['Strat_Ret']).cumprod(), (1 + df['Nifty_Ret']).cumprod()
+
+
+def test_run_backtest_matches_string_matching_loop(market):
+    prices, signals = market
+    frame, stats = run_backtest(signals, prices, SIGNAL_ASSETS, lag=1)
+    expected, _ = _reference_equity(prices, signals)
+
+    np.testing.assert_allclose(frame['Equity_Curve'], expected, rtol=1e-12)
+    assert stats['Total_Return'] == pytest.approx(expected.iloc[-1] - 1, rel=1e-12)
+
+
+def test_costs_are_charged_per_unit_of_turnover(market):
+    prices, signals = market
+    free, _ = run_backtest(signals, prices, SIGNAL_ASSETS)
+    costly, stats = run_backtest(signals, prices, SIGNAL_ASSETS, cost=0.001)
+
+    held = free['Position'].where(free['Position'].notna(), 'FLAT')
+    previous = held.shift(1, fill_value='FLAT')
+    units = (held != previous) * ((held != 'FLAT').astype(int) + (previous != 'FLAT').astype(int))
+    np.testing.assert_allclose(free['Strat_Ret'] - costly['Strat_Ret'], 0.001 * np.array(units), atol=1e-15)
+    assert stats['Switches'] == sum(u > 0 for u in units)
+
+
+def test_batched_backtests_match_single_runs(market):
+    prices, signals = market
+    variants = pd.DataFrame({'Quant Strategy': signals, 'Nifty 50 Buy & Hold': SIGNAL_LABELS[0]})
+    equity, drawdown, stats = run_backtests(variants, prices, SIGNAL_ASSETS, lag=1, cost=0.0005)
+
+    for name in variants:
+        frame, single = run_backtest(variants[name], prices, SIGNAL_ASSETS, lag=1, cost=0.0005)
+        np.testing.assert_allclose(equity[name], frame['Equity_Curve'], rtol=1e-12)
+        np.testing.assert_allclose(drawdown[name], frame['Drawdown'], rtol=1e-12, atol=1e-15)
+        for key, value in single.items():
+            assert stats.loc[name, key] == pytest.approx(value, rel=1e-12)
+
+    # Without costs the constant column is plain Nifty buy & hold
+    equity, _, _ = run_backtests(variants, prices, SIGNAL_ASSETS, lag=1)
+    _, benchmark = _reference_equity(prices, signals)
+    np.testing.assert_allclose(equity['Nifty 50 Buy & Hold'].iloc[1:], benchmark.iloc[1:], rtol=1e-12)
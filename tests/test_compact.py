@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+
+from quant_core.compact import compact_frame
+
+
+def _frame():
+    n = 1000
+    rng = np.random.default_rng(16)
+    return pd.DataFrame({
+        'Nifty_Price': 10000 + rng.normal(0, 50, n).cumsum(),
+        'Signal': rng.choice(['NIFTY', 'MIDCAPS', 'GOLD'], n).astype(object),
+        'Note': [f'row {i}' for i in range(n)],
+        'Days': np.arange(n),
+    }, index=pd.bdate_range('2020-01-01', periods=n))
+
+
+def test_compact_dtypes_and_values():
+    df = _frame()
+    compact, _ = compact_frame(df)
+
+    assert compact['Nifty_Price'].dtype == np.float32
+    assert isinstance(compact['Signal'].dtype, pd.CategoricalDtype)
+    # High-cardinality text and non-float numbers are left alone
+    assert compact['Note'].dtype == df['Note'].dtype
+    assert compact['Days'].dtype == df['Days'].dtype
+
+    np.testing.assert_allclose(compact['Nifty_Price'], df['Nifty_Price'], rtol=1e-7)
+    assert (compact['Signal'].astype(object) == df['Signal']).all()
+    pd.testing.assert_index_equal(compact.index, df.index)
+
+
+def test_report_counts_saved_bytes():
+    df = _frame()
+    compact, report = compact_frame(df)
+
+    assert list(report.index) == list(df.columns)
+    assert report.loc['Nifty_Price', 'Saved_Bytes'] == df['Nifty_Price'].nbytes // 2
+    assert report.loc['Signal', 'After_Bytes'] < report.loc['Signal', 'Before_Bytes'] / 5
+    assert report.loc['Days', 'Saved_Bytes'] == 0
+    assert report['After_Bytes'].sum() == compact.memory_usage(index=False, deep=True).sum()
+
+
+def test_input_frame_is_untouched():
+    df = _frame()
+    before = df.copy()
+    compact_frame(df)
+
+    pd.testing.assert_frame_equal(df, before)
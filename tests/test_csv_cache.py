@@ -0,0 +1,92 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from quant_core import csv_cache
+
+
+def _write_csv(path, rows):
+    pd.DataFrame({
+        'Date': pd.date_range('2024-01-01', periods=rows).strftime('%Y-%m-%d'),
+        'Close': np.linspace(100, 200, rows),
+        'Volume': np.arange(rows, dtype='int64'),
+    }).to_csv(path, index=False)
+
+
+def _parse(path, calls):
+    def parse():
+        calls.append(path)
+        return pd.read_csv(path, parse_dates=['Date']).set_index('Date')
+    return parse
+
+
+def test_warm_read_matches_cold_read(tmp_path, cache_dir):
+    src = tmp_path / 'prices.csv'
+    _write_csv(src, 50)
+    calls = []
+
+    cold = csv_cache.load_cached(str(src), _parse(src, calls))
+    warm = csv_cache.load_cached(str(src), _parse(src, calls))
+
+    assert len(calls) == 1
+    # The int column comes back as float64 on both paths
+    assert list(cold.dtypes) == list(warm.dtypes) == [np.dtype('float64')] * 2
+    pd.testing.assert_frame_equal(cold, warm)
+
+
+def test_modified_source_is_reparsed(tmp_path, cache_dir):
+    src = tmp_path / 'prices.csv'
+    _write_csv(src, 50)
+    calls = []
+    csv_cache.load_cached(str(src), _parse(src, calls))
+
+    _write_csv(src, 60)
+    stat = os.stat(src)
+    os.utime(src, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    df = csv_cache.load_cached(str(src), _parse(src, calls))
+
+    assert len(calls) == 2
+    assert len(df) == 60
+    # Only the newest entry for the source is kept
+    assert len(os.listdir(next(cache_dir.iterdir()))) == 1
+
+
+def test_cache_dir_does_not_follow_working_directory(tmp_path, cache_dir, monkeypatch):
+    src = tmp_path / 'prices.csv'
+    _write_csv(src, 10)
+    monkeypatch.chdir(tmp_path)
+
+    csv_cache.load_cached('prices.csv', _parse(src, []))
+
+    assert cache_dir.is_dir()
+    assert not (tmp_path / '.csv_cache').exists()
+    assert os.path.isabs(csv_cache.CACHE_DIR)
+
+
+def test_non_numeric_frames_are_not_cached(tmp_path, cache_dir):
+    src = tmp_path / 'labels.csv'
+    pd.DataFrame({'Date': ['2024-01-01'], 'Index': ['Nifty 50']}).to_csv(src, index=False)
+    calls = []
+    for _ in range(2):
+        df = csv_cache.load_cached(str(src), _parse(src, calls))
+
+    assert len(calls) == 2
+    assert df['Index'].iloc[0] == 'Nifty 50'
+    assert not cache_dir.exists()
+
+
+def test_source_version_tracks_modification_creation_and_removal(tmp_path):
+    a, b = str(tmp_path / 'a.csv'), str(tmp_path / 'b.csv')
+    _write_csv(a, 10)
+    versions = [csv_cache.source_version([a, b])]
+    assert csv_cache.source_version([a, b]) == versions[0]
+
+    _write_csv(b, 10)
+    versions.append(csv_cache.source_version([a, b]))
+    _write_csv(a, 11)
+    versions.append(csv_cache.source_version([a, b]))
+    os.remove(b)
+    versions.append(csv_cache.source_version([a, b]))
+
+    assert len(set(versions)) == 4
@@ -0,0 +1,56 @@
+import os
+
+import numpy as np
+import pytest
+
+from quant_core.dashboard import DAILY_INDICATORS, create_dashboard_data, load_market_data
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def frames(cache_dir):
+    if not os.path.exists(os.path.join(ROOT, 'Nifty50_Historical_Yahoo.csv')):
+        pytest.skip("bundled data is not available")
+    return create_dashboard_data(load_market_data(ROOT))
+
+
+def test_daily_technicals_match_pandas(frames):
+    daily = frames[0]
+    close = daily['Nifty50']
+    delta = close.diff()
+    gain = delta.where(delta > 0, 0).rolling(14).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(14).mean()
+    ath = close.expanding().max()
+    expected = {
+        'SMA_50': close.rolling(50).mean(),
+        'SMA_200': close.rolling(200).mean(),
+        'ATH': ath,
+        'Drawdown': (close / ath - 1) * 100,
+        'RSI': 100 - (100 / (1 + gain / loss)),
+    }
+
+    assert set(DAILY_INDICATORS) <= set(daily.columns)
+    for name, values in expected.items():
+        np.testing.assert_allclose(daily[name], values, rtol=1e-12, atol=1e-9, err_msg=name)
+
+
+def test_monthly_rows_are_month_ends_of_daily(frames):
+    daily, monthly, _ = frames
+    month_last = daily.groupby(daily['Date'].dt.to_period('M')).last()
+
+    assert monthly['Date'].is_unique and (monthly['Date'].dt.is_month_end).all()
+    assert len(monthly) == len(month_last)
+    np.testing.assert_array_equal(monthly['Nifty50'], month_last['Nifty50'])
+    assert {'Composite_Signal', 'Regime', 'ERP_Signal'} <= set(monthly.columns)
+    assert {'Composite_Signal', 'Regime'} <= set(daily.columns)
+
+
+def test_sector_table_is_latest_date(frames):
+    sector = frames[2]
+    if sector is None:
+        pytest.skip("no valuation history bundled")
+
+    assert sector['Index'].is_unique
+    if 'PE_Percentile' in sector:
+        assert sector['PE_Percentile'].dropna().between(0, 100).all()
@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from quant_core.downsample import downsample, point_budget
+
+
+@pytest.fixture
+def series():
+    rng = np.random.default_rng(21)
+    values = 100 + rng.normal(0, 1, 5000).cumsum()
+    return pd.Series(values, index=pd.bdate_range('2005-01-03', periods=len(values)))
+
+
+@pytest.mark.parametrize('method', ['lttb', 'minmax'])
+def test_long_trace_is_reduced_to_budget(series, method):
+    x, y = downsample(series.index, series, width=400, method=method)
+
+    assert len(y) <= point_budget(400) + 2
+    assert x[0] == series.index[0] and x[-1] == series.index[-1]
+    np.testing.assert_array_equal(y, series.loc[x].to_numpy())
+
+
+def test_minmax_keeps_every_extreme(series):
+    spiked = series.copy()
+    spiked.iloc[1234] = 1e6
+    spiked.iloc[4321] = -1e6
+    _, y = downsample(spiked.index, spiked, width=300, method='minmax')
+
+    assert y.max() == 1e6 and y.min() == -1e6
+
+
+def test_trace_within_budget_is_unchanged(series):
+    short = series.iloc[:500].copy()
+    short.iloc[100:110] = np.nan
+    x, y = downsample(short.index, short, width=1200)
+
+    np.testing.assert_array_equal(x, short.index.to_numpy())
+    np.testing.assert_array_equal(y, short.to_numpy())
+
+
+@pytest.mark.parametrize('method', ['lttb', 'minmax'])
+def test_gaps_survive_downsampling(series, method):
+    gappy = series.copy()
+    gappy.iloc[:200] = np.nan
+    gappy.iloc[2000:2100] = np.nan
+    gappy.iloc[3000] = np.nan
+    x, y = downsample(gappy.index, gappy, width=400, method=method)
+
+    position = gappy.index.get_indexer(x)
+    assert len(y) < len(gappy) // 5
+    # Each interior gap is still a NaN between its real neighbours
+    for start, end in [(2000, 2099), (3000, 3000)]:
+        assert {start - 1, start, end + 1} <= set(position)
+        assert np.isnan(y[position == start])
+    # No kept segment joins valid points across a gap
+    between = np.isnan(gappy.to_numpy())
+    for a, b in zip(position[:-1], position[1:]):
+        if not np.isnan(y[position == a][0]) and not np.isnan(y[position == b][0]):
+            assert not between[a:b].any()
+
+
+def test_x_range_limits_to_visible_window(series):
+    lo, hi = series.index[1000], series.index[1299]
+    x, y = downsample(series.index, series, width=1200, x_range=(lo, hi))
+
+    assert len(x) == 300
+    assert x[0] == lo and x[-1] == hi
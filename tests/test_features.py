@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from quant_core.features import FeatureGraph
+
+
+@pytest.fixture
+def graph():
+    graph = FeatureGraph('test')
+    graph.calls = []
+
+    @graph.feature('Double', ['A'])
+    def _double(a):
+        graph.calls.append('Double')
+        return a * 2
+
+    @graph.feature('Sum', ['Double', 'B'])
+    def _sum(double, b):
+        graph.calls.append('Sum')
+        return double + b
+
+    @graph.feature('Neg_B', ['B'])
+    def _neg_b(b):
+        graph.calls.append('Neg_B')
+        return -b
+
+    return graph
+
+
+@pytest.fixture
+def base():
+    return pd.DataFrame({'A': np.arange(5.0), 'B': np.arange(5.0) * 10})
+
+
+def test_only_requested_features_and_their_deps_are_computed(graph, base):
+    view = graph.view(base)
+    pd.testing.assert_series_equal(view['Sum'], (base['A'] * 2 + base['B']).rename('Sum'))
+    assert graph.calls == ['Double', 'Sum']
+
+    view['Sum']
+    assert graph.calls == ['Double', 'Sum']
+
+
+def test_frame_matches_eager_columns(graph, base):
+    frame = graph.view(base).frame()
+    expected = base.assign(Double=base['A'] * 2, Sum=base['A'] * 2 + base['B'], Neg_B=-base['B'])
+    pd.testing.assert_frame_equal(frame, expected)
+
+
+def test_new_view_of_same_data_is_served_from_memo(graph, base):
+    graph.view(base).frame()
+    graph.calls.clear()
+
+    graph.view(base.copy()).frame()
+    assert graph.calls == []
+
+
+def test_changed_column_only_recomputes_its_dependents(graph, base):
+    graph.view(base).frame()
+    graph.calls.clear()
+
+    changed = base.copy()
+    changed.loc[4, 'B'] = 99.0
+    frame = graph.view(changed).frame()
+    assert sorted(graph.calls) == ['Neg_B', 'Sum']
+    assert frame.loc[4, 'Sum'] == 8.0 + 99.0
+
+
+def test_grouped_features_share_one_computation(base):
+    graph = FeatureGraph('grouped')
+    calls = []
+
+    @graph.features(['Lo', 'Hi'], ['A'])
+    def _bounds(a):
+        calls.append(1)
+        return {'Lo': a - 1, 'Hi': a + 1}
+
+    frame = graph.view(base).frame()
+    assert calls == [1]
+    assert list(frame.columns) == ['A', 'B', 'Lo', 'Hi']
+    pd.testing.assert_series_equal(frame['Hi'], (base['A'] + 1).rename('Hi'))
+
+    graph.view(base.copy())['Lo']
+    assert calls == [1]
@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from quant_core.figure_cache import FigureCache
+
+
+class Builder:
+    """Stand-in chart builder that counts its calls"""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, **params):
+        self.calls.append(params)
+        return object()
+
+
+@pytest.fixture
+def build():
+    return Builder()
+
+
+def test_hit_returns_the_built_figure_without_rebuilding(build):
+    cache = FigureCache()
+    first = cache.get('chart', 'v1', build, window=20)
+    again = cache.get('chart', 'v1', build, window=20)
+
+    assert again is first
+    assert len(build.calls) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_new_version_or_params_rebuild(build):
+    cache = FigureCache()
+    first = cache.get('chart', 'v1', build, window=20)
+
+    assert cache.get('chart', 'v2', build, window=20) is not first
+    assert cache.get('chart', 'v1', build, window=50) is not first
+    assert cache.get('other', 'v1', build, window=20) is not first
+    assert len(build.calls) == 4
+
+
+def test_unhashable_params_are_frozen(build):
+    cache = FigureCache()
+    first = cache.get('chart', 'v1', build, levels=[1, 2], style={'a': [3]}, marks=np.array([4, 5]))
+    again = cache.get('chart', 'v1', build, levels=[1, 2], style={'a': [3]}, marks=np.array([4, 5]))
+
+    assert again is first
+    assert len(build.calls) == 1
+
+
+def test_version_none_always_builds_and_is_not_stored(build):
+    cache = FigureCache()
+    cache.get('chart', None, build)
+    cache.get('chart', None, build)
+
+    assert len(build.calls) == 2
+    assert len(cache) == 0
+
+
+def test_least_recently_used_is_evicted(build):
+    cache = FigureCache(maxsize=2)
+    a = cache.get('a', 'v1', build)
+    cache.get('b', 'v1', build)
+    assert cache.get('a', 'v1', build) is a
+    cache.get('c', 'v1', build)
+
+    assert len(cache) == 2
+    assert cache.get('a', 'v1', build) is a
+    cache.get('b', 'v1', build)
+    assert len(build.calls) == 4
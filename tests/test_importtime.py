@@ -0,0 +1,16 @@
+import os
+import pkgutil
+
+import quant_core
+from quant_core.importtime import import_time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_quant_core_never_imports_ui_libraries(monkeypatch):
+    monkeypatch.chdir(ROOT)
+    modules = ', '.join(f'quant_core.{m.name}' for m in pkgutil.iter_modules(quant_core.__path__))
+    times, loaded = import_time(modules, repeat=1)
+
+    assert loaded == '-'
+    assert len(times) == 1 and times[0] > 0
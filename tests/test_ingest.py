@@ -0,0 +1,29 @@
+import threading
+
+from quant_core import ingest
+from quant_core.ingest import load_all
+
+
+def test_loaders_run_concurrently():
+    # Each loader waits for all the others, so a sequential run would time out
+    barrier = threading.Barrier(4, timeout=5)
+    loaders = {key: (lambda key=key: (barrier.wait(), key)[1]) for key in 'abcd'}
+    results, errors = load_all(loaders)
+
+    assert results == {key: key for key in 'abcd'}
+    assert errors == {}
+
+
+def test_failures_are_returned_per_key():
+    def broken():
+        raise FileNotFoundError('missing.csv')
+
+    results, errors = load_all({'ok': lambda: 1, 'broken': broken})
+
+    assert results == {'ok': 1, 'broken': None}
+    assert list(errors) == ['broken'] and isinstance(errors['broken'], FileNotFoundError)
+    assert {'ok', 'broken'} <= set(ingest.TIMINGS)
+
+
+def test_no_loaders():
+    assert load_all({}) == ({}, {})
@@ -0,0 +1,129 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from quant_core import master_store
+from quant_core.master_store import build_master, update_master
+
+
+def _source(tmp_path, name, start, rows, seed):
+    dates = pd.bdate_range(start, periods=rows, name='Date')
+    values = np.random.default_rng(seed).normal(100, 5, rows)
+    df = pd.DataFrame({name: values}, index=dates)
+    path = str(tmp_path / f'{name}.csv')
+    return _save(path, df), df
+
+
+def _save(path, df):
+    """Write ``df`` as the source's current contents with a fresh mtime"""
+    mtime = os.stat(path).st_mtime_ns + 10**9 if os.path.exists(path) else None
+    df.to_csv(path)
+    if mtime is not None:
+        os.utime(path, ns=(mtime, mtime))
+    return path
+
+
+@pytest.fixture
+def count_full_builds(monkeypatch):
+    calls = []
+    real = master_store.build_master
+
+    def counting(frames, stats=None):
+        calls.append(len(frames))
+        return real(frames, stats)
+
+    monkeypatch.setattr(master_store, 'build_master', counting)
+    return calls
+
+
+def test_appended_rows_extend_the_persisted_master(tmp_path, count_full_builds):
+    store = str(tmp_path / 'store')
+    a_path, a = _source(tmp_path, 'A', '2020-01-01', 300, 1)
+    b_path, b = _source(tmp_path, 'B', '2020-02-03', 280, 2)
+    update_master([(_save(a_path, a.iloc[:250]), a.iloc[:250]),
+                   (_save(b_path, b.iloc[:200]), b.iloc[:200])], store_dir=store)
+    assert count_full_builds == [2]
+
+    # Both files grow at the tail
+    grown = update_master([(_save(a_path, a), a), (_save(b_path, b), b)], store_dir=store)
+
+    assert count_full_builds == [2]
+    pd.testing.assert_frame_equal(grown, build_master([a, b]), check_freq=False)
+
+
+def test_unchanged_sources_are_served_from_the_store(tmp_path, count_full_builds):
+    store = str(tmp_path / 'store')
+    sources = [_source(tmp_path, 'A', '2020-01-01', 100, 1), _source(tmp_path, 'B', '2020-01-01', 100, 2)]
+    first = update_master(sources, store_dir=store)
+    again = update_master(sources, store_dir=store)
+
+    assert count_full_builds == [2]
+    pd.testing.assert_frame_equal(first, again, check_freq=False)
+
+
+def test_edited_history_falls_back_to_a_full_rebuild(tmp_path, count_full_builds):
+    store = str(tmp_path / 'store')
+    a_path, a = _source(tmp_path, 'A', '2020-01-01', 120, 1)
+    b_path, b = _source(tmp_path, 'B', '2020-01-01', 120, 2)
+    update_master([(_save(a_path, a.iloc[:100]), a.iloc[:100]),
+                   (_save(b_path, b.iloc[:100]), b.iloc[:100])], store_dir=store)
+
+    # A grows but its previous last row was also revised
+    edited = a.copy()
+    edited.iloc[99, 0] += 1.0
+    master = update_master([(_save(a_path, edited), edited), (_save(b_path, b), b)], store_dir=store)
+
+    assert count_full_builds == [2, 2]
+    pd.testing.assert_frame_equal(master, build_master([edited, b]), check_freq=False)
+
+
+def test_interior_edit_with_append_falls_back_to_a_full_rebuild(tmp_path, count_full_builds):
+    store = str(tmp_path / 'store')
+    a_path, a = _source(tmp_path, 'A', '2020-01-01', 120, 1)
+    b_path, b = _source(tmp_path, 'B', '2020-01-01', 120, 2)
+    update_master([(_save(a_path, a.iloc[:100]), a.iloc[:100]),
+                   (_save(b_path, b), b)], store_dir=store)
+
+    # A grows by 20 rows and row 50, well inside the old history, is revised
+    edited = a.copy()
+    edited.iloc[50, 0] = -999.0
+    master = update_master([(_save(a_path, edited), edited), (b_path, b)], store_dir=store)
+
+    assert count_full_builds == [2, 2]
+    assert master.loc[edited.index[50], 'A'] == -999.0
+    pd.testing.assert_frame_equal(master, build_master([edited, b]), check_freq=False)
+
+
+def test_merge_matches_iterative_outer_join(tmp_path):
+    frames = [_source(tmp_path, name, start, rows, seed)[1] for name, start, rows, seed in
+              [('A', '2020-01-01', 200, 1), ('B', '2020-03-02', 150, 2), ('C', '2019-12-02', 90, 3)]]
+    expected = frames[0]
+    for df in frames[1:]:
+        expected = expected.join(df, how='outer')
+
+    pd.testing.assert_frame_equal(master_store.merge_sources(frames), expected, check_freq=False)
+
+
+def test_update_reports_merge_stats(tmp_path):
+    store = str(tmp_path / 'store')
+    a_path, a = _source(tmp_path, 'A', '2020-01-01', 300, 1)
+    b_path, b = _source(tmp_path, 'B', '2020-01-01', 300, 2)
+
+    stats = {}
+    update_master([(_save(a_path, a.iloc[:250]), a.iloc[:250]), (b_path, b)], store_dir=store, stats=stats)
+    assert stats['mode'] == 'rebuild'
+    assert (stats['rows'], stats['columns']) == (300, 2)
+    assert stats['wall_time_s'] > 0 and stats['peak_bytes'] >= 300 * 2 * 8
+
+    # Only the appended range is merged on the append path
+    stats = {}
+    update_master([(_save(a_path, a), a), (b_path, b)], store_dir=store, stats=stats)
+    assert stats['mode'] == 'append'
+    assert (stats['rows'], stats['columns']) == (50, 2)
+    assert stats['wall_time_s'] > 0 and stats['peak_bytes'] > 0
+
+    stats = {}
+    update_master([(a_path, a), (b_path, b)], store_dir=store, stats=stats)
+    assert stats == {'mode': 'stored'}
@@ -0,0 +1,58 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from quant_core import publish
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_scalar_is_json_ready():
+    assert publish._scalar(pd.Timestamp('2024-03-28 15:30')) == '2024-03-28'
+    assert publish._scalar(np.float64(1.5)) == 1.5 and type(publish._scalar(np.float64(1.5))) is float
+    assert publish._scalar(np.int64(3)) == 3 and type(publish._scalar(np.int64(3))) is int
+    assert publish._scalar(np.nan) is None
+    assert publish._scalar('RISK ON') == 'RISK ON'
+
+
+def test_parquet_flattens_nested_keys(tmp_path):
+    record = {'generated_at': 'now', 'scanner': {'Signal': 'NIFTY', 'VIX': 14.2},
+              'dashboard': None, 'errors': {'dashboard': 'boom'}}
+    path = tmp_path / 'signals.parquet'
+    publish.write_parquet(record, path)
+
+    row = pd.read_parquet(path).iloc[0]
+    assert row['scanner.Signal'] == 'NIFTY' and row['scanner.VIX'] == 14.2
+    assert json.loads(row['errors']) == {'dashboard': 'boom'}
+
+
+def test_cli_publishes_both_dashboards(cache_dir, tmp_path):
+    if not os.path.exists(os.path.join(ROOT, publish.FILES['Domestic_Nifty_Price'])):
+        pytest.skip("bundled data is not available")
+    out = tmp_path / 'out' / 'signals.json'
+    out.parent.mkdir()
+
+    cwd = os.getcwd()
+    status = publish.main(['--data-dir', ROOT, '--json', str(out)])
+    record = json.loads(out.read_text())
+
+    assert status == 0
+    assert os.getcwd() == cwd
+    assert set(record['scanner']) >= {'Date', 'Signal', 'Regime'}
+    assert set(record['dashboard']) >= {'Date', 'Composite_Signal', 'Regime'}
+    assert record['merge']['mode'] == 'rebuild' and record['merge']['rows'] > 0
+    # Sources are cached in the shared cache dir, not under --data-dir
+    assert cache_dir.exists()
+
+
+def test_cli_reports_missing_sources(cache_dir, tmp_path, capsys):
+    empty = tmp_path / 'empty'
+    empty.mkdir()
+    status = publish.main(['--data-dir', str(empty), '--json', '-'])
+
+    record = json.loads(capsys.readouterr().out)
+    assert status == 1
+    assert record['dashboard'] is None and 'dashboard' in record['errors']
@@ -0,0 +1,79 @@
+import threading
+import time
+
+import pytest
+
+from quant_core.refresher import SnapshotRefresher
+
+
+class Source:
+    """Build function that returns a counter and can be held or made to fail"""
+
+    def __init__(self):
+        self.builds = 0
+        self.release = threading.Event()
+        self.release.set()
+        self.started = threading.Event()
+        self.fail = False
+
+    def __call__(self):
+        self.started.set()
+        self.release.wait(5)
+        if self.fail:
+            raise RuntimeError('source offline')
+        self.builds += 1
+        return {'build': self.builds}
+
+
+def _wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, 'timed out'
+        time.sleep(0.005)
+
+
+@pytest.fixture
+def refresher():
+    source = Source()
+    refresher = SnapshotRefresher(source, interval=3600, name='test-refresh')
+    refresher.source = source
+    yield refresher
+    refresher.source.release.set()
+    refresher.stop()
+
+
+def test_first_read_builds_once(refresher):
+    assert refresher.get() == {'build': 1}
+    assert refresher.get() == {'build': 1}
+    assert refresher.snapshot().version == 1
+    assert refresher.source.builds == 1
+
+
+def test_readers_keep_the_old_snapshot_during_a_rebuild(refresher):
+    first = refresher.get()
+    refresher.source.release.clear()
+    refresher.source.started.clear()
+    refresher.refresh_now()
+    refresher.source.started.wait(5)
+
+    # The rebuild is blocked, yet reads return the previous snapshot at once
+    assert refresher.get() is first
+
+    refresher.source.release.set()
+    _wait_for(lambda: refresher.snapshot().version == 2)
+    assert refresher.get() == {'build': 2}
+
+
+def test_failed_rebuild_keeps_previous_snapshot(refresher):
+    first = refresher.get()
+    refresher.source.fail = True
+    refresher.refresh_now()
+    _wait_for(lambda: refresher.last_error is not None)
+
+    assert refresher.get() is first
+    assert isinstance(refresher.last_error, RuntimeError)
+
+    refresher.source.fail = False
+    refresher.refresh_now()
+    _wait_for(lambda: refresher.snapshot().version == 2)
+    assert refresher.last_error is None
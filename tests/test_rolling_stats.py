@@ -0,0 +1,106 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from quant_core import rolling_stats
+from quant_core.rolling_stats import RollingMoments, Technicals, rolling_zscore, tail_technicals
+
+
+def _series(n, seed=0, gaps=()):
+    values = 1.5 + np.random.default_rng(seed).normal(0, 0.2, n).cumsum() / 10
+    values[list(gaps)] = np.nan
+    return pd.Series(values, index=pd.bdate_range('2015-01-01', periods=n), name='ratio')
+
+
+def _pandas_zscore(series, window):
+    rolling = series.rolling(window)
+    return (series - rolling.mean()) / rolling.std()
+
+
+def test_run_matches_pandas_rolling_moments():
+    series = _series(800, gaps=[5, 300, 301])
+    mean, std = RollingMoments(60).run(series.to_numpy())
+
+    np.testing.assert_allclose(mean, series.rolling(60).mean(), rtol=0, atol=1e-12)
+    np.testing.assert_allclose(std, series.rolling(60).std(), rtol=0, atol=1e-12)
+
+
+def test_push_continues_where_run_stopped():
+    series = _series(400, seed=1)
+    engine = RollingMoments(50)
+    engine.run(series.to_numpy()[:300])
+    pushed = np.array([engine.push(v) for v in series.to_numpy()[300:]])
+
+    expected_mean, expected_std = RollingMoments(50).run(series.to_numpy())
+    np.testing.assert_allclose(pushed[:, 0], expected_mean[300:], rtol=0, atol=1e-12)
+    np.testing.assert_allclose(pushed[:, 1], expected_std[300:], rtol=0, atol=1e-12)
+
+
+@pytest.mark.parametrize('appended', [3, 400])
+def test_zscore_resumes_from_checkpoint(appended, monkeypatch):
+    key = f'test-resume-{appended}'
+    full = _series(1500 + appended, seed=2, gaps=[700])
+    rolling_zscore(full.iloc[:1500], 252, key=key)
+
+    # A resumed call copies the checkpointed engine instead of starting a new one
+    fresh = []
+    monkeypatch.setattr(rolling_stats, 'RollingMoments', lambda window: fresh.append(window))
+    resumed = rolling_zscore(full, 252, key=key)
+
+    assert fresh == []
+    pd.testing.assert_series_equal(resumed, _pandas_zscore(full, 252), rtol=0, atol=1e-10)
+
+
+def test_zscore_recomputes_when_history_changes():
+    key = 'test-revised'
+    series = _series(900, seed=3)
+    rolling_zscore(series, 100, key=key)
+
+    revised = series.copy()
+    revised.iloc[10] += 1.0
+    z = rolling_zscore(revised, 100, key=key)
+
+    pd.testing.assert_series_equal(z, _pandas_zscore(revised, 100), rtol=0, atol=1e-10)
+
+
+def _prices(n, seed=4, gaps=()):
+    values = 10000 * np.exp(np.random.default_rng(seed).normal(0.0003, 0.01, n).cumsum())
+    values[list(gaps)] = np.nan
+    return pd.Series(values, index=pd.bdate_range('2010-01-01', periods=n), name='Nifty50')
+
+
+def _pandas_technicals(close):
+    delta = close.diff()
+    gain = delta.where(delta > 0, 0).rolling(14).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(14).mean()
+    ath = close.expanding().max()
+    return {
+        'SMA_50': close.rolling(50).mean(),
+        'SMA_200': close.rolling(200).mean(),
+        'ATH': ath,
+        'Drawdown': (close / ath - 1) * 100,
+        'RSI': 100 - (100 / (1 + gain / loss)),
+    }
+
+
+def test_technicals_match_pandas_formulas():
+    close = _prices(1200, gaps=[30, 500])
+    columns = Technicals().run(close.to_numpy())
+
+    for name, expected in _pandas_technicals(close).items():
+        np.testing.assert_allclose(columns[name], expected, rtol=1e-12, atol=1e-9, err_msg=name)
+
+
+def test_tail_technicals_appends_match_fresh_run(monkeypatch):
+    key = 'test-technicals'
+    close = _prices(1500, seed=5)
+    tail_technicals(close.iloc[:1400], key=key)
+
+    fresh = []
+    monkeypatch.setattr(rolling_stats, 'Technicals', lambda: fresh.append(1))
+    resumed = tail_technicals(close, key=key)
+    monkeypatch.undo()
+
+    assert fresh == []
+    for name, expected in tail_technicals(close).items():
+        pd.testing.assert_series_equal(resumed[name], expected, rtol=0, atol=0)
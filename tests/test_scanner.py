@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from quant_core.scanner import run_quant_analysis
+
+
+@pytest.fixture
+def master(synthetic_market):
+    return synthetic_market(1200, seed=20, start='2015-01-01', gaps={'Smallcap_PE': (600, 610)})
+
+
+def _eager_analysis(df):
+    # The in-place column assignments app.py used before the lazy graph
+    df = df.copy()
+    df['Earnings_Yield'] = 100 / df['Nifty_PE']
+    df['Yield_Gap'] = df['Earnings_Yield'] - df['India_10Y']
+    window = 252 * 2
+    df['Mid_Nifty_Ratio'] = df['Midcap_PE'] / df['Nifty_PE']
+    df['Mid_Z'] = (df['Mid_Nifty_Ratio'] - df['Mid_Nifty_Ratio'].rolling(window).mean()) / df['Mid_Nifty_Ratio'].rolling(window).std()
+    df['Small_Nifty_Ratio'] = df['Smallcap_PE'] / df['Nifty_PE']
+    df['Small_Z'] = (df['Small_Nifty_Ratio'] - df['Small_Nifty_Ratio'].rolling(window).mean()) / df['Small_Nifty_Ratio'].rolling(window).std()
+    df['Gold_Nifty'] = df['Gold_Price'] / df['Nifty_Price']
+    df['Risk_MA'] = df['Gold_Nifty'].rolling(200).mean()
+    df['Regime'] = np.where(df['Gold_Nifty'] > df['Risk_MA'], "RISK OFF", "RISK ON")
+    conditions = [
+        (df['Regime'] == "RISK OFF") | (df['VIX'] > 22),
+        (df['Regime'] == "RISK ON") & (df['Mid_Z'] < -1.0)
+    ]
+    df['Signal'] = np.select(conditions, ["🛡️ GOLD / CASH", "🚀 MIDCAPS"], default="🏢 NIFTY 50")
+    return df
+
+
+def test_lazy_view_matches_eager_analysis(master):
+    before = master.copy()
+    view = run_quant_analysis(master)
+    expected = _eager_analysis(master)
+
+    for col in expected.columns.difference(master.columns):
+        if expected[col].dtype == object or pd.api.types.is_string_dtype(expected[col]):
+            assert (view[col].astype(object) == expected[col].astype(object)).all(), col
+        else:
+            np.testing.assert_allclose(view[col], expected[col], rtol=0, atol=1e-9, err_msg=col)
+    pd.testing.assert_frame_equal(master, before)
+
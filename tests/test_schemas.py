@@ -0,0 +1,52 @@
+import os
+
+import pandas as pd
+import pytest
+
+from quant_core.schemas import SCHEMAS, load_frame, schema_for
+
+DATA_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.mark.parametrize('name', sorted(SCHEMAS))
+def test_bundled_file_matches_inferred_parse(name):
+    path = os.path.join(DATA_DIR, name)
+    if not os.path.exists(path):
+        pytest.skip(f"{name} is not bundled")
+    schema = schema_for(path)
+    df = load_frame(path)
+
+    inferred = pd.read_csv(path)
+    inferred[schema['date_col']] = pd.to_datetime(inferred[schema['date_col']])
+    for col, dtype in schema['dtypes'].items():
+        if dtype == 'float64':
+            assert df[col].dtype == 'float64'
+            pd.testing.assert_series_equal(df[col], inferred[col].astype('float64'))
+    pd.testing.assert_series_equal(df[schema['date_col']], inferred[schema['date_col']])
+
+
+def test_only_requested_columns_are_read(tmp_path):
+    path = tmp_path / 'gold_data.csv'
+    path.write_text('Date,Gold,Note\n2024-01-02,2050.5,x\n2024-01-03,2041.0,y\n')
+
+    df = load_frame(str(path))
+    assert list(df.columns) == ['Date', 'Gold']
+    assert df['Date'].tolist() == [pd.Timestamp('2024-01-02'), pd.Timestamp('2024-01-03')]
+
+
+@pytest.mark.parametrize('text', [
+    'Date,Gold\n02-01-2024,2050.5\n',      # date format drifted
+    'Date,Gold\n2024-01-02,"2,050.5"\n',   # thousands separator
+    'Date,Price\n2024-01-02,2050.5\n',     # value column renamed
+])
+def test_drifted_file_fails_loudly(tmp_path, text):
+    path = tmp_path / 'gold_data.csv'
+    path.write_text(text)
+
+    with pytest.raises(ValueError):
+        load_frame(str(path))
+
+
+def test_unregistered_file_is_rejected():
+    with pytest.raises(KeyError):
+        schema_for('/data/unknown.csv')
@@ -0,0 +1,54 @@
+from quant_core.sections import deferred_tabs, render_deferred
+
+
+class Tab:
+    """Stand-in for a Streamlit tab container"""
+
+    def __init__(self, label, log, **state):
+        self.label = label
+        self.log = log
+        self.__dict__.update(state)
+
+    def __enter__(self):
+        self.log.append(('enter', self.label))
+
+    def __exit__(self, *exc):
+        self.log.append(('exit', self.label))
+
+
+def _sections(log, labels):
+    return [lambda *args, label=label: log.append((label, args)) for label in labels]
+
+
+def test_only_the_open_tab_runs():
+    log = []
+    tabs = [Tab('a', log, open=False), Tab('b', log, open=True), Tab('c', log, open=False)]
+    render_deferred(tabs, _sections(log, 'abc'), 'df', 7)
+
+    assert log == [('enter', 'b'), ('b', ('df', 7)), ('exit', 'b')]
+
+
+def test_tabs_without_open_state_render_eagerly():
+    log = []
+    tabs = [Tab('a', log, open=None), Tab('b', log)]
+    render_deferred(tabs, _sections(log, 'ab'))
+
+    assert [entry for entry in log if entry[0] in ('a', 'b')] == [('a', ()), ('b', ())]
+
+
+def test_deferred_tabs_requests_state_tracking():
+    calls = []
+
+    def tabs(labels, key=None, on_change='ignore'):
+        calls.append((labels, key, on_change))
+        return labels
+
+    assert deferred_tabs(tabs, ['x', 'y'], key='main') == ['x', 'y']
+    assert calls == [(['x', 'y'], 'main', 'rerun')]
+
+
+def test_deferred_tabs_falls_back_on_older_streamlit():
+    def tabs(labels):
+        return labels
+
+    assert deferred_tabs(tabs, ['x', 'y'], key='main') == ['x', 'y']
@@ -0,0 +1,120 @@
+import math
+
+import numpy as np
+import pytest
+
+from quant_core.signals import (composite_signals, erp_signals, market_regimes, pe_signals,
+                                signal_columns, vix_signals)
+
+# Scalar rules the vectorized classifiers replaced, kept as the reference
+
+
+def _ref_erp(erp):
+    if math.isnan(erp):
+        return 'NO DATA', 0, '#64748b'
+    for edge, level in [(3, ('VERY CHEAP', 2, '#10b981')), (1.5, ('CHEAP', 1, '#34d399')),
+                        (0, ('FAIR', 0, '#f59e0b')), (-1.5, ('EXPENSIVE', -1, '#f97316'))]:
+        if erp > edge:
+            return level
+    return 'VERY EXPENSIVE', -2, '#ef4444'
+
+
+def _ref_vix(vix):
+    if math.isnan(vix):
+        return 'NO DATA', 0, '#64748b'
+    for edge, level in [(30, ('EXTREME FEAR', 2, '#10b981')), (25, ('HIGH FEAR', 1.5, '#34d399')),
+                        (20, ('FEAR', 1, '#84cc16')), (15, ('ELEVATED', 0.5, '#f59e0b')),
+                        (12, ('NORMAL', 0, '#64748b'))]:
+        if vix > edge:
+            return level
+    return 'COMPLACENCY', -1, '#ef4444'
+
+
+def _ref_pe(pe_pct):
+    if math.isnan(pe_pct):
+        return 'NO DATA', 0
+    for edge, level in [(20, ('VERY CHEAP', 2)), (40, ('CHEAP', 1)), (60, ('FAIR', 0)), (80, ('EXPENSIVE', -1))]:
+        if pe_pct < edge:
+            return level
+    return 'VERY EXPENSIVE', -2
+
+
+def _ref_composite(erp_score, vix_score, pe_score):
+    composite = erp_score * 0.35 + vix_score * 0.35 + pe_score * 0.30
+    for edge, label, style in [(1.5, 'AGGRESSIVE BUY', 'signal-buy'), (0.75, 'BUY', 'signal-buy'),
+                               (0.25, 'ACCUMULATE', 'signal-hold'), (-0.25, 'HOLD', 'signal-hold'),
+                               (-0.75, 'TRIM', 'signal-trim'), (-1.25, 'REDUCE', 'signal-sell')]:
+        if composite >= edge:
+            return label, composite, style
+    return 'SELL', composite, 'signal-sell'
+
+
+def _ref_regime(vix, erp_score, drawdown):
+    vix = 15 if math.isnan(vix) else vix
+    drawdown = 0 if math.isnan(drawdown) else drawdown
+    if erp_score >= 1 and vix > 25 and drawdown < -15:
+        return '🎯 IDEAL BOTTOM', 'regime-bull'
+    if vix > 30 and drawdown < -20:
+        return '📉 CRASH MODE', 'regime-bear'
+    if vix < 15 and drawdown > -5:
+        return '🚀 BULL RUN', 'regime-bull'
+    if vix < 12 and erp_score <= -1:
+        return '⚠️ MARKET TOP', 'regime-bear'
+    if -20 < drawdown < -10:
+        return '📈 RECOVERY', 'regime-neutral'
+    return '↔️ TRANSITIONAL', 'regime-neutral'
+
+
+def _rows(arrays):
+    return list(zip(*[a.tolist() for a in arrays]))
+
+
+# Every bin edge, values just either side of it, extremes and NaN
+ERP = np.array([-9, -1.5, -1.49, -0.01, 0, 0.01, 1.5, 1.51, 3, 3.01, 9, np.nan])
+VIX = np.array([5, 12, 12.01, 15, 15.01, 20, 20.01, 25, 25.01, 30, 30.01, 80, np.nan])
+PE_PCT = np.array([0, 19.99, 20, 39.99, 40, 59.99, 60, 79.99, 80, 100, np.nan])
+DRAWDOWN = np.array([0, -4.99, -5, -10, -10.01, -15.01, -19.99, -20, -20.01, -50, np.nan])
+
+
+@pytest.mark.parametrize('vectorized, reference, values', [
+    (erp_signals, _ref_erp, ERP),
+    (vix_signals, _ref_vix, VIX),
+    (pe_signals, _ref_pe, PE_PCT),
+])
+def test_component_signals_match_scalar_rules(vectorized, reference, values):
+    assert _rows(vectorized(values)) == [reference(v) for v in values]
+
+
+def test_composite_signals_match_scalar_rules():
+    scores = np.array(np.meshgrid([-2, -1, 0, 1, 2], [-1, 0, 0.5, 1, 1.5, 2], [-2, -1, 0, 1, 2])).reshape(3, -1)
+    labels, composite, styles = composite_signals(*scores)
+    expected = [_ref_composite(*s) for s in scores.T]
+
+    assert list(labels) == [e[0] for e in expected]
+    assert list(styles) == [e[2] for e in expected]
+    np.testing.assert_allclose(composite, [e[1] for e in expected], rtol=0, atol=1e-12)
+
+
+def test_market_regimes_match_scalar_rules():
+    grid = np.array(np.meshgrid(VIX, [-2, -1, 0, 1, 2], DRAWDOWN)).reshape(3, -1)
+    assert _rows(market_regimes(*grid)) == [_ref_regime(*row) for row in grid.T]
+
+
+def test_signal_columns_match_row_by_row_rules():
+    rng = np.random.default_rng(0)
+    n = 500
+    erp, vix = rng.uniform(-6, 5, n), rng.uniform(8, 45, n)
+    pe_pct, drawdown = rng.uniform(0, 100, n), rng.uniform(-40, 0, n)
+    erp[::37], vix[::41], pe_pct[::43] = np.nan, np.nan, np.nan
+
+    columns = signal_columns(erp, vix, pe_pct, drawdown)
+
+    for i in range(n):
+        erp_label, erp_score, _ = _ref_erp(erp[i])
+        vix_label, vix_score, _ = _ref_vix(vix[i])
+        pe_label, pe_score = _ref_pe(pe_pct[i])
+        label, composite, _ = _ref_composite(erp_score, vix_score, pe_score)
+        assert (columns['ERP_Signal'][i], columns['VIX_Signal'][i], columns['PE_Signal'][i]) == (erp_label, vix_label, pe_label)
+        assert columns['Composite_Signal'][i] == label
+        assert columns['Composite_Score'][i] == pytest.approx(composite, abs=1e-12)
+        assert columns['Regime'][i] == _ref_regime(vix[i], erp_score, drawdown[i])[0]
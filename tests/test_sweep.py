@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from quant_core import sweep
+from quant_core.strategy import master_codes
+from quant_core.sweep import param_grid, run_sweep, shared_pool, strategy_codes
+
+
+@pytest.fixture
+def master(synthetic_market):
+    return synthetic_market(1500, seed=8, start='2012-01-02', gaps={'Midcap_PE': (300, 305)})
+
+
+def _reference_codes(master, params):
+    ratio = master['Midcap_PE'] / master['Nifty_PE']
+    rolling = ratio.rolling(params['z_window'])
+    mid_z = (ratio - rolling.mean()) / rolling.std()
+    gold_nifty = master['Gold_Price'] / master['Nifty_Price']
+    risk_off = gold_nifty > gold_nifty.rolling(params['risk_ma']).mean()
+    return master_codes(risk_off, master['VIX'], mid_z, params['vix_cut'], params['mid_z_cut'])
+
+
+def test_memoized_codes_match_pandas_rolling(master):
+    grid = param_grid(vix_cut=[18, 22], mid_z_cut=[-1.0, -0.5], risk_ma=[100, 200], z_window=[126, 252])
+    with shared_pool(master, max_workers=0):
+        for params in grid:
+            np.testing.assert_array_equal(strategy_codes(params), _reference_codes(master, params))
+        # Two rolling windows per axis, each computed once for the whole grid
+        assert len(sweep._worker['memo']) == 4
+
+
+def test_parallel_sweep_matches_in_process(master):
+    grid = param_grid(vix_cut=[18, 22, 25], mid_z_cut=[-1.0, -0.5], risk_ma=[100, 200], z_window=[252])
+    serial = run_sweep(master, grid, cost=0.001, max_workers=0)
+    parallel = run_sweep(master, grid, cost=0.001, max_workers=2)
+
+    assert len(serial) == len(grid)
+    assert list(serial.columns[:1]) == ['Rank'] and serial['Sharpe'].is_monotonic_decreasing
+    # Parameter sets with equal Sharpe may rank in either order
+    by_params = lambda results: results.drop(columns='Rank').sort_values(list(grid[0]), ignore_index=True)
+    pd.testing.assert_frame_equal(by_params(parallel), by_params(serial))
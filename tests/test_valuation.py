@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from quant_core.valuation import MIN_HISTORY, ValuationStore, pe_percentile_history, pe_percentiles
+
+
+@pytest.fixture
+def pe_df():
+    rng = np.random.default_rng(11)
+    rows = []
+    for name, months in [('Nifty 50', 60), ('Nifty Midcap 100', 48), ('Nifty Bank', MIN_HISTORY)]:
+        for date in pd.date_range('2019-01-31', periods=months, freq='ME'):
+            rows.append({'Date': date, 'Index': name, 'PE_Ratio': rng.uniform(15, 35),
+                         'PB_Ratio': rng.uniform(2, 5), 'Div_Yield': rng.uniform(0.5, 2)})
+    df = pd.DataFrame(rows)
+    df.loc[[3, 70], 'PE_Ratio'] = np.nan
+    df.loc[10, 'PE_Ratio'] = df.loc[11, 'PE_Ratio']
+    return df
+
+
+def test_pe_percentiles_match_per_index_loop(pe_df):
+    pct = pe_percentiles(pe_df)
+
+    for i, row in pe_df.iterrows():
+        history = pe_df.loc[pe_df['Index'] == row['Index'], 'PE_Ratio']
+        if len(history) > MIN_HISTORY:
+            assert pct[i] == pytest.approx((history < row['PE_Ratio']).mean() * 100)
+        else:
+            assert np.isnan(pct[i])
+
+
+@pytest.mark.parametrize('window', [None, 12])
+def test_pe_percentile_history_matches_per_row_loop(pe_df, window):
+    shuffled = pe_df.sample(frac=1, random_state=3)
+    pct = pe_percentile_history(shuffled, window)
+
+    for i, row in shuffled.iterrows():
+        same = shuffled[shuffled['Index'] == row['Index']].sort_values('Date')
+        history_to_date = same.loc[same['Date'] <= row['Date'], 'PE_Ratio']
+        if window is not None:
+            history_to_date = history_to_date.iloc[-window:]
+        if len(history_to_date) > MIN_HISTORY:
+            assert pct[i] == pytest.approx((history_to_date < row['PE_Ratio']).mean() * 100)
+        else:
+            assert np.isnan(pct[i])
+    assert pct.index.equals(shuffled.index)
+
+
+def test_month_end_frame_has_one_row_per_month():
+    # Nifty closes January on the 31st, Smallcap on the 30th; Bank only trades in February
+    pe_df = pd.DataFrame({
+        'Date': pd.to_datetime(['2024-01-31', '2024-01-30', '2024-02-29', '2024-02-29', '2024-02-15']),
+        'Index': ['Nifty 50', 'Nifty Smallcap 100', 'Nifty 50', 'Nifty Smallcap 100', 'Nifty Bank'],
+        'PE_Ratio': [22.0, 25.0, 23.0, 26.0, 15.0],
+        'PB_Ratio': [3.0, 3.5, 3.1, 3.6, 2.0],
+        'Div_Yield': [1.2, 0.8, 1.1, 0.7, 1.0],
+    })
+    store = ValuationStore(pe_df)
+
+    frame = store.frame({'Nifty50_PE': ('Nifty 50', 'PE_Ratio'),
+                         'Smallcap_PE': ('Nifty Smallcap 100', 'PE_Ratio'),
+                         'Missing_PE': ('Nifty IT', 'PE_Ratio')}, month_end=True)
+
+    assert list(frame['Date']) == list(pd.to_datetime(['2024-01-31', '2024-02-29']))
+    assert list(frame['Nifty50_PE']) == [22.0, 23.0]
+    assert list(frame['Smallcap_PE']) == [25.0, 26.0]
+    assert frame['Missing_PE'].isna().all()
+
+
+def test_frame_skips_dates_without_requested_values():
+    pe_df = pd.DataFrame({
+        'Date': pd.to_datetime(['2024-01-30', '2024-01-31']),
+        'Index': ['Nifty Bank', 'Nifty 50'],
+        'PE_Ratio': [15.0, 22.0], 'PB_Ratio': [2.0, 3.0], 'Div_Yield': [1.0, 1.2],
+    })
+    frame = ValuationStore(pe_df).frame({'Nifty50_PE': ('Nifty 50', 'PE_Ratio')})
+
+    assert list(frame['Date']) == [pd.Timestamp('2024-01-31')]
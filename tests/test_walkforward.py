@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from quant_core.backtest import asset_returns, backtest_codes, summary_stats
+from quant_core.strategy import SIGNAL_ASSETS
+from quant_core.sweep import param_grid, shared_pool, strategy_codes
+from quant_core.walkforward import make_folds, walk_forward
+
+
+@pytest.fixture
+def master(synthetic_market):
+    return synthetic_market(1400, seed=10)
+
+
+@pytest.mark.parametrize('anchored', [False, True])
+def test_test_windows_tile_the_history(anchored):
+    folds = make_folds(1000, train=300, test=250, anchored=anchored)
+
+    assert [(f[2], f[3]) for f in folds] == [(300, 550), (550, 800), (800, 1000)]
+    for train_start, train_end, test_start, _ in folds:
+        assert train_end == test_start
+        assert train_start == (0 if anchored else test_start - 300)
+
+
+def test_single_parameter_set_equals_one_continuous_backtest(master):
+    params = {'vix_cut': 20, 'risk_ma': 100, 'z_window': 126}
+    equity, folds, _ = walk_forward(master, [params], train=400, test=200, cost=0.001, max_workers=0)
+
+    with shared_pool(master, max_workers=0):
+        codes = strategy_codes(params)
+    returns = asset_returns(master[list(SIGNAL_ASSETS.values())])
+    _, strat_ret = backtest_codes(codes, returns, lag=1, cost=0.001)
+
+    # Same trades across fold boundaries; only the entry bar differs (it starts flat)
+    np.testing.assert_allclose(equity.pct_change().to_numpy()[2:], strat_ret[402:], rtol=0, atol=1e-12)
+    assert len(folds) == 5
+
+
+def test_each_fold_picks_its_best_in_sample_parameters(master):
+    grid = param_grid(vix_cut=[18, 24], mid_z_cut=[-1.0, 0.0], risk_ma=[100, 200], z_window=[126])
+    _, folds, _ = walk_forward(master, grid, train=400, test=300, max_workers=0)
+
+    with shared_pool(master, max_workers=0):
+        codes = [strategy_codes(p) for p in grid]
+    returns = asset_returns(master[list(SIGNAL_ASSETS.values())])
+    for (train_start, train_end, _, _), (_, row) in zip(make_folds(len(master), 400, 300), folds.iterrows()):
+        sharpes = [summary_stats(backtest_codes(c[train_start:train_end], returns[train_start:train_end])[1])['Sharpe']
+                   for c in codes]
+        assert row['IS_Sharpe'] == pytest.approx(max(sharpes), rel=1e-9)
+
+
+def test_parallel_folds_match_in_process(master):
+    grid = param_grid(vix_cut=[18, 24], mid_z_cut=[-1.0, 0.0], risk_ma=[100], z_window=[126, 252])
+    serial = walk_forward(master, grid, train=400, test=300, cost=0.001, max_workers=0)
+    parallel = walk_forward(master, grid, train=400, test=300, cost=0.001, max_workers=2)
+
+    pd.testing.assert_series_equal(parallel[0], serial[0])
+    pd.testing.assert_frame_equal(parallel[1], serial[1])
+    assert parallel[2] == serial[2]